@@ -0,0 +1,64 @@
+"""Running account balances
+
+Revision ID: 7c1e4a9d2b30
+Revises: 245b5191f725
+Create Date: 2026-10-19 10:12:41.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '7c1e4a9d2b30'
+down_revision: Union[str, None] = '245b5191f725'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+account_type = postgresql.ENUM(
+    'BANK_CAPITAL', 'BORROWER', 'RECOVERY', 'PROVISIONING', name='accounttype', create_type=False
+)
+
+
+def upgrade() -> None:
+    op.create_table('account_balances',
+    sa.Column('account_type', account_type, nullable=False),
+    sa.Column('debit_total', sa.Numeric(precision=18, scale=2), nullable=False),
+    sa.Column('credit_total', sa.Numeric(precision=18, scale=2), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('account_type')
+    )
+    op.create_table('loan_account_balances',
+    sa.Column('loan_id', sa.UUID(), nullable=False),
+    sa.Column('account_type', account_type, nullable=False),
+    sa.Column('debit_total', sa.Numeric(precision=18, scale=2), nullable=False),
+    sa.Column('credit_total', sa.Numeric(precision=18, scale=2), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['loan_id'], ['loans.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('loan_id', 'account_type')
+    )
+
+    # Backfill running totals from the existing journal
+    op.execute("""
+        INSERT INTO account_balances (account_type, debit_total, credit_total)
+        SELECT account_type,
+               COALESCE(SUM(amount) FILTER (WHERE entry_type = 'DEBIT'), 0),
+               COALESCE(SUM(amount) FILTER (WHERE entry_type = 'CREDIT'), 0)
+        FROM ledger_entries
+        GROUP BY account_type
+    """)
+    op.execute("""
+        INSERT INTO loan_account_balances (loan_id, account_type, debit_total, credit_total)
+        SELECT loan_id, account_type,
+               COALESCE(SUM(amount) FILTER (WHERE entry_type = 'DEBIT'), 0),
+               COALESCE(SUM(amount) FILTER (WHERE entry_type = 'CREDIT'), 0)
+        FROM ledger_entries
+        GROUP BY loan_id, account_type
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table('loan_account_balances')
+    op.drop_table('account_balances')
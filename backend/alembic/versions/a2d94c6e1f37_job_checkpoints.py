@@ -0,0 +1,31 @@
+"""Job checkpoints
+
+Revision ID: a2d94c6e1f37
+Revises: f3c7a1e8d052
+Create Date: 2026-10-19 18:05:41.337120
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'a2d94c6e1f37'
+down_revision: Union[str, None] = 'f3c7a1e8d052'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('job_checkpoints',
+    sa.Column('job_id', sa.String(length=100), nullable=False),
+    sa.Column('state', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('job_id')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('job_checkpoints')
@@ -0,0 +1,50 @@
+"""Daily delinquency (DPD) snapshots
+
+Revision ID: a5c3e9f17d26
+Revises: f2a6d83c1b04
+Create Date: 2026-10-19 15:02:47.318264
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'a5c3e9f17d26'
+down_revision: Union[str, None] = 'f2a6d83c1b04'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+dpd_bucket = postgresql.ENUM(
+    'CURRENT', 'DPD_1_30', 'DPD_31_60', 'DPD_61_90', 'DPD_90_PLUS', name='dpdbucket', create_type=False
+)
+
+
+def upgrade() -> None:
+    dpd_bucket.create(op.get_bind(), checkfirst=True)
+    op.create_table('delinquency_snapshots',
+    sa.Column('snapshot_date', sa.Date(), nullable=False),
+    sa.Column('loan_id', sa.UUID(), nullable=False),
+    sa.Column('dpd', sa.Integer(), nullable=False),
+    sa.Column('bucket', dpd_bucket, nullable=False),
+    sa.Column('overdue_amount', sa.Numeric(precision=15, scale=2), nullable=False),
+    sa.Column('overdue_emis', sa.Integer(), nullable=False),
+    sa.Column('oldest_due_date', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.ForeignKeyConstraint(['loan_id'], ['loans.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('snapshot_date', 'loan_id')
+    )
+    op.create_index('ix_delinquency_snapshots_date_bucket', 'delinquency_snapshots', ['snapshot_date', 'bucket'], unique=False)
+    op.create_index(
+        'ix_emis_unpaid_due_date', 'emis', ['due_date', 'loan_id'], unique=False,
+        postgresql_where=sa.text("status != 'PAID'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_emis_unpaid_due_date', table_name='emis')
+    op.drop_index('ix_delinquency_snapshots_date_bucket', table_name='delinquency_snapshots')
+    op.drop_table('delinquency_snapshots')
+    dpd_bucket.drop(op.get_bind(), checkfirst=True)
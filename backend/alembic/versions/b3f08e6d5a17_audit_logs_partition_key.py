@@ -0,0 +1,31 @@
+"""Audit log primary key includes timestamp
+
+Revision ID: b3f08e6d5a17
+Revises: 7c1e4a9d2b30
+Create Date: 2026-10-19 11:02:17.904512
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3f08e6d5a17'
+down_revision: Union[str, None] = '7c1e4a9d2b30'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Postgres requires the partition key in every unique constraint,
+    # so (id, timestamp) replaces id as the primary key.
+    op.drop_constraint('audit_logs_pkey', 'audit_logs', type_='primary')
+    op.create_primary_key('audit_logs_pkey', 'audit_logs', ['id', 'timestamp'])
+    op.create_index(op.f('ix_audit_logs_timestamp'), 'audit_logs', ['timestamp'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_audit_logs_timestamp'), table_name='audit_logs')
+    op.drop_constraint('audit_logs_pkey', 'audit_logs', type_='primary')
+    op.create_primary_key('audit_logs_pkey', 'audit_logs', ['id'])
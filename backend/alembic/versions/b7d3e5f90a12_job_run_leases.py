@@ -0,0 +1,39 @@
+"""Job run leases and per-fire-time dedupe
+
+Revision ID: b7d3e5f90a12
+Revises: c6f1b82d9e40
+Create Date: 2026-10-19 19:02:17.518204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d3e5f90a12'
+down_revision: Union[str, None] = 'c6f1b82d9e40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('job_runs', sa.Column('scheduled_for', sa.DateTime(timezone=True), nullable=True))
+    op.add_column('job_runs', sa.Column('lease_expires_at', sa.DateTime(timezone=True), nullable=True))
+    # Runs left RUNNING under the advisory-lock runner have no lease to renew
+    op.execute(
+        "UPDATE job_runs SET status = 'FAILED', finished_at = now(), error = 'Interrupted before lease tracking' "
+        "WHERE status = 'RUNNING'"
+    )
+    op.create_unique_constraint('uq_job_runs_job_id_scheduled_for', 'job_runs', ['job_id', 'scheduled_for'])
+    op.create_index(
+        'ux_job_runs_running', 'job_runs', ['job_id'], unique=True,
+        postgresql_where=sa.text("status = 'RUNNING'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ux_job_runs_running', table_name='job_runs', postgresql_where=sa.text("status = 'RUNNING'"))
+    op.drop_constraint('uq_job_runs_job_id_scheduled_for', 'job_runs', type_='unique')
+    op.drop_column('job_runs', 'lease_expires_at')
+    op.drop_column('job_runs', 'scheduled_for')
@@ -0,0 +1,151 @@
+"""Content-addressed payload blobs for gov_cache and verification snapshots
+
+Revision ID: c6f1b82d9e40
+Revises: a2d94c6e1f37
+Create Date: 2026-10-19 18:31:12.904415
+
+Moves gov_cache.response_json and business_profiles.verification_snapshot
+payloads into payload_blobs (SHA-256 of canonical JSON → zlib), leaving a hash
+on gov_cache and a section → hash manifest on business_profiles. The shared
+bearer token row stays inline. Encoding must match app.core.payload_store.
+"""
+import hashlib
+import json
+import zlib
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'c6f1b82d9e40'
+down_revision: Union[str, None] = 'a2d94c6e1f37'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH = 1000
+TOKEN_KEY = 'gov_token'
+
+
+def _canonical(payload) -> bytes:
+    return json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str).encode()
+
+
+def _store(bind, payloads: list) -> list[str]:
+    rows, hashes = {}, []
+    for payload in payloads:
+        raw = _canonical(payload)
+        digest = hashlib.sha256(raw).hexdigest()
+        hashes.append(digest)
+        rows.setdefault(digest, {"hash": digest, "data": zlib.compress(raw), "size": len(raw)})
+    if rows:
+        bind.execute(
+            sa.text("INSERT INTO payload_blobs (hash, data, size) VALUES (:hash, :data, :size) "
+                    "ON CONFLICT (hash) DO NOTHING"),
+            list(rows.values()),
+        )
+    return hashes
+
+
+def _load(bind, hashes: set) -> dict:
+    if not hashes:
+        return {}
+    result = bind.execute(
+        sa.text("SELECT hash, data FROM payload_blobs WHERE hash = ANY(:hashes)"), {"hashes": list(hashes)}
+    )
+    return {digest: json.loads(zlib.decompress(data)) for digest, data in result}
+
+
+def _backfill_gov_cache(bind) -> None:
+    last = ''
+    while True:
+        rows = bind.execute(sa.text(
+            "SELECT cache_key, response_json FROM gov_cache "
+            "WHERE cache_key > :last AND payload_hash IS NULL AND response_json IS NOT NULL "
+            "AND cache_key <> :token ORDER BY cache_key LIMIT :batch"
+        ), {"last": last, "token": TOKEN_KEY, "batch": BATCH}).all()
+        if not rows:
+            return
+        hashes = _store(bind, [row.response_json for row in rows])
+        bind.execute(
+            sa.text("UPDATE gov_cache SET payload_hash = :hash, response_json = NULL WHERE cache_key = :key"),
+            [{"hash": digest, "key": row.cache_key} for row, digest in zip(rows, hashes)],
+        )
+        last = rows[-1].cache_key
+
+
+def _backfill_snapshots(bind) -> None:
+    last = None
+    while True:
+        rows = bind.execute(sa.text(
+            "SELECT id, verification_snapshot FROM business_profiles "
+            "WHERE (CAST(:last AS uuid) IS NULL OR id > CAST(:last AS uuid)) "
+            "AND snapshot_manifest IS NULL AND verification_snapshot IS NOT NULL "
+            "ORDER BY id LIMIT :batch"
+        ), {"last": last, "batch": BATCH}).all()
+        if not rows:
+            return
+        sections = [
+            (row.id, name, payload)
+            for row in rows if isinstance(row.verification_snapshot, dict)
+            for name, payload in row.verification_snapshot.items() if isinstance(payload, dict)
+        ]
+        manifests = {row.id: {} for row in rows}
+        for (business_id, name, _), digest in zip(sections, _store(bind, [p for _, _, p in sections])):
+            manifests[business_id][name] = digest
+        bind.execute(
+            sa.text("UPDATE business_profiles SET snapshot_manifest = CAST(:manifest AS jsonb), "
+                    "verification_snapshot = NULL WHERE id = :id"),
+            [{"manifest": json.dumps(manifest), "id": business_id} for business_id, manifest in manifests.items()],
+        )
+        last = str(rows[-1].id)
+
+
+def upgrade() -> None:
+    op.create_table('payload_blobs',
+    sa.Column('hash', sa.String(length=64), nullable=False),
+    sa.Column('data', sa.LargeBinary(), nullable=False),
+    sa.Column('size', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('hash')
+    )
+    op.add_column('gov_cache', sa.Column('payload_hash', sa.String(length=64), nullable=True))
+    op.create_foreign_key('gov_cache_payload_hash_fkey', 'gov_cache', 'payload_blobs', ['payload_hash'], ['hash'])
+    op.alter_column('gov_cache', 'response_json', existing_type=postgresql.JSONB(astext_type=sa.Text()), nullable=True)
+    op.add_column('business_profiles', sa.Column('snapshot_manifest', postgresql.JSONB(astext_type=sa.Text()), nullable=True))
+    op.add_column('business_profiles', sa.Column('reverified_at', sa.DateTime(timezone=True), nullable=True))
+
+    bind = op.get_bind()
+    _backfill_gov_cache(bind)
+    _backfill_snapshots(bind)
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    rows = bind.execute(sa.text("SELECT cache_key, payload_hash FROM gov_cache WHERE payload_hash IS NOT NULL")).all()
+    payloads = _load(bind, {row.payload_hash for row in rows})
+    if rows:
+        bind.execute(
+            sa.text("UPDATE gov_cache SET response_json = CAST(:payload AS jsonb) WHERE cache_key = :key"),
+            [{"payload": json.dumps(payloads.get(row.payload_hash)), "key": row.cache_key} for row in rows],
+        )
+    rows = bind.execute(sa.text(
+        "SELECT id, snapshot_manifest FROM business_profiles WHERE snapshot_manifest IS NOT NULL"
+    )).all()
+    payloads = _load(bind, {digest for row in rows for digest in row.snapshot_manifest.values()})
+    if rows:
+        bind.execute(
+            sa.text("UPDATE business_profiles SET verification_snapshot = CAST(:snapshot AS json) WHERE id = :id"),
+            [
+                {"snapshot": json.dumps({name: payloads.get(d) for name, d in row.snapshot_manifest.items()}), "id": row.id}
+                for row in rows
+            ],
+        )
+
+    op.drop_column('business_profiles', 'reverified_at')
+    op.drop_column('business_profiles', 'snapshot_manifest')
+    op.alter_column('gov_cache', 'response_json', existing_type=postgresql.JSONB(astext_type=sa.Text()), nullable=False)
+    op.drop_constraint('gov_cache_payload_hash_fkey', 'gov_cache', type_='foreignkey')
+    op.drop_column('gov_cache', 'payload_hash')
+    op.drop_table('payload_blobs')
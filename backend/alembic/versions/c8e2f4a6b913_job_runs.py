@@ -0,0 +1,39 @@
+"""Job run history
+
+Revision ID: c8e2f4a6b913
+Revises: a5c3e9f17d26
+Create Date: 2026-10-19 15:41:09.204517
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'c8e2f4a6b913'
+down_revision: Union[str, None] = 'a5c3e9f17d26'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('job_runs',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('job_id', sa.String(length=100), nullable=False),
+    sa.Column('status', sa.Enum('RUNNING', 'SUCCEEDED', 'FAILED', name='jobrunstatus'), nullable=False),
+    sa.Column('host', sa.String(length=255), nullable=True),
+    sa.Column('started_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('duration_ms', sa.Integer(), nullable=True),
+    sa.Column('rows_processed', sa.Integer(), nullable=True),
+    sa.Column('error', sa.Text(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_job_runs_job_id_started_at', 'job_runs', ['job_id', 'started_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_job_runs_job_id_started_at', table_name='job_runs')
+    op.drop_table('job_runs')
+    sa.Enum(name='jobrunstatus').drop(op.get_bind(), checkfirst=True)
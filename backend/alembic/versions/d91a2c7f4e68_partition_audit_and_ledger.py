@@ -0,0 +1,131 @@
+"""Monthly range partitioning for audit_logs and ledger_entries
+
+Revision ID: d91a2c7f4e68
+Revises: b3f08e6d5a17
+Create Date: 2026-10-19 12:24:03.551870
+
+"""
+from datetime import date, datetime, timezone
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'd91a2c7f4e68'
+down_revision: Union[str, None] = 'b3f08e6d5a17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+MONTHS_AHEAD = 3
+
+entry_type = postgresql.ENUM('DEBIT', 'CREDIT', name='entrytype', create_type=False)
+account_type = postgresql.ENUM(
+    'BANK_CAPITAL', 'BORROWER', 'RECOVERY', 'PROVISIONING', name='accounttype', create_type=False
+)
+
+
+def _add_months(d: date, months: int) -> date:
+    index = d.year * 12 + (d.month - 1) + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _create_partitions(table: str, legacy: str) -> None:
+    """Partitions for every month holding legacy rows, through MONTHS_AHEAD, plus DEFAULT."""
+    bind = op.get_bind()
+    oldest = bind.execute(sa.text(f"SELECT min(timestamp) FROM {legacy}")).scalar()
+    this_month = datetime.now(timezone.utc).date().replace(day=1)
+    month = oldest.date().replace(day=1) if oldest else this_month
+    last = _add_months(this_month, MONTHS_AHEAD)
+    while month <= last:
+        end = _add_months(month, 1)
+        op.execute(
+            f"CREATE TABLE {table}_y{month.year:04d}m{month.month:02d} PARTITION OF {table} "
+            f"FOR VALUES FROM ('{month.isoformat()} 00:00:00+00') TO ('{end.isoformat()} 00:00:00+00')"
+        )
+        month = end
+    op.execute(f"CREATE TABLE {table}_default PARTITION OF {table} DEFAULT")
+
+
+def upgrade() -> None:
+    # ── audit_logs ──
+    op.rename_table('audit_logs', 'audit_logs_legacy')
+    op.execute("ALTER TABLE audit_logs_legacy RENAME CONSTRAINT audit_logs_pkey TO audit_logs_legacy_pkey")
+    op.execute("ALTER INDEX ix_audit_logs_timestamp RENAME TO ix_audit_logs_legacy_timestamp")
+    op.create_table('audit_logs',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('actor_id', sa.UUID(), nullable=True),
+    sa.Column('action', sa.String(length=200), nullable=False),
+    sa.Column('entity_type', sa.String(length=100), nullable=False),
+    sa.Column('entity_id', sa.String(length=100), nullable=True),
+    sa.Column('old_value', sa.Text(), nullable=True),
+    sa.Column('new_value', sa.Text(), nullable=True),
+    sa.Column('timestamp', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['actor_id'], ['users.id'], ondelete='SET NULL'),
+    sa.PrimaryKeyConstraint('id', 'timestamp'),
+    postgresql_partition_by='RANGE (timestamp)',
+    )
+    op.create_index(op.f('ix_audit_logs_timestamp'), 'audit_logs', ['timestamp'], unique=False)
+    _create_partitions('audit_logs', 'audit_logs_legacy')
+    op.execute("INSERT INTO audit_logs SELECT id, actor_id, action, entity_type, entity_id, old_value, new_value, timestamp FROM audit_logs_legacy")
+    op.drop_table('audit_logs_legacy')
+
+    # ── ledger_entries ──
+    op.rename_table('ledger_entries', 'ledger_entries_legacy')
+    op.execute("ALTER TABLE ledger_entries_legacy RENAME CONSTRAINT ledger_entries_pkey TO ledger_entries_legacy_pkey")
+    op.create_table('ledger_entries',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('loan_id', sa.UUID(), nullable=False),
+    sa.Column('entry_type', entry_type, nullable=False),
+    sa.Column('account_type', account_type, nullable=False),
+    sa.Column('amount', sa.Numeric(precision=15, scale=2), nullable=False),
+    sa.Column('description', sa.String(length=500), nullable=True),
+    sa.Column('timestamp', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['loan_id'], ['loans.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id', 'timestamp'),
+    postgresql_partition_by='RANGE (timestamp)',
+    )
+    op.create_index(op.f('ix_ledger_entries_loan_id'), 'ledger_entries', ['loan_id'], unique=False)
+    op.create_index(op.f('ix_ledger_entries_timestamp'), 'ledger_entries', ['timestamp'], unique=False)
+    _create_partitions('ledger_entries', 'ledger_entries_legacy')
+    op.execute("INSERT INTO ledger_entries SELECT id, loan_id, entry_type, account_type, amount, description, timestamp FROM ledger_entries_legacy")
+    op.drop_table('ledger_entries_legacy')
+
+
+def downgrade() -> None:
+    # Rebuild plain tables from the attached partitions; archived partitions are not copied back
+    op.rename_table('ledger_entries', 'ledger_entries_partitioned')
+    op.create_table('ledger_entries',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('loan_id', sa.UUID(), nullable=False),
+    sa.Column('entry_type', entry_type, nullable=False),
+    sa.Column('account_type', account_type, nullable=False),
+    sa.Column('amount', sa.Numeric(precision=15, scale=2), nullable=False),
+    sa.Column('description', sa.String(length=500), nullable=True),
+    sa.Column('timestamp', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['loan_id'], ['loans.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id', name='ledger_entries_plain_pkey'),
+    )
+    op.execute("INSERT INTO ledger_entries SELECT id, loan_id, entry_type, account_type, amount, description, timestamp FROM ledger_entries_partitioned")
+    op.drop_table('ledger_entries_partitioned')
+    op.execute("ALTER TABLE ledger_entries RENAME CONSTRAINT ledger_entries_plain_pkey TO ledger_entries_pkey")
+
+    op.rename_table('audit_logs', 'audit_logs_partitioned')
+    op.execute("ALTER INDEX ix_audit_logs_timestamp RENAME TO ix_audit_logs_partitioned_timestamp")
+    op.create_table('audit_logs',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('actor_id', sa.UUID(), nullable=True),
+    sa.Column('action', sa.String(length=200), nullable=False),
+    sa.Column('entity_type', sa.String(length=100), nullable=False),
+    sa.Column('entity_id', sa.String(length=100), nullable=True),
+    sa.Column('old_value', sa.Text(), nullable=True),
+    sa.Column('new_value', sa.Text(), nullable=True),
+    sa.Column('timestamp', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['actor_id'], ['users.id'], ondelete='SET NULL'),
+    sa.PrimaryKeyConstraint('id', 'timestamp', name='audit_logs_plain_pkey'),
+    )
+    op.execute("INSERT INTO audit_logs SELECT id, actor_id, action, entity_type, entity_id, old_value, new_value, timestamp FROM audit_logs_partitioned")
+    op.drop_table('audit_logs_partitioned')
+    op.execute("ALTER TABLE audit_logs RENAME CONSTRAINT audit_logs_plain_pkey TO audit_logs_pkey")
+    op.create_index(op.f('ix_audit_logs_timestamp'), 'audit_logs', ['timestamp'], unique=False)
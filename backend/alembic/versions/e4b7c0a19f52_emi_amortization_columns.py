@@ -0,0 +1,31 @@
+"""EMI amortization breakdown columns
+
+Revision ID: e4b7c0a19f52
+Revises: d91a2c7f4e68
+Create Date: 2026-10-19 13:40:55.208317
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4b7c0a19f52'
+down_revision: Union[str, None] = 'd91a2c7f4e68'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('emis', sa.Column('installment_number', sa.Integer(), nullable=True))
+    op.add_column('emis', sa.Column('principal_component', sa.Numeric(precision=15, scale=2), nullable=True))
+    op.add_column('emis', sa.Column('interest_component', sa.Numeric(precision=15, scale=2), nullable=True))
+    op.add_column('emis', sa.Column('outstanding_balance', sa.Numeric(precision=15, scale=2), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('emis', 'outstanding_balance')
+    op.drop_column('emis', 'interest_component')
+    op.drop_column('emis', 'principal_component')
+    op.drop_column('emis', 'installment_number')
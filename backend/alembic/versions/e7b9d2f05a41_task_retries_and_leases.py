@@ -0,0 +1,45 @@
+"""Task retries, dedup keys and visibility timeouts
+
+Revision ID: e7b9d2f05a41
+Revises: d4f1a8c27e35
+Create Date: 2026-10-19 16:58:13.640297
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7b9d2f05a41'
+down_revision: Union[str, None] = 'd4f1a8c27e35'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('tasks', sa.Column('dedup_key', sa.String(length=200), nullable=True))
+    op.add_column('tasks', sa.Column('attempts', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('tasks', sa.Column('max_attempts', sa.Integer(), server_default='5', nullable=False))
+    op.add_column('tasks', sa.Column('run_after', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False))
+    op.add_column('tasks', sa.Column('locked_until', sa.DateTime(timezone=True), nullable=True))
+    op.alter_column('tasks', 'error', new_column_name='last_error')
+    op.execute("UPDATE tasks SET run_after = created_at")
+    op.drop_index('ix_tasks_status_created_at', table_name='tasks')
+    op.create_index('ix_tasks_status_run_after', 'tasks', ['status', 'run_after'], unique=False)
+    op.create_index(
+        'uq_tasks_dedup_key_live', 'tasks', ['dedup_key'], unique=True,
+        postgresql_where=sa.text("status IN ('PENDING', 'RUNNING')"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('uq_tasks_dedup_key_live', table_name='tasks')
+    op.drop_index('ix_tasks_status_run_after', table_name='tasks')
+    op.create_index('ix_tasks_status_created_at', 'tasks', ['status', 'created_at'], unique=False)
+    op.alter_column('tasks', 'last_error', new_column_name='error')
+    op.drop_column('tasks', 'locked_until')
+    op.drop_column('tasks', 'run_after')
+    op.drop_column('tasks', 'max_attempts')
+    op.drop_column('tasks', 'attempts')
+    op.drop_column('tasks', 'dedup_key')
@@ -0,0 +1,24 @@
+"""Index emis on (loan_id, status)
+
+Revision ID: f2a6d83c1b04
+Revises: e4b7c0a19f52
+Create Date: 2026-10-19 14:18:32.770146
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2a6d83c1b04'
+down_revision: Union[str, None] = 'e4b7c0a19f52'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_emis_loan_id_status', 'emis', ['loan_id', 'status'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_emis_loan_id_status', table_name='emis')
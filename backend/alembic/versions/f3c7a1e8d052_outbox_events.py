@@ -0,0 +1,49 @@
+"""Outbox events and consumer offsets
+
+Revision ID: f3c7a1e8d052
+Revises: e7b9d2f05a41
+Create Date: 2026-10-19 17:42:06.218934
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3c7a1e8d052'
+down_revision: Union[str, None] = 'e7b9d2f05a41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('outbox_events',
+    sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False),
+    sa.Column('txid', sa.BigInteger(), server_default=sa.text('txid_current()'), nullable=False),
+    sa.Column('event_type', sa.Enum(
+        'OFFER_GENERATED', 'LOAN_DISBURSED', 'EMI_PAID', 'EMI_BOUNCED', 'LOAN_CLOSED',
+        'LOAN_DEFAULTED', 'RECOVERY_INITIATED', 'RECOVERY_COMPLETED', name='loaneventtype',
+    ), nullable=False),
+    sa.Column('aggregate_type', sa.String(length=50), nullable=False),
+    sa.Column('aggregate_id', sa.UUID(), nullable=False),
+    sa.Column('payload', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_outbox_events_txid_id', 'outbox_events', ['txid', 'id'], unique=False)
+    op.create_table('outbox_consumer_offsets',
+    sa.Column('consumer', sa.String(length=100), nullable=False),
+    sa.Column('last_txid', sa.BigInteger(), server_default='0', nullable=False),
+    sa.Column('last_id', sa.BigInteger(), server_default='0', nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.PrimaryKeyConstraint('consumer')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('outbox_consumer_offsets')
+    op.drop_index('ix_outbox_events_txid_id', table_name='outbox_events')
+    op.drop_table('outbox_events')
+    sa.Enum(name='loaneventtype').drop(op.get_bind(), checkfirst=True)
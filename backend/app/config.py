@@ -20,6 +20,36 @@ class Settings(BaseSettings):
     GOV_API_TIMEOUT: int = 10
     GOV_CACHE_TTL_SECONDS: int = 3600
 
+    # Government API calls — per-attempt timeout is p99 × multiplier, clamped to
+    # [GOV_API_TIMEOUT_MIN, GOV_API_TIMEOUT]; GETs are hedged after p95 (ratio 0 disables).
+    # Each HTTP request gets GOV_API_REQUEST_BUDGET_SECONDS for all its government calls.
+    GOV_API_TIMEOUT_MIN: float = 1.0
+    GOV_API_TIMEOUT_MULTIPLIER: float = 3.0
+    GOV_API_LATENCY_WINDOW: int = 200
+    GOV_API_LATENCY_MIN_SAMPLES: int = 20
+    GOV_API_HEDGE_MAX_RATIO: float = 0.1
+    GOV_API_MAX_ATTEMPTS: int = 3
+    GOV_API_RETRY_BASE_SECONDS: float = 0.2
+    GOV_API_RETRY_MAX_SECONDS: float = 2.0
+    GOV_API_REQUEST_BUDGET_SECONDS: float = 15.0
+    GOV_API_MAX_CONNECTIONS: int = 50
+    GOV_API_BULK_CONCURRENCY: int = 10
+
+    # Circuit breaker per government endpoint; while it is open, lookups may serve
+    # GovCache entries up to GOV_CACHE_STALE_SECONDS past expiry
+    GOV_API_BREAKER_FAILURE_THRESHOLD: int = 5
+    GOV_API_BREAKER_RESET_SECONDS: float = 30.0
+    GOV_CACHE_STALE_SECONDS: int = 604800
+
+    # Government API token — refreshed in the background ahead of expiry; GOV_API_TOKEN_SHARED
+    # keeps one token for all processes in gov_cache (refresh under an advisory lock)
+    GOV_API_TOKEN_REFRESH_IN_BACKGROUND: bool = True
+    GOV_API_TOKEN_REFRESH_AHEAD_SECONDS: int = 120
+    GOV_API_TOKEN_SHARED: bool = False
+
+    # WhatsApp (OTP delivery)
+    WHATSAPP_API_URL: str = "https://automatexindia.com/api/v1/whatsapp/send/template"
+
     # Credit Scoring Weights
     EXTERNAL_SCORE_WEIGHT: float = 0.6
     INTERNAL_SCORE_WEIGHT: float = 0.4
@@ -33,6 +63,53 @@ class Settings(BaseSettings):
     RATE_LIMIT_REQUESTS: int = 10
     RATE_LIMIT_WINDOW_SECONDS: int = 60
 
+    # Batch operations
+    LOAN_BATCH_CHUNK_SIZE: int = 200
+    LOAN_BATCH_MAX_OFFERS: int = 5000
+    SETTLEMENT_BATCH_SIZE: int = 500
+
+    # KYC re-verification job — businesses per chunk (one commit and checkpoint each)
+    KYC_REVERIFY_CHUNK_SIZE: int = 200
+
+    # Audit
+    AUDIT_WRITE_BEHIND_ENABLED: bool = False
+    AUDIT_WRITE_BEHIND_BATCH_SIZE: int = 500
+    AUDIT_WRITE_BEHIND_FLUSH_SECONDS: float = 2.0
+
+    # Partitioning (audit_logs, ledger_entries) — retention 0 keeps all partitions attached.
+    # Ledger retention stays 0 unless balance verification is pointed at the archive too.
+    PARTITION_MONTHS_AHEAD: int = 3
+    PARTITION_ARCHIVE_SCHEMA: str = "archive"
+    AUDIT_LOG_RETENTION_MONTHS: int = 24
+    LEDGER_ENTRY_RETENTION_MONTHS: int = 0
+
+    # Background work — set SCHEDULER_ENABLED=false on the API when `python -m app.worker` runs
+    SCHEDULER_ENABLED: bool = True
+    WORKER_DB_POOL_SIZE: int = 5
+    WORKER_DB_MAX_OVERFLOW: int = 5
+    WORKER_POLL_SECONDS: float = 2.0
+    # A RUNNING job_runs row not renewed for this long is taken to be dead
+    JOB_LEASE_SECONDS: int = 300
+
+    # Task queue — TASK_WORKER_IN_PROCESS runs a worker pool inside the API too
+    TASK_WORKER_IN_PROCESS: bool = True
+    TASK_WORKER_CONCURRENCY: int = 4
+    TASK_MAX_ATTEMPTS: int = 5
+    TASK_VISIBILITY_TIMEOUT_SECONDS: int = 300
+    TASK_RETRY_BASE_SECONDS: float = 5.0
+    TASK_RETRY_MAX_SECONDS: float = 600.0
+
+    # Outbox — OUTBOX_PUBLISH_IN_PROCESS runs the event publisher inside the API too
+    OUTBOX_PUBLISH_IN_PROCESS: bool = True
+    OUTBOX_BATCH_SIZE: int = 500
+    OUTBOX_POLL_SECONDS: float = 1.0
+
+    # Query budgets (development) — mode off | log | raise; a budget of 0 means unlimited
+    QUERY_BUDGET_MODE: str = "off"
+    QUERY_BUDGET_PER_REQUEST: int = 50
+    QUERY_BUDGET_PER_JOB: int = 0
+    QUERY_N_PLUS_ONE_THRESHOLD: int = 10
+
     # App
     APP_ENV: str = "development"
     APP_DEBUG: bool = True
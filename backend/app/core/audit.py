@@ -1,12 +1,43 @@
-"""Audit logging helper — called from service layer."""
+"""
+Audit logging helper — called from service layer.
+
+Entries are buffered on the session (one list per unit of work) and written with
+a single multi-row INSERT just before the transaction commits; a rollback drops
+them with the rest of the work.
+
+Non-critical events can opt out of the transaction with `durable=False`. When
+AUDIT_WRITE_BEHIND_ENABLED is set they go to a process-wide write-behind buffer
+that batches across requests and is flushed on an interval, when full, and on
+shutdown; otherwise they are buffered on the session like any other entry.
+Only read audits use it (identity lookups in routers/identity.py) — anything
+recording a state change stays durable so it commits or rolls back with it.
+"""
+import asyncio
 import json
+import uuid
+from datetime import datetime, timezone
 from typing import Any, Optional
 from uuid import UUID
 
+from sqlalchemy import event, insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.logging_config import logger
 from app.models.audit import AuditLog
 
+_BUFFER_KEY = "audit_buffer"
+
+
+def _serialize(v: Any) -> Optional[str]:
+    if v is None:
+        return None
+    if isinstance(v, str):
+        return v
+    return json.dumps(v, default=str)
+
 
 async def log_audit(
     db: AsyncSession,
@@ -16,21 +47,102 @@ async def log_audit(
     entity_id: Optional[str] = None,
     old_value: Any = None,
     new_value: Any = None,
+    durable: bool = True,
 ) -> None:
-    def _serialize(v: Any) -> Optional[str]:
-        if v is None:
-            return None
-        if isinstance(v, str):
-            return v
-        return json.dumps(v, default=str)
-
-    entry = AuditLog(
-        actor_id=actor_id,
-        action=action,
-        entity_type=entity_type,
-        entity_id=str(entity_id) if entity_id else None,
-        old_value=_serialize(old_value),
-        new_value=_serialize(new_value),
-    )
-    db.add(entry)
-    await db.flush()
+    entry = {
+        "id": uuid.uuid4(),
+        "actor_id": actor_id,
+        "action": action,
+        "entity_type": entity_type,
+        "entity_id": str(entity_id) if entity_id else None,
+        "old_value": _serialize(old_value),
+        "new_value": _serialize(new_value),
+        "timestamp": datetime.now(timezone.utc),
+    }
+    if not durable and audit_writer.running:
+        audit_writer.enqueue(entry)
+        return
+    db.info.setdefault(_BUFFER_KEY, []).append(entry)
+
+
+@event.listens_for(Session, "before_commit")
+def _write_audit_buffer(session: Session) -> None:
+    """Write the unit of work's audit entries in one INSERT as part of the commit."""
+    entries = session.info.pop(_BUFFER_KEY, None)
+    if not entries:
+        return
+    # Flush first so entries can reference rows created in this transaction
+    session.flush()
+    session.execute(insert(AuditLog), entries)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_audit_buffer(session: Session) -> None:
+    session.info.pop(_BUFFER_KEY, None)
+
+
+class AuditWriteBehind:
+    """Cross-request buffer for non-critical audit entries."""
+
+    def __init__(self, batch_size: int, flush_interval: float) -> None:
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._entries: list[dict] = []
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def enqueue(self, entry: dict) -> None:
+        self._entries.append(entry)
+        if len(self._entries) >= self.batch_size:
+            self._wakeup.set()
+
+    def start(self) -> None:
+        if not self.running:
+            self._task = asyncio.create_task(self._run())
+            logger.info("audit.write_behind_started", batch_size=self.batch_size)
+
+    async def stop(self) -> None:
+        """Stop the flusher and write whatever is still buffered."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    async def flush(self) -> int:
+        entries, self._entries = self._entries, []
+        if not entries:
+            return 0
+        try:
+            async with AsyncSessionLocal() as db:
+                await db.execute(insert(AuditLog), entries)
+                await db.commit()
+        except Exception as exc:
+            # Keep the entries for the next attempt, bounded so an outage can't grow memory forever
+            self._entries = (entries + self._entries)[-self.batch_size * 10:]
+            logger.error("audit.write_behind_failed", error=str(exc), pending=len(self._entries))
+            return 0
+        logger.info("audit.write_behind_flushed", count=len(entries))
+        return len(entries)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+
+
+audit_writer = AuditWriteBehind(
+    batch_size=settings.AUDIT_WRITE_BEHIND_BATCH_SIZE,
+    flush_interval=settings.AUDIT_WRITE_BEHIND_FLUSH_SECONDS,
+)
@@ -0,0 +1,88 @@
+"""
+Circuit breaker for outbound integrations.
+
+  CLOSED     calls flow; `failure_threshold` consecutive failures open it
+  OPEN       calls fail fast with CircuitOpenError for `reset_timeout` seconds
+  HALF_OPEN  one probe call is let through; success closes the circuit,
+             failure reopens it for another `reset_timeout`
+
+State is per process and lives on the event loop thread, so no locking.
+Transitions are logged and exported as `circuit_breaker_state` (0 closed,
+1 half-open, 2 open) and `circuit_breaker_transitions_total`.
+"""
+import enum
+import time
+from typing import Optional
+
+from app.core import metrics
+from app.logging_config import logger
+
+
+class CircuitState(str, enum.Enum):
+    CLOSED = "closed"
+    HALF_OPEN = "half_open"
+    OPEN = "open"
+
+
+_STATE_VALUE = {CircuitState.CLOSED: 0, CircuitState.HALF_OPEN: 1, CircuitState.OPEN: 2}
+
+
+class CircuitOpenError(Exception):
+    def __init__(self, name: str, retry_in: float) -> None:
+        super().__init__(f"Circuit for {name} is open; retry in {retry_in:.1f}s")
+        self.name = name
+        self.retry_in = retry_in
+
+
+class CircuitBreaker:
+    def __init__(self, name: str, failure_threshold: int, reset_timeout: float) -> None:
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probe_in_flight = False
+        metrics.circuit_state.set(name, value=_STATE_VALUE[self.state])
+
+    def _transition(self, state: CircuitState) -> None:
+        if state == self.state:
+            return
+        logger.warning("circuit_breaker.transition", circuit=self.name, from_state=self.state.value, to_state=state.value)
+        self.state = state
+        metrics.circuit_state.set(self.name, value=_STATE_VALUE[state])
+        metrics.circuit_transitions.inc(self.name, state.value)
+
+    def before_call(self) -> None:
+        """Raise CircuitOpenError unless a call may go out now."""
+        if self.state == CircuitState.CLOSED:
+            return
+        if self.state == CircuitState.OPEN:
+            waited = time.monotonic() - self.opened_at
+            if waited < self.reset_timeout:
+                raise CircuitOpenError(self.name, self.reset_timeout - waited)
+            self._transition(CircuitState.HALF_OPEN)
+        if self.probe_in_flight:
+            raise CircuitOpenError(self.name, 0.0)
+        self.probe_in_flight = True
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.probe_in_flight = False
+        self._transition(CircuitState.CLOSED)
+
+    def record_failure(self) -> None:
+        self.probe_in_flight = False
+        self.failures += 1
+        if self.state == CircuitState.HALF_OPEN or self.failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
+            self._transition(CircuitState.OPEN)
+
+    def release(self) -> None:
+        """The call ended without a verdict on the dependency (cancelled, client-side error)."""
+        self.probe_in_flight = False
+
+    def retry_in(self) -> Optional[float]:
+        if self.state != CircuitState.OPEN:
+            return None
+        return max(0.0, self.reset_timeout - (time.monotonic() - self.opened_at))
@@ -0,0 +1,61 @@
+"""
+Request deadlines for outbound calls.
+
+`DeadlineMiddleware` gives every HTTP request a time budget for outbound calls
+(GOV_API_REQUEST_BUDGET_SECONDS); the deadline lives in a contextvar, so it
+follows the request into services and the clients they call. Clients ask
+`remaining()` before each attempt and cap their timeouts, backoff sleeps and
+hedges by it. Outside a request (jobs, task workers) there is no deadline
+unless code opens its own `deadline_scope`.
+
+Nested scopes can only shorten the deadline, never extend it.
+"""
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+import httpx
+
+_deadline: ContextVar[Optional[float]] = ContextVar("deadline", default=None)
+
+
+class DeadlineExceeded(httpx.TimeoutException):
+    """The request's budget ran out before an outbound call could complete."""
+
+
+def remaining() -> Optional[float]:
+    """Seconds left in the current budget, or None when there is no deadline."""
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return max(0.0, deadline - time.monotonic())
+
+
+@contextmanager
+def deadline_scope(seconds: Optional[float]) -> Iterator[None]:
+    if not seconds:
+        yield
+        return
+    deadline = time.monotonic() + seconds
+    current = _deadline.get()
+    token = _deadline.set(deadline if current is None else min(current, deadline))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+class DeadlineMiddleware:
+    """Pure ASGI middleware opening a deadline scope for each HTTP request."""
+
+    def __init__(self, app, seconds: float) -> None:
+        self.app = app
+        self.seconds = seconds
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        with deadline_scope(self.seconds):
+            await self.app(scope, receive, send)
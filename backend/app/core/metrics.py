@@ -0,0 +1,314 @@
+"""
+In-process metrics with Prometheus text exposition.
+
+Counters, gauges and histograms are plain dicts keyed by label values; updates
+are a dict lookup and an add, with no locks (everything runs on the event
+loop thread). `render()` produces the text format served at GET /metrics.
+
+Collected here:
+- HTTP: request count and latency per route template (`MetricsMiddleware`)
+- DB: statement latency per statement kind, plus query count and DB time per
+  request (SQLAlchemy cursor events, attributed through a contextvar)
+- Government API: latency and error count per endpoint (`httpx_hooks`), plus
+  adaptive timeouts, hedges, retries, circuit breaker state and stale cache
+  fallbacks (recorded by the government client)
+- Jobs: runs, duration and rows processed per job (recorded by the job runner)
+
+Values are per process; with several API workers, scrape each one.
+"""
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from typing import Optional
+
+import httpx
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500)
+JOB_BUCKETS = (0.1, 0.5, 1.0, 5.0, 15.0, 30.0, 60.0, 300.0, 900.0, 1800.0, 3600.0)
+
+_REGISTRY: list["_Metric"] = []
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _fmt(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labels: tuple[str, ...] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labels = labels
+        _REGISTRY.append(self)
+
+    def _label_str(self, values: tuple, extra: str = "") -> str:
+        pairs = [f'{k}="{_escape(str(v))}"' for k, v in zip(self.labels, values)]
+        if extra:
+            pairs.append(extra)
+        return "{" + ",".join(pairs) + "}" if pairs else ""
+
+    def _samples(self) -> list[str]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(self._samples())
+        return "\n".join(lines)
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labels: tuple[str, ...] = ()) -> None:
+        super().__init__(name, documentation, labels)
+        self._values: dict[tuple, float] = {}
+
+    def inc(self, *label_values: str, amount: float = 1) -> None:
+        self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def _samples(self) -> list[str]:
+        return [f"{self.name}{self._label_str(k)} {_fmt(v)}" for k, v in self._values.items()]
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labels: tuple[str, ...] = ()) -> None:
+        super().__init__(name, documentation, labels)
+        self._values: dict[tuple, float] = {}
+
+    def set(self, *label_values: str, value: float) -> None:
+        self._values[label_values] = value
+
+    def _samples(self) -> list[str]:
+        return [f"{self.name}{self._label_str(k)} {_fmt(v)}" for k, v in self._values.items()]
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labels)
+        self.buckets = tuple(sorted(buckets))
+        # label values → [per-bucket counts (last is +Inf), sum, count]
+        self._series: dict[tuple, list] = {}
+
+    def observe(self, *label_values: str, value: float) -> None:
+        series = self._series.get(label_values)
+        if series is None:
+            series = self._series[label_values] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+        series[0][bisect_left(self.buckets, value)] += 1
+        series[1] += value
+        series[2] += 1
+
+    def total_count(self) -> int:
+        """Observations across every label set."""
+        return sum(series[2] for series in self._series.values())
+
+    def _samples(self) -> list[str]:
+        lines = []
+        for key, (counts, total, count) in self._series.items():
+            cumulative = 0
+            for bound, n in zip(self.buckets + (float("inf"),), counts):
+                cumulative += n
+                le = 'le="' + _fmt(bound) + '"'
+                lines.append(f"{self.name}_bucket{self._label_str(key, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{self._label_str(key)} {_fmt(total)}")
+            lines.append(f"{self.name}_count{self._label_str(key)} {count}")
+        return lines
+
+
+def render() -> str:
+    return "\n".join(m.render() for m in _REGISTRY) + "\n"
+
+
+# ── Metric definitions ───────────────────────────────────────────────────────
+
+http_requests = Counter(
+    "http_requests_total", "HTTP requests by route template and status.", ("method", "route", "status"),
+)
+http_latency = Histogram(
+    "http_request_duration_seconds", "HTTP request latency by route template.", ("method", "route"),
+)
+http_db_queries = Histogram(
+    "http_request_db_queries", "DB statements executed per HTTP request.", ("route",), buckets=COUNT_BUCKETS,
+)
+http_db_seconds = Histogram(
+    "http_request_db_seconds", "Time spent in DB statements per HTTP request.", ("route",),
+)
+db_query_latency = Histogram(
+    "db_query_duration_seconds", "DB statement latency by statement kind.", ("statement",), buckets=QUERY_BUCKETS,
+)
+gov_api_latency = Histogram(
+    "gov_api_request_duration_seconds", "Government API call latency by endpoint.", ("endpoint", "status"),
+)
+gov_api_errors = Counter(
+    "gov_api_errors_total", "Government API failures by endpoint and reason.", ("endpoint", "reason"),
+)
+gov_api_timeout = Gauge(
+    "gov_api_timeout_seconds", "Current adaptive per-attempt timeout by government API endpoint.", ("endpoint",),
+)
+gov_api_hedges = Counter(
+    "gov_api_hedged_requests_total", "Hedged government API GETs by which copy answered first.", ("endpoint", "winner"),
+)
+gov_api_retries = Counter(
+    "gov_api_retries_total", "Government API retries by endpoint and reason.", ("endpoint", "reason"),
+)
+gov_cache_stale_served = Counter(
+    "gov_cache_stale_served_total", "Expired GovCache entries served while the endpoint was unavailable.", ("endpoint",),
+)
+circuit_state = Gauge("circuit_breaker_state", "Circuit state: 0 closed, 1 half-open, 2 open.", ("circuit",))
+circuit_transitions = Counter(
+    "circuit_breaker_transitions_total", "Circuit breaker transitions by target state.", ("circuit", "state"),
+)
+job_runs = Counter("job_runs_total", "Background job runs by outcome.", ("job", "status"))
+job_duration = Histogram(
+    "job_duration_seconds", "Background job duration.", ("job",), buckets=JOB_BUCKETS,
+)
+job_rows = Counter("job_rows_processed_total", "Rows processed by background jobs.", ("job",))
+job_last_rows = Gauge("job_last_rows_processed", "Rows processed by the last successful run.", ("job",))
+
+
+# ── DB statements ────────────────────────────────────────────────────────────
+
+class _RequestQueries:
+    __slots__ = ("count", "seconds")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.seconds = 0.0
+
+
+_request_queries: ContextVar[Optional[_RequestQueries]] = ContextVar("request_queries", default=None)
+_STATEMENT_KINDS = frozenset({"SELECT", "INSERT", "UPDATE", "DELETE", "WITH"})
+_START_KEY = "metrics_query_start"
+
+
+def _statement_kind(statement: str) -> str:
+    head = statement.lstrip()[:6].upper()
+    return head if head in _STATEMENT_KINDS else ("WITH" if head.startswith("WITH") else "OTHER")
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    conn.info.setdefault(_START_KEY, []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    starts = conn.info.get(_START_KEY)
+    if not starts:
+        return
+    elapsed = time.perf_counter() - starts.pop()
+    db_query_latency.observe(_statement_kind(statement), value=elapsed)
+    stats = _request_queries.get()
+    if stats is not None:
+        stats.count += 1
+        stats.seconds += elapsed
+
+
+@event.listens_for(Engine, "handle_error")
+def _discard_query_start(exception_context) -> None:
+    conn = exception_context.connection
+    if conn is not None and conn.info.get(_START_KEY):
+        conn.info[_START_KEY].pop()
+
+
+# ── HTTP middleware ──────────────────────────────────────────────────────────
+
+class MetricsMiddleware:
+    """Pure ASGI middleware: route latency, status and per-request DB totals."""
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_wrapper(message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        stats = _RequestQueries()
+        token = _request_queries.set(stats)
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            _request_queries.reset(token)
+            # Route template (e.g. /loans/{loan_id}) keeps label cardinality bounded
+            route = scope.get("route")
+            route_path = getattr(route, "path", "unmatched")
+            method = scope["method"]
+            http_requests.inc(method, route_path, str(status_code))
+            http_latency.observe(method, route_path, value=elapsed)
+            http_db_queries.observe(route_path, value=stats.count)
+            http_db_seconds.observe(route_path, value=stats.seconds)
+
+
+# ── httpx hooks ──────────────────────────────────────────────────────────────
+
+_HTTPX_START_KEY = "metrics_start"
+HTTPX_ENDPOINT_KEY = "metrics_endpoint"
+
+
+def httpx_hooks(endpoint: Optional[str] = None) -> dict:
+    """
+    `event_hooks` for an httpx.AsyncClient calling government API endpoints.
+    A client shared across endpoints passes no `endpoint` and labels each
+    request through `request.extensions[HTTPX_ENDPOINT_KEY]` instead.
+    """
+
+    async def on_request(request: httpx.Request) -> None:
+        request.extensions[_HTTPX_START_KEY] = time.perf_counter()
+
+    async def on_response(response: httpx.Response) -> None:
+        label = endpoint or response.request.extensions.get(HTTPX_ENDPOINT_KEY, "unknown")
+        start = response.request.extensions.get(_HTTPX_START_KEY)
+        if start is not None:
+            gov_api_latency.observe(label, str(response.status_code), value=time.perf_counter() - start)
+        if response.status_code >= 400:
+            gov_api_errors.inc(label, str(response.status_code))
+
+    return {"request": [on_request], "response": [on_response]}
+
+
+def record_gov_api_failure(endpoint: str, exc: Exception) -> None:
+    """Count a call that failed before a response arrived (timeout, connection error)."""
+    if not isinstance(exc, httpx.HTTPStatusError):
+        gov_api_errors.inc(endpoint, type(exc).__name__)
+
+
+# ── Jobs ─────────────────────────────────────────────────────────────────────
+
+def record_job_run(job_id: str, status: str, seconds: Optional[float] = None, rows: Optional[int] = None) -> None:
+    job_runs.inc(job_id, status)
+    if seconds is not None:
+        job_duration.observe(job_id, value=seconds)
+    if rows is not None:
+        job_rows.inc(job_id, amount=rows)
+        job_last_rows.set(job_id, value=rows)
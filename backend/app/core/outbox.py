@@ -0,0 +1,260 @@
+"""
+Transactional outbox for loan lifecycle events.
+
+Services call `emit_event` next to the state change it describes. Events are
+buffered on the session and written with one multi-row INSERT just before the
+transaction commits (same pattern as audit entries), so an event exists if and
+only if its change committed.
+
+`OutboxPublisher` streams committed events to in-process subscribers:
+
+1. Each subscriber is a named consumer with an offset row in
+   `outbox_consumer_offsets`, locked FOR UPDATE SKIP LOCKED while a batch is
+   delivered — with several publisher processes, each consumer is served by
+   one of them at a time
+2. Events are read in (txid, id) order, only below the oldest transaction
+   still in flight, so an event committed late by a long transaction is never
+   skipped past
+3. A batch is split per aggregate (loan); aggregates are delivered
+   concurrently, each aggregate's events strictly in order
+4. The offset advances only when the whole batch succeeded; a failed batch is
+   redelivered on the next poll, so handlers must be idempotent
+"""
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Optional
+from uuid import UUID
+
+from sqlalchemy import event, func, insert, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.logging_config import logger
+from app.models.outbox import LoanEventType, OutboxConsumerOffset, OutboxEvent
+
+_BUFFER_KEY = "outbox_buffer"
+_WRITTEN_KEY = "outbox_written"
+
+
+@dataclass(frozen=True)
+class LoanEvent:
+    id: int
+    txid: int
+    event_type: LoanEventType
+    aggregate_type: str
+    aggregate_id: UUID
+    payload: dict
+    created_at: datetime
+
+
+Handler = Callable[[LoanEvent], Awaitable[None]]
+
+
+@dataclass(frozen=True)
+class Subscriber:
+    name: str
+    handler: Handler
+    event_types: frozenset[LoanEventType]
+
+
+_SUBSCRIBERS: dict[str, Subscriber] = {}
+
+
+def subscribe(name: str, *event_types: LoanEventType) -> Callable[[Handler], Handler]:
+    """Register `handler` as consumer `name`; no event types means all of them."""
+    def decorator(handler: Handler) -> Handler:
+        if name in _SUBSCRIBERS:
+            raise ValueError(f"Outbox consumer already registered: {name}")
+        _SUBSCRIBERS[name] = Subscriber(name, handler, frozenset(event_types))
+        return handler
+    return decorator
+
+
+def subscribers() -> dict[str, Subscriber]:
+    return dict(_SUBSCRIBERS)
+
+
+def _jsonable(v: Any) -> Any:
+    if isinstance(v, dict):
+        return {k: _jsonable(x) for k, x in v.items()}
+    if isinstance(v, (list, tuple)):
+        return [_jsonable(x) for x in v]
+    if v is None or isinstance(v, (str, int, float, bool)):
+        return v
+    return str(v)
+
+
+async def emit_event(
+    db: AsyncSession,
+    event_type: LoanEventType,
+    aggregate_id: UUID,
+    payload: Optional[dict] = None,
+    aggregate_type: str = "Loan",
+) -> None:
+    db.info.setdefault(_BUFFER_KEY, []).append({
+        "event_type": event_type,
+        "aggregate_type": aggregate_type,
+        "aggregate_id": aggregate_id,
+        "payload": _jsonable(payload or {}),
+    })
+
+
+@event.listens_for(Session, "before_commit")
+def _write_outbox_buffer(session: Session) -> None:
+    """Write the unit of work's events in one INSERT as part of the commit."""
+    events = session.info.pop(_BUFFER_KEY, None)
+    if not events:
+        return
+    session.flush()
+    session.execute(insert(OutboxEvent), events)
+    session.info[_WRITTEN_KEY] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _wake_local_publisher(session: Session) -> None:
+    if session.info.pop(_WRITTEN_KEY, False) and outbox_publisher.running:
+        outbox_publisher.wake()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_outbox_buffer(session: Session) -> None:
+    session.info.pop(_BUFFER_KEY, None)
+    session.info.pop(_WRITTEN_KEY, None)
+
+
+class OutboxPublisher:
+    """Polls the outbox and delivers batches to every registered subscriber."""
+
+    def __init__(self, batch_size: int, poll_interval: float) -> None:
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._registered: set[str] = set()
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def wake(self) -> None:
+        self._wakeup.set()
+
+    def start(self) -> None:
+        if not self.running:
+            self._task = asyncio.create_task(self._run())
+            logger.info("outbox.publisher_started", consumers=sorted(_SUBSCRIBERS))
+
+    async def stop(self) -> None:
+        """Stop polling; an interrupted batch is redelivered by the next publisher."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def publish_once(self) -> dict[str, int]:
+        """Deliver at most one batch to each consumer. Returns events delivered per consumer."""
+        delivered = {}
+        for subscriber in subscribers().values():
+            try:
+                delivered[subscriber.name] = await self._publish(subscriber)
+            except Exception as exc:
+                delivered[subscriber.name] = 0
+                logger.error("outbox.consumer_failed", consumer=subscriber.name, error=str(exc))
+        return delivered
+
+    async def _publish(self, subscriber: Subscriber) -> int:
+        async with AsyncSessionLocal() as db:
+            if subscriber.name not in self._registered:
+                # New consumers start from the oldest retained event
+                await db.execute(
+                    pg_insert(OutboxConsumerOffset)
+                    .values(consumer=subscriber.name)
+                    .on_conflict_do_nothing(index_elements=["consumer"])
+                )
+                await db.commit()
+                self._registered.add(subscriber.name)
+
+            offset = (await db.execute(
+                select(OutboxConsumerOffset)
+                .where(OutboxConsumerOffset.consumer == subscriber.name)
+                .with_for_update(skip_locked=True)
+            )).scalar_one_or_none()
+            if offset is None:
+                # Another publisher process is serving this consumer
+                return 0
+
+            q = (
+                select(OutboxEvent)
+                .where(
+                    tuple_(OutboxEvent.txid, OutboxEvent.id) > tuple_(offset.last_txid, offset.last_id),
+                    OutboxEvent.txid < func.txid_snapshot_xmin(func.txid_current_snapshot()),
+                )
+                .order_by(OutboxEvent.txid, OutboxEvent.id)
+                .limit(self.batch_size)
+            )
+            if subscriber.event_types:
+                q = q.where(OutboxEvent.event_type.in_(list(subscriber.event_types)))
+            rows = (await db.execute(q)).scalars().all()
+            if not rows:
+                await db.rollback()
+                return 0
+
+            events = [
+                LoanEvent(
+                    id=r.id, txid=r.txid, event_type=r.event_type, aggregate_type=r.aggregate_type,
+                    aggregate_id=r.aggregate_id, payload=r.payload, created_at=r.created_at,
+                )
+                for r in rows
+            ]
+            await self._deliver(subscriber, events)
+
+            await db.execute(
+                update(OutboxConsumerOffset)
+                .where(OutboxConsumerOffset.consumer == subscriber.name)
+                .values(last_txid=events[-1].txid, last_id=events[-1].id, updated_at=func.now())
+            )
+            await db.commit()
+            logger.info("outbox.delivered", consumer=subscriber.name, events=len(events))
+            return len(events)
+
+    @staticmethod
+    async def _deliver(subscriber: Subscriber, events: list[LoanEvent]) -> None:
+        streams: dict[UUID, list[LoanEvent]] = {}
+        for e in events:
+            streams.setdefault(e.aggregate_id, []).append(e)
+
+        async def deliver_stream(stream: list[LoanEvent]) -> None:
+            for e in stream:
+                await subscriber.handler(e)
+
+        results = await asyncio.gather(
+            *(deliver_stream(stream) for stream in streams.values()), return_exceptions=True
+        )
+        errors = [r for r in results if isinstance(r, Exception)]
+        if errors:
+            raise errors[0]
+
+    async def _run(self) -> None:
+        while True:
+            delivered = await self.publish_once()
+            # A full batch means more is probably waiting
+            if any(n >= self.batch_size for n in delivered.values()):
+                continue
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+
+outbox_publisher = OutboxPublisher(
+    batch_size=settings.OUTBOX_BATCH_SIZE,
+    poll_interval=settings.OUTBOX_POLL_SECONDS,
+)
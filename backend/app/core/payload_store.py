@@ -0,0 +1,137 @@
+"""
+Content-addressed payload storage.
+
+Government API responses are stored once in `payload_blobs`, keyed by the
+SHA-256 of their canonical JSON (sorted keys, compact separators) and
+zlib-compressed. `gov_cache` rows and business verification snapshots hold
+only the hash, so the same GST / PAN / Aadhaar payload cached for lookups and
+recorded in a snapshot is stored once, and the wide JSON stays out of the
+heap of the tables that reference it.
+
+Blobs are immutable, so writes are INSERT ... ON CONFLICT DO NOTHING and
+blobs read back are kept in a small per-process LRU.
+
+A snapshot manifest maps snapshot sections ("aadhaar", "pan", "gst",
+"full_check") to payload hashes; `put_manifest` / `resolve_manifest` convert
+between a snapshot and its manifest.
+
+Nothing references a blob by foreign key except `gov_cache.payload_hash`, so
+cache refreshes and re-verifications leave superseded blobs behind;
+`collect_garbage` (the daily payload_gc job) deletes the unreferenced ones.
+
+The encoding is mirrored by the migration that backfilled existing rows
+(c6f1b82d9e40); keep the two in step.
+"""
+import hashlib
+import json
+import zlib
+from collections import OrderedDict
+from typing import Iterable, Optional
+
+from sqlalchemy import select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.logging_config import logger
+from app.models.payload_blob import PayloadBlob
+
+_LRU_SIZE = 4096
+# hash → canonical JSON bytes (decompressed); decoded per read so callers can mutate freely
+_lru: OrderedDict[str, bytes] = OrderedDict()
+
+
+def canonical(payload: dict) -> bytes:
+    return json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str).encode()
+
+
+def payload_hash(payload: dict) -> str:
+    return hashlib.sha256(canonical(payload)).hexdigest()
+
+
+def _remember(digest: str, raw: bytes) -> None:
+    _lru[digest] = raw
+    _lru.move_to_end(digest)
+    if len(_lru) > _LRU_SIZE:
+        _lru.popitem(last=False)
+
+
+async def put_many(db: AsyncSession, payloads: Iterable[dict]) -> list[str]:
+    """Store payloads (deduplicated) and return their hashes, in input order."""
+    hashes: list[str] = []
+    rows: dict[str, dict] = {}
+    for payload in payloads:
+        raw = canonical(payload)
+        digest = hashlib.sha256(raw).hexdigest()
+        hashes.append(digest)
+        # Always insert: a blob seen earlier may belong to a transaction that rolled back
+        if digest not in rows:
+            rows[digest] = {"hash": digest, "data": zlib.compress(raw), "size": len(raw)}
+    if rows:
+        await db.execute(
+            pg_insert(PayloadBlob).values(list(rows.values())).on_conflict_do_nothing(index_elements=[PayloadBlob.hash])
+        )
+    return hashes
+
+
+async def put(db: AsyncSession, payload: dict) -> str:
+    return (await put_many(db, [payload]))[0]
+
+
+async def get_many(db: AsyncSession, hashes: Iterable[str]) -> dict[str, dict]:
+    """Decode many payloads; blobs not in the LRU are fetched with one query."""
+    wanted = set(hashes)
+    missing = [h for h in wanted if h not in _lru]
+    if missing:
+        result = await db.execute(select(PayloadBlob.hash, PayloadBlob.data).where(PayloadBlob.hash.in_(missing)))
+        for digest, data in result.all():
+            _remember(digest, zlib.decompress(data))
+    found = {}
+    for digest in wanted:
+        raw = _lru.get(digest)
+        if raw is not None:
+            _lru.move_to_end(digest)
+            found[digest] = json.loads(raw)
+    return found
+
+
+async def get(db: AsyncSession, digest: str) -> Optional[dict]:
+    return (await get_many(db, [digest])).get(digest)
+
+
+async def put_manifest(db: AsyncSession, snapshot: dict) -> dict[str, str]:
+    """Store each section of a verification snapshot and return section → hash."""
+    sections = {name: payload for name, payload in snapshot.items() if isinstance(payload, dict)}
+    return dict(zip(sections, await put_many(db, sections.values())))
+
+
+async def resolve_manifest(db: AsyncSession, manifest: Optional[dict]) -> dict:
+    """Rebuild the snapshot a manifest describes (one query at most)."""
+    if not manifest:
+        return {}
+    payloads = await get_many(db, manifest.values())
+    return {name: payloads.get(digest) for name, digest in manifest.items()}
+
+
+async def collect_garbage(db: AsyncSession, lock_timeout_seconds: int = 5) -> int:
+    """
+    Delete blobs referenced by neither gov_cache nor any snapshot manifest (no commit).
+
+    A writer may be reusing an existing blob (ON CONFLICT DO NOTHING) for a row
+    it has not committed yet. The table lock waits for such writers to finish
+    and holds off new ones, so every reference is visible to the DELETE. If the
+    lock is not granted within `lock_timeout_seconds`, the lock wait raises and
+    the run should be retried later.
+    """
+    await db.execute(text(f"SET LOCAL lock_timeout = '{int(lock_timeout_seconds)}s'"))
+    await db.execute(text("LOCK TABLE payload_blobs IN SHARE ROW EXCLUSIVE MODE"))
+    result = await db.execute(text("""
+        WITH referenced AS (
+            SELECT payload_hash AS hash FROM gov_cache WHERE payload_hash IS NOT NULL
+            UNION
+            SELECT m.value FROM business_profiles p CROSS JOIN LATERAL jsonb_each_text(p.snapshot_manifest) m
+        )
+        DELETE FROM payload_blobs b
+        WHERE NOT EXISTS (SELECT 1 FROM referenced r WHERE r.hash = b.hash)
+    """))
+    logger.info("payload_store.garbage_collected", deleted=result.rowcount)
+    return result.rowcount
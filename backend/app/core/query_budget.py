@@ -0,0 +1,148 @@
+"""
+Query budgets and N+1 detection — development instrumentation.
+
+A `QueryTracker` is bound to the current request or job through a contextvar;
+a `before_cursor_execute` listener counts every statement against it and groups
+statements by shape (bound values and IN-list lengths normalised away). Two
+rules are checked as statements run:
+
+- budget:    more than `budget` statements in one request / job
+- N+1:       the same shape executed `n_plus_one` times — a query in a loop
+
+QUERY_BUDGET_MODE decides what happens on a violation:
+
+  off    no tracking (default; production)
+  log    one warning per rule per request / job, plus the top repeated shapes
+  raise  QueryBudgetExceeded from the offending statement (tests, local dev)
+
+Requests are tracked by `QueryBudgetMiddleware`, jobs by the job runner; tests
+use the `query_budget` pytest fixture in conftest.py.
+"""
+import re
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.config import settings
+from app.logging_config import logger
+
+_IN_LIST = re.compile(r"\(\s*(?:\$\d+|%\(\w+\)s|\?)(?:\s*,\s*(?:\$\d+|%\(\w+\)s|\?))*\s*\)")
+_PARAM = re.compile(r"\$\d+|%\(\w+\)s")
+_LITERAL = re.compile(r"'(?:[^']|'')*'|\b\d+\b")
+_SPACE = re.compile(r"\s+")
+
+
+class QueryBudgetExceeded(Exception):
+    pass
+
+
+def statement_shape(statement: str) -> str:
+    """Normalise a statement so executions that differ only in values compare equal."""
+    shape = _IN_LIST.sub("(?)", statement)
+    shape = _PARAM.sub("?", shape)
+    shape = _LITERAL.sub("?", shape)
+    return _SPACE.sub(" ", shape).strip()
+
+
+class QueryTracker:
+    def __init__(
+        self,
+        name: str,
+        budget: Optional[int] = None,
+        n_plus_one: Optional[int] = None,
+        mode: Optional[str] = None,
+    ) -> None:
+        self.name = name
+        self.budget = budget
+        self.n_plus_one = n_plus_one
+        self.mode = mode or settings.QUERY_BUDGET_MODE
+        self.count = 0
+        self.shapes: Counter[str] = Counter()
+        self.violations: list[str] = []
+
+    def record(self, statement: str) -> None:
+        self.count += 1
+        shape = statement_shape(statement)
+        self.shapes[shape] += 1
+
+        if self.budget and self.count == self.budget + 1:
+            self._violate(f"query budget exceeded: more than {self.budget} statements")
+        if self.n_plus_one and self.shapes[shape] == self.n_plus_one:
+            self._violate(f"possible N+1: statement repeated {self.n_plus_one} times: {shape[:300]}")
+
+    def repeated(self, top: int = 5) -> list[tuple[str, int]]:
+        return [(shape, n) for shape, n in self.shapes.most_common(top) if n > 1]
+
+    def _violate(self, message: str) -> None:
+        self.violations.append(message)
+        if self.mode == "raise":
+            raise QueryBudgetExceeded(f"{self.name}: {message}")
+        logger.warning("query_budget.violation", scope=self.name, message=message, statements=self.count)
+
+
+_current: ContextVar[Optional[QueryTracker]] = ContextVar("query_tracker", default=None)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _count_statement(conn, cursor, statement, parameters, context, executemany) -> None:
+    tracker = _current.get()
+    if tracker is not None:
+        tracker.record(statement)
+
+
+@contextmanager
+def track_queries(
+    name: str,
+    budget: Optional[int] = None,
+    n_plus_one: Optional[int] = None,
+    mode: Optional[str] = None,
+) -> Iterator[QueryTracker]:
+    """Track statements executed inside the block (same task or tasks it spawns)."""
+    tracker = QueryTracker(name, budget, n_plus_one, mode)
+    token = _current.set(tracker)
+    try:
+        yield tracker
+    finally:
+        _current.reset(token)
+        if tracker.violations and tracker.mode == "log":
+            logger.warning(
+                "query_budget.summary",
+                scope=name,
+                statements=tracker.count,
+                repeated=[{"count": n, "shape": shape[:300]} for shape, n in tracker.repeated()],
+            )
+
+
+@contextmanager
+def track_job_queries(job_id: str) -> Iterator[Optional[QueryTracker]]:
+    if settings.QUERY_BUDGET_MODE == "off":
+        yield None
+        return
+    with track_queries(
+        f"job:{job_id}",
+        budget=settings.QUERY_BUDGET_PER_JOB or None,
+        n_plus_one=settings.QUERY_N_PLUS_ONE_THRESHOLD,
+    ) as tracker:
+        yield tracker
+
+
+class QueryBudgetMiddleware:
+    """Pure ASGI middleware tracking each HTTP request against the request budget."""
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http" or settings.QUERY_BUDGET_MODE == "off":
+            await self.app(scope, receive, send)
+            return
+        with track_queries(
+            f"{scope['method']} {scope['path']}",
+            budget=settings.QUERY_BUDGET_PER_REQUEST or None,
+            n_plus_one=settings.QUERY_N_PLUS_ONE_THRESHOLD,
+        ):
+            await self.app(scope, receive, send)
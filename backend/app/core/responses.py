@@ -0,0 +1,35 @@
+"""
+JSON responses for large payloads.
+
+ORJSONResponse is the app's default response class. List endpoints go one
+step further with `rows_json(rows)`: when a SELECT already yields exactly the
+response schema's fields (labels, text ids, enums, aware datetimes), its rows
+are trusted and serialized straight to bytes by orjson, Decimals as floats.
+Returning a ready Response makes FastAPI skip its own `response_model`
+validation and jsonable_encoder pass, so keep `response_model` on the route
+for the OpenAPI schema and keep the SELECT in step with it;
+tests/test_list_responses.py validates each such route's body against its
+response_model.
+"""
+from decimal import Decimal
+from typing import Any, Iterable, Optional
+
+import orjson
+from fastapi.responses import Response
+from sqlalchemy import Row
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def rows_json(rows: Iterable[Row], key: Optional[str] = None, status_code: int = 200) -> Response:
+    """Serialize result rows as a JSON list, wrapped as {key: [...]} when `key` is given."""
+    items = [row._asdict() for row in rows]
+    return Response(
+        content=orjson.dumps({key: items} if key else items, default=_default),
+        status_code=status_code,
+        media_type="application/json",
+    )
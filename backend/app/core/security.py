@@ -1,3 +1,4 @@
+import base64
 import hashlib
 import hmac
 import random
@@ -6,6 +7,7 @@ import uuid
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
+from cryptography.fernet import Fernet
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 
@@ -39,6 +41,21 @@ def verify_otp_hash(otp: str, otp_hash: str) -> bool:
     return hmac.compare_digest(hash_otp(otp), otp_hash)
 
 
+def _otp_fernet() -> Fernet:
+    key = hashlib.sha256(f"otp-delivery:{settings.SECRET_KEY}".encode()).digest()
+    return Fernet(base64.urlsafe_b64encode(key))
+
+
+def seal_otp(otp: str) -> str:
+    """Encrypt an OTP for the delivery task's payload, so it is never stored in clear."""
+    return _otp_fernet().encrypt(otp.encode()).decode()
+
+
+def open_otp(sealed: str, max_age_seconds: int) -> str:
+    """Decrypt a sealed OTP; raises cryptography.fernet.InvalidToken once older than `max_age_seconds`."""
+    return _otp_fernet().decrypt(sealed.encode(), ttl=max_age_seconds).decode()
+
+
 # ── Refresh Token utilities ───────────────────────────────────────────────────
 
 def generate_refresh_token() -> str:
@@ -0,0 +1,16 @@
+"""
+Stage timing for multi-step pipelines (bulk imports, set-based defaults).
+"""
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+
+@contextmanager
+def stage_timer(timings: dict[str, float], name: str) -> Iterator[None]:
+    """Accumulate the wall time of a pipeline stage into `timings` (ms)."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[name] = round(timings.get(name, 0.0) + (time.perf_counter() - start) * 1000, 2)
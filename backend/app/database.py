@@ -13,21 +13,32 @@ from sqlalchemy.pool import NullPool
 # Supabase / remote PostgreSQL requires SSL
 _is_remote = "supabase.co" in settings.DATABASE_URL or "ssl" in settings.DATABASE_URL.lower()
 
-engine = create_async_engine(
-    _db_url,
-    echo=settings.APP_DEBUG,
-    poolclass=NullPool,
-    connect_args={
-        "ssl": "require" if _is_remote else None,
-        "server_settings": {"jit": "off"},
-        "prepared_statement_name_func": lambda: f"__asyncpg_{uuid.uuid4().hex}__",
-        "statement_cache_size": 0,
-    },
-)
 
-# Crucial for PgBouncer / Supabase Transaction Mode:
-# Disable SQLAlchemy statement caching which conflicts with asyncpg's Prepared Statements
-engine.sync_engine.execution_options(compiled_cache=None)
+def make_engine(**engine_kwargs):
+    """
+    Build an async engine with the shared asyncpg settings. The API uses NullPool
+    (PgBouncer does the pooling); the worker process passes its own pool sizing.
+    """
+    if "pool_size" not in engine_kwargs:
+        engine_kwargs.setdefault("poolclass", NullPool)
+    new_engine = create_async_engine(
+        _db_url,
+        echo=settings.APP_DEBUG,
+        connect_args={
+            "ssl": "require" if _is_remote else None,
+            "server_settings": {"jit": "off"},
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid.uuid4().hex}__",
+            "statement_cache_size": 0,
+        },
+        **engine_kwargs,
+    )
+    # Crucial for PgBouncer / Supabase Transaction Mode:
+    # Disable SQLAlchemy statement caching which conflicts with asyncpg's Prepared Statements
+    new_engine.sync_engine.execution_options(compiled_cache=None)
+    return new_engine
+
+
+engine = make_engine()
 
 AsyncSessionLocal = async_sessionmaker(
     engine,
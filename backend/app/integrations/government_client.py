@@ -12,77 +12,202 @@ Integrates with:
 
 Features:
 - HMAC-SHA256 signing
-- Retry with exponential backoff
-- DB-level caching via GovCache
+- Single-flight bearer token refresh, ahead of expiry and optionally shared
+  across processes through gov_cache
+- Adaptive per-endpoint timeouts from observed latency percentiles
+- Hedged duplicate GETs when the first attempt outlives p95
+- Retries with jittered backoff, bounded by the request's deadline budget
+- Per-endpoint circuit breakers; while open, identity, GST, returns and
+  credit-evaluation lookups fall back to stale GovCache entries
+- DB-level caching via GovCache, payloads deduplicated in payload_blobs
 """
+import asyncio
 import hashlib
 import hmac
 import json
+import random
 import time
+from collections import deque
 from datetime import datetime, timedelta, timezone
 from typing import Any, Optional
 
 import httpx
-from sqlalchemy import select
+from sqlalchemy import null, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
 from app.config import settings
+from app.core import deadline, metrics, payload_store
+from app.core.circuit_breaker import CircuitBreaker, CircuitOpenError
+from app.core.deadline import DeadlineExceeded
+from app.core.metrics import HTTPX_ENDPOINT_KEY, httpx_hooks, record_gov_api_failure
+from app.database import AsyncSessionLocal
 from app.logging_config import logger
 from app.models.gov_cache import GovCache
 
 
-_cached_gov_token: Optional[str] = None
-_token_expires_at: Optional[datetime] = None
+# ── Bearer token ────────────────────────────────────────────────────────────
+
+_TOKEN_CACHE_KEY = "gov_token"
+_DEFAULT_TOKEN_TTL = timedelta(minutes=14)
+# Callers refresh inline only when the token is this close to expiry; the
+# background loop refreshes well before that (GOV_API_TOKEN_REFRESH_AHEAD_SECONDS).
+_MIN_VALIDITY = timedelta(seconds=60)
 
-async def _get_bearer_token() -> str:
-    """Fetch OAuth2 token from the Government Sandbox and cache it in memory."""
-    global _cached_gov_token, _token_expires_at
-    now = datetime.now(timezone.utc)
-    
-    # Return cached token if still valid for at least 60 more seconds
-    if _cached_gov_token and _token_expires_at and _token_expires_at > (now + timedelta(seconds=60)):
-        return _cached_gov_token
 
+async def _login() -> tuple[str, datetime]:
+    """Log in to the Government Sandbox (registering the admin user on first use)."""
     url = f"{settings.GOV_API_BASE_URL}/auth/login"
     data = {
         "username": settings.GOV_API_EMAIL,
         "password": settings.GOV_API_PASSWORD,
     }
-    
-    try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+    now = datetime.now(timezone.utc)
+
+    async with httpx.AsyncClient(timeout=10.0, event_hooks=httpx_hooks("auth")) as client:
+        resp = await client.post(url, data=data)
+
+        # If 401, it means our admin user isn't registered in the Railway sandbox yet.
+        if resp.status_code == 401:
+            logger.info("gov_api.auto_registering_admin")
+            reg_resp = await client.post(
+                f"{settings.GOV_API_BASE_URL}/auth/register",
+                json={
+                    "email": settings.GOV_API_EMAIL,
+                    "password": settings.GOV_API_PASSWORD,
+                    "role": "ADMIN"
+                }
+            )
+            reg_resp.raise_for_status()
+            # Retry login
             resp = await client.post(url, data=data)
-            
-            # If 401, it means our admin user isn't registered in the Railway sandbox yet.
-            if resp.status_code == 401:
-                logger.info("gov_api.auto_registering_admin")
-                reg_resp = await client.post(
-                    f"{settings.GOV_API_BASE_URL}/auth/register",
-                    json={
-                        "email": settings.GOV_API_EMAIL,
-                        "password": settings.GOV_API_PASSWORD,
-                        "role": "ADMIN"
-                    }
-                )
-                reg_resp.raise_for_status()
-                # Retry login
-                resp = await client.post(url, data=data)
-
-            resp.raise_for_status()
-            payload = resp.json()
-            
-            _cached_gov_token = payload["access_token"]
-            _token_expires_at = now + timedelta(minutes=14)
-            logger.info("gov_api.token_fetched", email=settings.GOV_API_EMAIL)
-            return _cached_gov_token
-    except Exception as e:
-        logger.error("gov_api.token_failed", error=str(e))
-        raise
-
-async def _auth_headers() -> dict[str, str]:
-    """Retrieve auth headers containing the active Bearer token."""
-    token = await _get_bearer_token()
+
+        resp.raise_for_status()
+        payload = resp.json()
+
+    expires_in = payload.get("expires_in")
+    ttl = timedelta(seconds=int(expires_in)) if expires_in else _DEFAULT_TOKEN_TTL
+    logger.info("gov_api.token_fetched", email=settings.GOV_API_EMAIL)
+    return payload["access_token"], now + ttl
+
+
+class GovTokenManager:
+    """
+    Holds the Government Sandbox bearer token for this process.
+
+    `get()` returns the cached token until it is close to expiry; then one
+    caller refreshes under an asyncio.Lock while concurrent callers wait for
+    that refresh instead of logging in themselves. `start()` runs a loop that
+    refreshes GOV_API_TOKEN_REFRESH_AHEAD_SECONDS before expiry, so requests
+    normally never wait for a login.
+
+    With GOV_API_TOKEN_SHARED the token is kept in gov_cache under "gov_token"
+    and refreshed under a transaction-level advisory lock: the first process
+    to need a new token logs in, and the others pick it up from the table.
+    """
+
+    def __init__(self) -> None:
+        self.token: Optional[str] = None
+        self.expires_at: Optional[datetime] = None
+        self._rejected: Optional[str] = None
+        self._lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def _valid_for(self, margin: timedelta) -> bool:
+        return (
+            self.token is not None
+            and self.expires_at is not None
+            and self.expires_at - datetime.now(timezone.utc) > margin
+        )
+
+    async def get(self) -> str:
+        await self.ensure(_MIN_VALIDITY)
+        return self.token
+
+    async def ensure(self, margin: timedelta) -> None:
+        """Make sure the token stays valid for at least `margin`; single-flight."""
+        if self._valid_for(margin):
+            return
+        async with self._lock:
+            # Whoever held the lock before us may already have refreshed
+            if self._valid_for(margin):
+                return
+            try:
+                if settings.GOV_API_TOKEN_SHARED:
+                    await self._refresh_shared(margin)
+                else:
+                    self.token, self.expires_at = await _login()
+            except Exception as e:
+                logger.error("gov_api.token_failed", error=str(e))
+                raise
+            self._rejected = None
+
+    def invalidate(self, token: str) -> None:
+        """Drop a token the API rejected (401), unless a newer one already replaced it."""
+        if self.token == token:
+            self._rejected = token
+            self.token = None
+            self.expires_at = None
+
+    async def _refresh_shared(self, margin: timedelta) -> None:
+        async with AsyncSessionLocal() as db:
+            await db.execute(text("SELECT pg_advisory_xact_lock(hashtext(:key))"), {"key": _TOKEN_CACHE_KEY})
+            entry = (
+                await db.execute(select(GovCache).where(GovCache.cache_key == _TOKEN_CACHE_KEY))
+            ).scalar_one_or_none()
+            now = datetime.now(timezone.utc)
+            if entry and entry.expires_at - now > margin and entry.response_json.get("access_token") != self._rejected:
+                self.token, self.expires_at = entry.response_json["access_token"], entry.expires_at
+                await db.commit()
+                logger.info("gov_api.token_shared")
+                return
+
+            token, expires_at = await _login()
+            if entry:
+                entry.response_json = {"access_token": token}
+                entry.expires_at = expires_at
+            else:
+                db.add(GovCache(cache_key=_TOKEN_CACHE_KEY, response_json={"access_token": token}, expires_at=expires_at))
+            await db.commit()
+            self.token, self.expires_at = token, expires_at
+
+    def start(self) -> None:
+        if not self.running:
+            self._task = asyncio.create_task(self._run())
+            logger.info("gov_api.token_refresher_started", shared=settings.GOV_API_TOKEN_SHARED)
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        ahead = timedelta(seconds=settings.GOV_API_TOKEN_REFRESH_AHEAD_SECONDS)
+        failures = 0
+        while True:
+            try:
+                await self.ensure(ahead)
+                failures = 0
+                wait = (self.expires_at - ahead - datetime.now(timezone.utc)).total_seconds()
+            except Exception:
+                failures += 1
+                wait = min(5.0 * 2 ** failures, 300.0)
+            await asyncio.sleep(max(wait, 1.0))
+
+
+token_manager = GovTokenManager()
+
+
+def _auth_headers(token: str) -> dict[str, str]:
+    """Auth headers carrying the given Bearer token."""
     return {
         "Authorization": f"Bearer {token}",
         "Content-Type": "application/json",
@@ -90,60 +215,348 @@ async def _auth_headers() -> dict[str, str]:
     }
 
 
-async def _get_cached(db: AsyncSession, cache_key: str) -> Optional[dict]:
-    """Return cached response if still valid."""
-    now = datetime.now(timezone.utc)
+async def _read_cache(db: AsyncSession, cache_keys: list[str], oldest: datetime) -> dict[str, dict]:
+    """Entries expiring after `oldest`, payloads resolved from payload_blobs."""
+    if not cache_keys:
+        return {}
     result = await db.execute(
-        select(GovCache).where(
-            GovCache.cache_key == cache_key,
-            GovCache.expires_at > now,
+        select(GovCache.cache_key, GovCache.payload_hash, GovCache.response_json).where(
+            GovCache.cache_key.in_(cache_keys),
+            GovCache.expires_at > oldest,
         )
     )
-    entry = result.scalar_one_or_none()
-    return entry.response_json if entry else None
+    rows = result.all()
+    blobs = await payload_store.get_many(db, [row.payload_hash for row in rows if row.payload_hash])
+    entries = {}
+    for key, digest, inline in rows:
+        payload = blobs.get(digest) if digest else inline
+        if payload is not None:
+            entries[key] = payload
+    return entries
+
+
+async def _get_cached(db: AsyncSession, cache_key: str) -> Optional[dict]:
+    """Return cached response if still valid."""
+    return (await _get_cached_many(db, [cache_key])).get(cache_key)
+
+
+async def _get_cached_many(db: AsyncSession, cache_keys: list[str], stale: bool = False) -> dict[str, dict]:
+    """Valid entries for many keys in one query (`stale` widens to GOV_CACHE_STALE_SECONDS past expiry)."""
+    oldest = datetime.now(timezone.utc)
+    if stale:
+        oldest -= timedelta(seconds=settings.GOV_CACHE_STALE_SECONDS)
+    return await _read_cache(db, cache_keys, oldest)
+
+
+async def _set_cache_many(db: AsyncSession, responses: dict[str, dict]) -> None:
+    """Store the payloads as blobs and upsert the cache rows pointing at them, one statement each."""
+    if not responses:
+        return
+    hashes = await payload_store.put_many(db, responses.values())
+    expires_at = datetime.now(timezone.utc) + timedelta(seconds=settings.GOV_CACHE_TTL_SECONDS)
+    stmt = pg_insert(GovCache).values([
+        {"cache_key": key, "payload_hash": digest, "response_json": null(), "expires_at": expires_at}
+        for key, digest in zip(responses, hashes)
+    ])
+    await db.execute(stmt.on_conflict_do_update(
+        index_elements=[GovCache.cache_key],
+        set_={
+            "payload_hash": stmt.excluded.payload_hash,
+            "response_json": null(),
+            "expires_at": stmt.excluded.expires_at,
+        },
+    ))
 
 
 async def _set_cache(db: AsyncSession, cache_key: str, response: dict) -> None:
     """Upsert a cached government response."""
-    expires_at = datetime.now(timezone.utc) + timedelta(seconds=settings.GOV_CACHE_TTL_SECONDS)
-    existing = await db.execute(
-        select(GovCache).where(GovCache.cache_key == cache_key)
-    )
-    entry = existing.scalar_one_or_none()
-    if entry:
-        entry.response_json = response
-        entry.expires_at = expires_at
-    else:
-        db.add(GovCache(cache_key=cache_key, response_json=response, expires_at=expires_at))
-    await db.flush()
-
-
-@retry(
-    stop=stop_after_attempt(3),
-    wait=wait_exponential(multiplier=1, min=1, max=10),
-    retry=retry_if_exception_type((httpx.TimeoutException, httpx.NetworkError)),
-)
-async def _get(path: str) -> dict:
-    url = f"{settings.GOV_API_BASE_URL}{path}"
-    headers = await _auth_headers()
-    async with httpx.AsyncClient(timeout=settings.GOV_API_TIMEOUT) as client:
-        resp = await client.get(url, headers=headers)
-        resp.raise_for_status()
-        return resp.json()
+    await _set_cache_many(db, {cache_key: response})
+
+
+async def _get_stale(db: AsyncSession, cache_key: str) -> Optional[dict]:
+    """Return an expired entry if it expired less than GOV_CACHE_STALE_SECONDS ago."""
+    return (await _get_cached_many(db, [cache_key], stale=True)).get(cache_key)
+
+
+def _unavailable(exc: Exception) -> bool:
+    """The endpoint is down or overloaded, as opposed to rejecting the request."""
+    if isinstance(exc, (CircuitOpenError, httpx.TimeoutException, httpx.NetworkError)):
+        return True
+    return isinstance(exc, httpx.HTTPStatusError) and _unhealthy_status(exc.response.status_code)
+
+
+async def _stale_or_raise(db: AsyncSession, cache_key: str, endpoint: str, exc: Exception) -> dict:
+    """Serve a stale cache entry for an unavailable endpoint, else re-raise."""
+    if _unavailable(exc):
+        stale = await _get_stale(db, cache_key)
+        if stale is not None:
+            metrics.gov_cache_stale_served.inc(endpoint)
+            logger.warning("gov_cache.stale_served", cache_key=cache_key, error=str(exc))
+            return stale
+    raise exc
+
+
+# ── Shared HTTP client ──────────────────────────────────────────────────────
+
+_client: Optional[httpx.AsyncClient] = None
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _http_client() -> httpx.AsyncClient:
+    """
+    Process-wide pooled client, so calls reuse keep-alive connections instead
+    of a TCP/TLS handshake each. Rebuilt if used from a different event loop
+    (connections are bound to the loop that opened them).
+    """
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        _client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=settings.GOV_API_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.GOV_API_MAX_CONNECTIONS,
+            ),
+            event_hooks=httpx_hooks(),
+        )
+        _client_loop = loop
+    return _client
+
+
+async def aclose() -> None:
+    """Close the shared client (application shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+# ── Adaptive timeouts, hedging and retries ──────────────────────────────────
+
+# 429 means the request was not processed, so POSTs may retry it too
+_RETRY_STATUSES = frozenset({429, 502, 503, 504})
+
 
+class _EndpointLatency:
+    """Recent latencies of one endpoint; drives its timeout and hedge delay."""
 
-@retry(
-    stop=stop_after_attempt(3),
-    wait=wait_exponential(multiplier=1, min=1, max=10),
-    retry=retry_if_exception_type((httpx.TimeoutException, httpx.NetworkError)),
-)
-async def _post(path: str, body: dict) -> dict:
+    def __init__(self) -> None:
+        self.samples: deque[float] = deque(maxlen=settings.GOV_API_LATENCY_WINDOW)
+        self.calls = 0
+        self.hedges = 0
+
+    def observe(self, seconds: float) -> None:
+        self.samples.append(seconds)
+
+    def percentile(self, q: float) -> Optional[float]:
+        if len(self.samples) < settings.GOV_API_LATENCY_MIN_SAMPLES:
+            return None
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    def timeout(self) -> float:
+        p99 = self.percentile(0.99)
+        if p99 is None:
+            return float(settings.GOV_API_TIMEOUT)
+        return min(float(settings.GOV_API_TIMEOUT), max(settings.GOV_API_TIMEOUT_MIN, p99 * settings.GOV_API_TIMEOUT_MULTIPLIER))
+
+    def hedge_delay(self) -> Optional[float]:
+        """p95, or None while warming up or once hedges reach GOV_API_HEDGE_MAX_RATIO of calls."""
+        if self.hedges >= self.calls * settings.GOV_API_HEDGE_MAX_RATIO:
+            return None
+        return self.percentile(0.95)
+
+
+_latency: dict[str, _EndpointLatency] = {}
+_breakers: dict[str, CircuitBreaker] = {}
+
+
+def _latency_for(endpoint: str) -> _EndpointLatency:
+    stats = _latency.get(endpoint)
+    if stats is None:
+        stats = _latency[endpoint] = _EndpointLatency()
+    return stats
+
+
+def _breaker_for(endpoint: str) -> CircuitBreaker:
+    breaker = _breakers.get(endpoint)
+    if breaker is None:
+        breaker = _breakers[endpoint] = CircuitBreaker(
+            f"gov_api:{endpoint}",
+            failure_threshold=settings.GOV_API_BREAKER_FAILURE_THRESHOLD,
+            reset_timeout=settings.GOV_API_BREAKER_RESET_SECONDS,
+        )
+    return breaker
+
+
+def _unhealthy_status(status_code: int) -> bool:
+    return status_code >= 500 or status_code == 429
+
+
+def _retryable(status_code: int, idempotent: bool) -> bool:
+    return status_code in _RETRY_STATUSES and (idempotent or status_code == 429)
+
+
+async def _timed(client: httpx.AsyncClient, request: httpx.Request, timeout: float) -> tuple[httpx.Response, float]:
+    start = time.perf_counter()
+    request.extensions["timeout"] = httpx.Timeout(timeout).as_dict()
+    response = await client.send(request)
+    return response, time.perf_counter() - start
+
+
+async def _send_hedged(
+    client: httpx.AsyncClient,
+    build: Any,
+    endpoint: str,
+    stats: _EndpointLatency,
+    timeout: float,
+) -> tuple[httpx.Response, float]:
+    """
+    Send one attempt; if it is still running after the endpoint's p95, send a
+    duplicate and take whichever answers first with a usable response.
+    """
+    primary = asyncio.ensure_future(_timed(client, build(), timeout))
+    tasks = {primary: "primary"}
+    try:
+        delay = stats.hedge_delay()
+        if delay is None or delay >= timeout:
+            return await primary
+        done, _ = await asyncio.wait({primary}, timeout=delay)
+        if done:
+            return primary.result()
+
+        stats.hedges += 1
+        tasks[asyncio.ensure_future(_timed(client, build(), timeout - delay))] = "hedge"
+        pending = set(tasks)
+        fallback = primary
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                fallback = task
+                if task.exception() is None and task.result()[0].status_code not in _RETRY_STATUSES:
+                    metrics.gov_api_hedges.inc(endpoint, tasks[task])
+                    return task.result()
+        return fallback.result()
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+
+
+def _retry_after(response: httpx.Response) -> Optional[float]:
+    try:
+        return float(response.headers["Retry-After"])
+    except (KeyError, ValueError):
+        return None
+
+
+async def _request(method: str, path: str, endpoint: str, body: Optional[dict] = None) -> dict:
+    """
+    Call a government endpoint with adaptive timeouts, hedging (GETs only) and
+    retries on timeouts, network errors, 429 and — for GETs — 502/503/504.
+    Every attempt and backoff sleep fits inside the request's deadline budget;
+    when it runs out, the last error (or DeadlineExceeded) is raised. Each
+    attempt goes through the endpoint's circuit breaker and raises
+    CircuitOpenError without a network call while the circuit is open.
+    """
     url = f"{settings.GOV_API_BASE_URL}{path}"
-    headers = await _auth_headers()
-    async with httpx.AsyncClient(timeout=settings.GOV_API_TIMEOUT) as client:
-        resp = await client.post(url, headers=headers, json=body)
-        resp.raise_for_status()
-        return resp.json()
+    token = await token_manager.get()
+    headers = _auth_headers(token)
+    reauthenticated = False
+    idempotent = method == "GET"
+    stats = _latency_for(endpoint)
+    breaker = _breaker_for(endpoint)
+    error: Exception = DeadlineExceeded(f"{endpoint}: request deadline exhausted")
+
+    client = _http_client()
+
+    def build() -> httpx.Request:
+        return client.build_request(
+            method, url, headers=headers, json=body, extensions={HTTPX_ENDPOINT_KEY: endpoint},
+        )
+
+    for attempt in range(1, settings.GOV_API_MAX_ATTEMPTS + 1):
+        timeout = adaptive = stats.timeout()
+        left = deadline.remaining()
+        if left is not None:
+            if left <= 0:
+                break
+            timeout = min(timeout, left)
+        try:
+            breaker.before_call()
+        except CircuitOpenError as exc:
+            record_gov_api_failure(endpoint, exc)
+            raise
+        metrics.gov_api_timeout.set(endpoint, value=timeout)
+        stats.calls += 1
+
+        retry_after = None
+        try:
+            if idempotent:
+                resp, elapsed = await _send_hedged(client, build, endpoint, stats, timeout)
+            else:
+                resp, elapsed = await _timed(client, build(), timeout)
+        except (httpx.TimeoutException, httpx.NetworkError) as exc:
+            record_gov_api_failure(endpoint, exc)
+            if isinstance(exc, httpx.TimeoutException) and timeout < adaptive:
+                # Cut short by our own deadline — says nothing about the endpoint
+                breaker.release()
+            else:
+                breaker.record_failure()
+                if isinstance(exc, httpx.TimeoutException):
+                    # Censored sample: lets a slowed-down endpoint raise its own timeout
+                    stats.observe(timeout)
+            error, reason = exc, type(exc).__name__
+        except BaseException as exc:
+            breaker.release()
+            if isinstance(exc, httpx.HTTPError):
+                record_gov_api_failure(endpoint, exc)
+            raise
+        else:
+            if _unhealthy_status(resp.status_code):
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+            if resp.status_code == 401 and not reauthenticated:
+                # Token expired or revoked server-side: fetch a new one and try again
+                error = httpx.HTTPStatusError(f"401 from {endpoint}", request=resp.request, response=resp)
+                token_manager.invalidate(token)
+                token = await token_manager.get()
+                headers = _auth_headers(token)
+                reauthenticated = True
+                continue
+            if not _retryable(resp.status_code, idempotent):
+                if resp.status_code < 500:
+                    stats.observe(elapsed)
+                resp.raise_for_status()
+                return resp.json()
+            error = httpx.HTTPStatusError(
+                f"{resp.status_code} from {endpoint}", request=resp.request, response=resp,
+            )
+            reason, retry_after = str(resp.status_code), _retry_after(resp)
+
+        if attempt == settings.GOV_API_MAX_ATTEMPTS:
+            break
+        backoff = retry_after or random.uniform(
+            0, min(settings.GOV_API_RETRY_MAX_SECONDS, settings.GOV_API_RETRY_BASE_SECONDS * 2 ** (attempt - 1))
+        )
+        left = deadline.remaining()
+        if left is not None and backoff >= left:
+            break
+        metrics.gov_api_retries.inc(endpoint, reason)
+        logger.warning("gov_api.retry", endpoint=endpoint, attempt=attempt, reason=reason, backoff=round(backoff, 3))
+        await asyncio.sleep(backoff)
+
+    if isinstance(error, DeadlineExceeded):
+        record_gov_api_failure(endpoint, error)
+    raise error
+
+
+async def _get(path: str, endpoint: str) -> dict:
+    return await _request("GET", path, endpoint)
+
+
+async def _post(path: str, body: dict, endpoint: str) -> dict:
+    return await _request("POST", path, endpoint, body)
 
 
 # ── Public API methods ──────────────────────────────────────────────────────
@@ -155,7 +568,10 @@ async def verify_aadhaar(db: AsyncSession, aadhaar_number: str) -> dict:
         logger.info("gov_cache.hit", cache_key=cache_key)
         return cached
     path = f"/identity/aadhaar/{aadhaar_number}"
-    data = await _get(path)
+    try:
+        data = await _get(path, "aadhaar")
+    except Exception as exc:
+        return await _stale_or_raise(db, cache_key, "aadhaar", exc)
     await _set_cache(db, cache_key, data)
     logger.info("gov_api.aadhaar_verified", aadhaar=aadhaar_number)
     return data
@@ -168,7 +584,10 @@ async def verify_pan(db: AsyncSession, pan_number: str) -> dict:
         logger.info("gov_cache.hit", cache_key=cache_key)
         return cached
     path = f"/identity/pan/{pan_number}"
-    data = await _get(path)
+    try:
+        data = await _get(path, "pan")
+    except Exception as exc:
+        return await _stale_or_raise(db, cache_key, "pan", exc)
     await _set_cache(db, cache_key, data)
     logger.info("gov_api.pan_verified", pan=pan_number)
     return data
@@ -181,7 +600,10 @@ async def verify_gst(db: AsyncSession, gst_number: str) -> dict:
         logger.info("gov_cache.hit", cache_key=cache_key)
         return cached
     path = f"/business/company/{gst_number}"
-    data = await _get(path)
+    try:
+        data = await _get(path, "gst")
+    except Exception as exc:
+        return await _stale_or_raise(db, cache_key, "gst", exc)
     await _set_cache(db, cache_key, data)
     logger.info("gov_api.gst_verified", gst=gst_number)
     return data
@@ -194,7 +616,7 @@ async def get_unpaid_invoices(db: AsyncSession, gst_number: str) -> dict | list:
     # if cached:
     #     return cached
     path = f"/business/company/{gst_number}/unpaid-invoices"
-    data = await _get(path)
+    data = await _get(path, "unpaid_invoices")
     await _set_cache(db, cache_key, data)
     return data
 
@@ -205,7 +627,10 @@ async def get_gst_returns(db: AsyncSession, gst_number: str) -> dict | list:
     if cached:
         return cached
     path = f"/business/company/{gst_number}/returns"
-    data = await _get(path)
+    try:
+        data = await _get(path, "returns")
+    except Exception as exc:
+        return await _stale_or_raise(db, cache_key, "returns", exc)
     await _set_cache(db, cache_key, data)
     return data
 
@@ -228,7 +653,7 @@ async def full_verification_check(
     }
     if invoice_number:
         body["invoice_id"] = invoice_number
-    data = await _post("/verification/full-check", body)
+    data = await _post("/verification/full-check", body, "full_check")
     await _set_cache(db, cache_key, data)
     logger.info("gov_api.full_check_complete", gst=gst_number)
     return data
@@ -239,7 +664,79 @@ async def credit_evaluate(db: AsyncSession, gst_number: str, payload: dict) -> d
     cached = await _get_cached(db, cache_key)
     if cached:
         return cached
-    data = await _post("/external/v1/credit-evaluate", payload)
+    try:
+        data = await _post("/external/v1/credit-evaluate", payload, "credit_evaluate")
+    except Exception as exc:
+        return await _stale_or_raise(db, cache_key, "credit_evaluate", exc)
     await _set_cache(db, cache_key, data)
     logger.info("gov_api.credit_evaluated", gst=gst_number)
     return data
+
+
+# ── Bulk lookups ────────────────────────────────────────────────────────────
+
+# kind → (cache key prefix, path template, endpoint label)
+_BULK_LOOKUPS = {
+    "gst": ("gst", "/business/company/{}", "gst"),
+    "pan": ("pan", "/identity/pan/{}", "pan"),
+    "aadhaar": ("aadhaar", "/identity/aadhaar/{}", "aadhaar"),
+}
+
+
+async def bulk_lookup(
+    db: AsyncSession,
+    kind: str,
+    identifiers: list[str],
+    concurrency: Optional[int] = None,
+) -> dict[str, dict | Exception]:
+    """
+    Look up many GSTINs / PANs / Aadhaar numbers at once.
+
+    Cache hits come from one query. Misses go to the API at most
+    `concurrency` at a time (default GOV_API_BULK_CONCURRENCY) through the
+    shared client, so breakers, hedging and retries apply per call. Failed
+    lookups of an unavailable endpoint fall back to stale entries. Fresh
+    results are upserted in one statement. Returns identifier → response, or
+    the exception for identifiers that could not be resolved; the session is
+    only used before and after the concurrent calls.
+    """
+    prefix, path, endpoint = _BULK_LOOKUPS[kind]
+    keys = {identifier: f"{prefix}:{identifier}" for identifier in dict.fromkeys(identifiers)}
+    cached = await _get_cached_many(db, list(keys.values()))
+    results: dict[str, dict | Exception] = {i: cached[k] for i, k in keys.items() if k in cached}
+    misses = [i for i in keys if i not in results]
+
+    semaphore = asyncio.Semaphore(concurrency or settings.GOV_API_BULK_CONCURRENCY)
+
+    async def fetch(identifier: str) -> dict:
+        async with semaphore:
+            return await _get(path.format(identifier), endpoint)
+
+    fetched = await asyncio.gather(*(fetch(i) for i in misses), return_exceptions=True)
+    fresh: dict[str, dict] = {}
+    unavailable: list[str] = []
+    for identifier, outcome in zip(misses, fetched):
+        if isinstance(outcome, BaseException) and not isinstance(outcome, Exception):
+            raise outcome
+        results[identifier] = outcome
+        if isinstance(outcome, Exception):
+            if _unavailable(outcome):
+                unavailable.append(identifier)
+        else:
+            fresh[keys[identifier]] = outcome
+
+    if unavailable:
+        stale = await _get_cached_many(db, [keys[i] for i in unavailable], stale=True)
+        for identifier in unavailable:
+            if keys[identifier] in stale:
+                results[identifier] = stale[keys[identifier]]
+        if stale:
+            metrics.gov_cache_stale_served.inc(endpoint, amount=len(stale))
+    await _set_cache_many(db, fresh)
+
+    logger.info(
+        "gov_api.bulk_lookup", kind=kind, requested=len(keys), cached=len(cached),
+        fetched=len(fresh), failed=sum(isinstance(r, Exception) for r in results.values()),
+    )
+    return results
+
@@ -12,7 +12,7 @@ async def send_whatsapp_message(to_phone: str, otp: str) -> bool:
     """
     Send a WhatsApp OTP message using AutomateX India API.
     """
-    url = "https://automatexindia.com/api/v1/whatsapp/send/template"
+    url = settings.WHATSAPP_API_URL
 
     # API credentials provided by user
     payload = {
@@ -0,0 +1,18 @@
+"""Delinquency snapshot background job."""
+from app.database import AsyncSessionLocal
+from app.logging_config import logger
+from app.services.delinquency_service import build_delinquency_snapshot
+
+
+async def delinquency_snapshot_job() -> int:
+    """Rebuild today's days-past-due snapshot for every active and defaulted loan."""
+    async with AsyncSessionLocal() as db:
+        try:
+            rows = await build_delinquency_snapshot(db)
+            await db.commit()
+            logger.info("job.delinquency_snapshot", loans=rows)
+            return rows
+        except Exception as exc:
+            await db.rollback()
+            logger.error("job.delinquency_snapshot.error", error=str(exc))
+            raise
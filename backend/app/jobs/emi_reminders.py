@@ -8,7 +8,7 @@ from app.logging_config import logger
 from app.models.credit import EMI, EMIStatus
 
 
-async def emi_reminder_job() -> None:
+async def emi_reminder_job() -> int:
     async with AsyncSessionLocal() as db:
         try:
             now = datetime.now(timezone.utc)
@@ -35,6 +35,8 @@ async def emi_reminder_job() -> None:
 
             await db.commit()
             logger.info("job.emi_reminders_sent", count=len(upcoming))
+            return len(upcoming)
         except Exception as exc:
             await db.rollback()
             logger.error("job.emi_reminder.error", error=str(exc))
+            raise
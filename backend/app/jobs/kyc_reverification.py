@@ -0,0 +1,12 @@
+"""Periodic KYC (GST / PAN) re-verification background job."""
+from app.logging_config import logger
+from app.services.reverification_service import reverify_all_businesses
+
+
+async def kyc_reverification_job() -> int:
+    """Re-check every business's GST and PAN status; resumes from its checkpoint."""
+    try:
+        return await reverify_all_businesses()
+    except Exception as exc:
+        logger.error("job.kyc_reverification.error", error=str(exc))
+        raise
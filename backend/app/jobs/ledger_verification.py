@@ -0,0 +1,78 @@
+"""Ledger balance verification background job."""
+from sqlalchemy import select, func, literal, case, or_
+
+from app.database import AsyncSessionLocal
+from app.logging_config import logger
+from app.models.ledger import LedgerEntry, EntryType, AccountBalance, LoanAccountBalance
+
+
+def _journal_totals(*group_by):
+    """Recompute debit/credit totals from the journal, grouped by the given columns."""
+    debit = func.coalesce(
+        func.sum(case((LedgerEntry.entry_type == EntryType.DEBIT, LedgerEntry.amount))), 0
+    )
+    credit = func.coalesce(
+        func.sum(case((LedgerEntry.entry_type == EntryType.CREDIT, LedgerEntry.amount))), 0
+    )
+    return (
+        select(*group_by, debit.label("debit_total"), credit.label("credit_total"))
+        .group_by(*group_by)
+        .subquery()
+    )
+
+
+async def ledger_verification_job() -> int:
+    """Recompute balances from ledger_entries and flag drift in the running balance tables."""
+    async with AsyncSessionLocal() as db:
+        try:
+            journal = _journal_totals(LedgerEntry.account_type)
+            account_drift = await db.execute(
+                select(
+                    func.coalesce(journal.c.account_type, AccountBalance.account_type).label("account_type"),
+                    func.coalesce(journal.c.debit_total, 0).label("expected_debit"),
+                    func.coalesce(journal.c.credit_total, 0).label("expected_credit"),
+                    func.coalesce(AccountBalance.debit_total, 0).label("debit_total"),
+                    func.coalesce(AccountBalance.credit_total, 0).label("credit_total"),
+                )
+                .select_from(journal)
+                .join(AccountBalance, AccountBalance.account_type == journal.c.account_type, full=True)
+                .where(or_(
+                    func.coalesce(journal.c.debit_total, 0) != func.coalesce(AccountBalance.debit_total, 0),
+                    func.coalesce(journal.c.credit_total, 0) != func.coalesce(AccountBalance.credit_total, 0),
+                ))
+            )
+            for row in account_drift.all():
+                logger.error(
+                    "job.ledger_verification.account_drift",
+                    account_type=row.account_type,
+                    expected_debit=float(row.expected_debit),
+                    debit_total=float(row.debit_total),
+                    expected_credit=float(row.expected_credit),
+                    credit_total=float(row.credit_total),
+                )
+
+            journal = _journal_totals(LedgerEntry.loan_id, LedgerEntry.account_type)
+            loan_drift = await db.execute(
+                select(func.count(literal(1)))
+                .select_from(journal)
+                .join(
+                    LoanAccountBalance,
+                    (LoanAccountBalance.loan_id == journal.c.loan_id)
+                    & (LoanAccountBalance.account_type == journal.c.account_type),
+                    full=True,
+                )
+                .where(or_(
+                    func.coalesce(journal.c.debit_total, 0) != func.coalesce(LoanAccountBalance.debit_total, 0),
+                    func.coalesce(journal.c.credit_total, 0) != func.coalesce(LoanAccountBalance.credit_total, 0),
+                ))
+            )
+            drifted_loans = loan_drift.scalar() or 0
+            if drifted_loans:
+                logger.error("job.ledger_verification.loan_drift", drifted_rows=drifted_loans)
+
+            logger.info("job.ledger_verification", loan_drift_rows=drifted_loans)
+            return drifted_loans
+        except Exception as exc:
+            await db.rollback()
+            logger.error("job.ledger_verification.error", error=str(exc))
+            raise
@@ -9,7 +9,7 @@ from app.models.credit import Offer, OfferStatus
 from app.models.invoice import Invoice, InvoiceStatus
 
 
-async def expire_offers_job() -> None:
+async def expire_offers_job() -> int:
     async with AsyncSessionLocal() as db:
         try:
             now = datetime.now(timezone.utc)
@@ -39,6 +39,8 @@ async def expire_offers_job() -> None:
                     )
             await db.commit()
             logger.info("job.offer_expiry", count=len(expired_offers))
+            return len(expired_offers)
         except Exception as exc:
             await db.rollback()
             logger.error("job.offer_expiry.error", error=str(exc))
+            raise
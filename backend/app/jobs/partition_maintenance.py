@@ -0,0 +1,18 @@
+"""Partition maintenance background job."""
+from app.database import AsyncSessionLocal
+from app.logging_config import logger
+from app.services.partition_service import run_partition_maintenance
+
+
+async def partition_maintenance_job() -> int:
+    """Create upcoming monthly partitions and archive those past retention."""
+    async with AsyncSessionLocal() as db:
+        try:
+            summary = await run_partition_maintenance(db)
+            await db.commit()
+            logger.info("job.partition_maintenance", summary=summary)
+            return sum(len(t["created"]) + len(t["archived"]) for t in summary.values())
+        except Exception as exc:
+            await db.rollback()
+            logger.error("job.partition_maintenance.error", error=str(exc))
+            raise
@@ -0,0 +1,17 @@
+"""Payload blob garbage collection background job."""
+from app.core.payload_store import collect_garbage
+from app.database import AsyncSessionLocal
+from app.logging_config import logger
+
+
+async def payload_gc_job() -> int:
+    """Delete payload blobs no cache entry or verification snapshot references."""
+    async with AsyncSessionLocal() as db:
+        try:
+            deleted = await collect_garbage(db)
+            await db.commit()
+            return deleted
+        except Exception as exc:
+            await db.rollback()
+            logger.error("job.payload_gc.error", error=str(exc))
+            raise
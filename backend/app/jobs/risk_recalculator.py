@@ -4,24 +4,23 @@ from sqlalchemy import select
 from app.database import AsyncSessionLocal
 from app.logging_config import logger
 from app.models.business import BusinessProfile
-from app.services.scoring_service import calculate_credit_score
+from app.services.task_service import fan_out
 
 
-async def risk_recalculation_job() -> None:
-    """Recalculate credit scores for all active businesses."""
+async def risk_recalculation_job() -> int:
+    """Queue one rescore task per business; the task workers score them in parallel."""
     async with AsyncSessionLocal() as db:
         try:
-            result = await db.execute(select(BusinessProfile))
-            profiles = result.scalars().all()
-
-            for profile in profiles:
-                try:
-                    await calculate_credit_score(db, profile.id)
-                except Exception as exc:
-                    logger.warning("job.risk_recalc.profile_error", profile_id=str(profile.id), error=str(exc))
-
+            enqueued = await fan_out(
+                db,
+                "rescore_business",
+                select(BusinessProfile.id.label("business_id")),
+                dedup_prefix="rescore_business",
+            )
             await db.commit()
-            logger.info("job.risk_recalculation_complete", count=len(profiles))
+            logger.info("job.risk_recalculation_enqueued", count=enqueued)
+            return enqueued
         except Exception as exc:
             await db.rollback()
             logger.error("job.risk_recalculation.error", error=str(exc))
+            raise
@@ -0,0 +1,260 @@
+"""
+Job Runner — single-flight execution of background jobs across processes.
+
+Every API worker starts its own scheduler, so each scheduled job fires once per
+process. `run_job` makes that safe with a lease row in `job_runs` rather than a
+session-level lock, which would not survive a transaction-mode pooler:
+
+1. Expire any RUNNING row of the job whose lease ran out (its process died)
+2. Insert a RUNNING row with ON CONFLICT DO NOTHING. A partial unique index
+   allows one RUNNING row per job, and a unique (job_id, scheduled_for) lets
+   each scheduled fire time claim at most one row. When the insert conflicts,
+   this firing is skipped
+3. Run the job, renewing `lease_expires_at` every JOB_LEASE_SECONDS / 3, and
+   finish the row with status, duration and the row count the job returned
+
+Manual runs (CLI, `run_job` tasks) have no `scheduled_for` and are only kept
+from overlapping.
+
+Long jobs that work in committed chunks can record progress with
+`save_checkpoint` (in the chunk's transaction) and resume from
+`load_checkpoint` after a crash or deploy; `clear_checkpoint` at the end of a
+full pass makes the next run start over.
+
+Jobs can also be run by hand or from cron, outside the API:
+
+    python -m app.jobs.runner list
+    python -m app.jobs.runner run npa_classifier
+"""
+import argparse
+import asyncio
+import contextlib
+import os
+import socket
+import time
+import traceback
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable, Optional
+
+from sqlalchemy import delete, func, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import database
+from app.config import settings
+from app.core.metrics import record_job_run
+from app.core.query_budget import track_job_queries
+from app.database import AsyncSessionLocal
+from app.logging_config import logger
+from app.models.job import JobCheckpoint, JobRun, JobRunStatus
+
+JobFunc = Callable[[], Awaitable[Optional[int]]]
+
+
+def job_registry() -> dict[str, JobFunc]:
+    """Job id → coroutine function returning the number of rows processed."""
+    from app.jobs.offer_expiry import expire_offers_job
+    from app.jobs.emi_reminders import emi_reminder_job
+    from app.jobs.npa_classifier import npa_classification_job
+    from app.jobs.risk_recalculator import risk_recalculation_job
+    from app.jobs.ledger_verification import ledger_verification_job
+    from app.jobs.partition_maintenance import partition_maintenance_job
+    from app.jobs.delinquency_snapshot import delinquency_snapshot_job
+    from app.jobs.kyc_reverification import kyc_reverification_job
+    from app.jobs.payload_gc import payload_gc_job
+
+    return {
+        "expire_offers": expire_offers_job,
+        "emi_reminders": emi_reminder_job,
+        "npa_classifier": npa_classification_job,
+        "risk_recalculate": risk_recalculation_job,
+        "ledger_verify": ledger_verification_job,
+        "partitions": partition_maintenance_job,
+        "delinquency": delinquency_snapshot_job,
+        "kyc_reverify": kyc_reverification_job,
+        "payload_gc": payload_gc_job,
+    }
+
+
+def _host() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def _lease_expiry():
+    return func.now() + timedelta(seconds=settings.JOB_LEASE_SECONDS)
+
+
+async def _claim_run(job_id: str, scheduled_for: Optional[datetime]) -> Optional[JobRun]:
+    """Insert the RUNNING row for this firing; None when another run holds the job or this fire time."""
+    run = JobRun(
+        id=uuid.uuid4(),
+        job_id=job_id,
+        status=JobRunStatus.RUNNING,
+        host=_host(),
+        started_at=datetime.now(timezone.utc),
+        scheduled_for=scheduled_for,
+    )
+    async with AsyncSessionLocal() as db:
+        # A run whose process stopped renewing its lease no longer blocks the job
+        await db.execute(
+            update(JobRun)
+            .where(
+                JobRun.job_id == job_id,
+                JobRun.status == JobRunStatus.RUNNING,
+                JobRun.lease_expires_at < func.now(),
+            )
+            .values(status=JobRunStatus.FAILED, finished_at=func.now(), error="Lease expired")
+        )
+        claimed = (await db.execute(
+            pg_insert(JobRun)
+            .values(
+                id=run.id, job_id=job_id, status=run.status, host=run.host, started_at=run.started_at,
+                scheduled_for=scheduled_for, lease_expires_at=_lease_expiry(),
+            )
+            .on_conflict_do_nothing()
+            .returning(JobRun.id)
+        )).scalar()
+        await db.commit()
+    return run if claimed else None
+
+
+async def _renew_lease(run: JobRun) -> None:
+    """Keep `run`'s lease alive until cancelled; stop if the row was expired by another process."""
+    while True:
+        await asyncio.sleep(settings.JOB_LEASE_SECONDS / 3)
+        try:
+            async with AsyncSessionLocal() as db:
+                result = await db.execute(
+                    update(JobRun)
+                    .where(JobRun.id == run.id, JobRun.status == JobRunStatus.RUNNING)
+                    .values(lease_expires_at=_lease_expiry())
+                )
+                await db.commit()
+        except Exception as exc:
+            logger.warning("job.lease_renew_failed", job_id=run.job_id, run_id=str(run.id), error=str(exc))
+            continue
+        if result.rowcount == 0:
+            logger.error("job.lease_lost", job_id=run.job_id, run_id=str(run.id))
+            return
+
+
+async def _finish_run(
+    run: JobRun,
+    status: JobRunStatus,
+    duration_ms: int,
+    rows: Optional[int] = None,
+    error: Optional[str] = None,
+) -> None:
+    values = {
+        "status": status,
+        "finished_at": datetime.now(timezone.utc),
+        "duration_ms": duration_ms,
+        "rows_processed": rows,
+        "error": error,
+    }
+    async with AsyncSessionLocal() as db:
+        await db.execute(update(JobRun).where(JobRun.id == run.id).values(**values))
+        await db.commit()
+    for name, value in values.items():
+        setattr(run, name, value)
+
+
+async def load_checkpoint(db: AsyncSession, job_id: str) -> Optional[dict]:
+    """Saved progress of an interrupted pass of `job_id`, if any."""
+    checkpoint = await db.get(JobCheckpoint, job_id)
+    return checkpoint.state if checkpoint else None
+
+
+async def save_checkpoint(db: AsyncSession, job_id: str, state: dict) -> None:
+    """Record progress in the caller's transaction, so it commits with the work it describes."""
+    stmt = pg_insert(JobCheckpoint).values(job_id=job_id, state=state)
+    await db.execute(stmt.on_conflict_do_update(
+        index_elements=[JobCheckpoint.job_id],
+        set_={"state": stmt.excluded.state, "updated_at": func.now()},
+    ))
+
+
+async def clear_checkpoint(db: AsyncSession, job_id: str) -> None:
+    await db.execute(delete(JobCheckpoint).where(JobCheckpoint.job_id == job_id))
+
+
+async def run_job(job_id: str, scheduled_for: Optional[datetime] = None) -> Optional[JobRun]:
+    """
+    Run `job_id` unless another process is running it or already ran the
+    firing at `scheduled_for`. Returns the finished JobRun, or None when the
+    run was skipped. Job exceptions are recorded on the run and re-raised.
+    """
+    func = job_registry().get(job_id)
+    if func is None:
+        raise KeyError(f"Unknown job: {job_id}")
+
+    run = await _claim_run(job_id, scheduled_for)
+    if run is None:
+        logger.info(
+            "job.skipped", job_id=job_id,
+            scheduled_for=scheduled_for.isoformat() if scheduled_for else None,
+        )
+        record_job_run(job_id, "SKIPPED")
+        return None
+
+    logger.info("job.started", job_id=job_id, run_id=str(run.id))
+    lease = asyncio.create_task(_renew_lease(run))
+    start = time.perf_counter()
+    try:
+        with track_job_queries(job_id):
+            rows = await func()
+    except Exception as exc:
+        elapsed = time.perf_counter() - start
+        duration_ms = int(elapsed * 1000)
+        record_job_run(job_id, JobRunStatus.FAILED.value, elapsed)
+        await _finish_run(
+            run, JobRunStatus.FAILED, duration_ms,
+            error="".join(traceback.format_exception_only(type(exc), exc)).strip(),
+        )
+        logger.error("job.failed", job_id=job_id, run_id=str(run.id), duration_ms=duration_ms)
+        raise
+    finally:
+        lease.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await lease
+
+    elapsed = time.perf_counter() - start
+    duration_ms = int(elapsed * 1000)
+    record_job_run(job_id, JobRunStatus.SUCCEEDED.value, elapsed, rows)
+    await _finish_run(run, JobRunStatus.SUCCEEDED, duration_ms, rows=rows)
+    logger.info(
+        "job.finished", job_id=job_id, run_id=str(run.id),
+        duration_ms=duration_ms, rows_processed=rows,
+    )
+    return run
+
+
+async def _main(argv: Optional[list[str]] = None) -> int:
+    from app.logging_config import setup_logging
+    import app.models  # noqa: F401
+
+    parser = argparse.ArgumentParser(prog="python -m app.jobs.runner")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("list", help="List registered jobs")
+    run_parser = sub.add_parser("run", help="Run one job now (skipped if already running elsewhere)")
+    run_parser.add_argument("job_id", choices=sorted(job_registry()))
+    args = parser.parse_args(argv)
+
+    setup_logging()
+    if args.command == "list":
+        for job_id in sorted(job_registry()):
+            print(job_id)
+        return 0
+
+    try:
+        run = await run_job(args.job_id)
+    except Exception:
+        return 1
+    finally:
+        await database.engine.dispose()
+    return 0 if run is not None else 2
+
+
+if __name__ == "__main__":
+    raise SystemExit(asyncio.run(_main()))
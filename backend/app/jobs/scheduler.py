@@ -2,54 +2,69 @@
 Background Jobs — APScheduler
 
 Jobs:
-1. expire_offers    — every 15 minutes
+1. expire_offers    — every 15 minutes (on the quarter hour)
 2. emi_reminders    — daily at 09:00
 3. npa_classifier   — daily at 01:00
 4. risk_recalculate — weekly on Sunday at 02:00
+5. ledger_verify    — daily at 03:00
+6. partitions       — daily at 00:30
+7. delinquency      — daily at 01:30
+8. kyc_reverify     — weekly on Saturday at 04:00
+9. payload_gc       — daily at 02:30
+
+Every firing goes through `app.jobs.runner.run_job` with its scheduled fire
+time. `job_runs` accepts one run per job and fire time and one RUNNING run per
+job, so a job runs once per schedule however many processes host a scheduler.
+Triggers are all cron (wall-clock aligned) so every process computes the same
+fire times; a firing more than MISFIRE_GRACE_SECONDS late is dropped.
 """
+from datetime import datetime, timedelta, timezone
+
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
-from apscheduler.triggers.interval import IntervalTrigger
 
 from app.logging_config import logger
 
+MISFIRE_GRACE_SECONDS = 60
+
 scheduler = AsyncIOScheduler()
 
+SCHEDULE = [
+    ("expire_offers", CronTrigger(minute="*/15"), "Expire stale offers"),
+    ("emi_reminders", CronTrigger(hour=9, minute=0), "Send EMI reminders"),
+    ("npa_classifier", CronTrigger(hour=1, minute=0), "NPA classification check"),
+    ("risk_recalculate", CronTrigger(day_of_week="sun", hour=2, minute=0), "Weekly risk recalculation"),
+    ("ledger_verify", CronTrigger(hour=3, minute=0), "Ledger balance verification"),
+    ("partitions", CronTrigger(hour=0, minute=30), "Partition maintenance"),
+    # After the NPA run so the snapshot sees the night's defaults
+    ("delinquency", CronTrigger(hour=1, minute=30), "Delinquency (DPD) snapshot"),
+    ("kyc_reverify", CronTrigger(day_of_week="sat", hour=4, minute=0), "KYC GST/PAN re-verification"),
+    ("payload_gc", CronTrigger(hour=2, minute=30), "Payload blob garbage collection"),
+]
+
+
+async def fire(job_id: str, trigger: CronTrigger) -> None:
+    """Scheduler entry point: run `job_id` for the fire time that triggered this call."""
+    from app.jobs.runner import run_job
+
+    # The latest fire time within the grace window — the same on every process
+    earliest = datetime.now(timezone.utc) - timedelta(seconds=MISFIRE_GRACE_SECONDS)
+    await run_job(job_id, scheduled_for=trigger.get_next_fire_time(None, earliest))
+
 
 def setup_scheduler(app) -> AsyncIOScheduler:
-    from app.jobs.offer_expiry import expire_offers_job
-    from app.jobs.emi_reminders import emi_reminder_job
-    from app.jobs.npa_classifier import npa_classification_job
-    from app.jobs.risk_recalculator import risk_recalculation_job
-
-    scheduler.add_job(
-        expire_offers_job,
-        trigger=IntervalTrigger(minutes=15),
-        id="expire_offers",
-        name="Expire stale offers",
-        replace_existing=True,
-    )
-    scheduler.add_job(
-        emi_reminder_job,
-        trigger=CronTrigger(hour=9, minute=0),
-        id="emi_reminders",
-        name="Send EMI reminders",
-        replace_existing=True,
-    )
-    scheduler.add_job(
-        npa_classification_job,
-        trigger=CronTrigger(hour=1, minute=0),
-        id="npa_classifier",
-        name="NPA classification check",
-        replace_existing=True,
-    )
-    scheduler.add_job(
-        risk_recalculation_job,
-        trigger=CronTrigger(day_of_week="sun", hour=2, minute=0),
-        id="risk_recalculate",
-        name="Weekly risk recalculation",
-        replace_existing=True,
-    )
-
-    logger.info("scheduler.configured", job_count=4)
+    for job_id, trigger, name in SCHEDULE:
+        scheduler.add_job(
+            fire,
+            trigger=trigger,
+            args=[job_id, trigger],
+            id=job_id,
+            name=name,
+            max_instances=1,
+            coalesce=True,
+            misfire_grace_time=MISFIRE_GRACE_SECONDS,
+            replace_existing=True,
+        )
+
+    logger.info("scheduler.configured", job_count=len(scheduler.get_jobs()))
     return scheduler
@@ -5,9 +5,16 @@ from app.models.credit import (
     CreditScore, Offer, Loan, EMI, Collateral,
     RiskGrade, LoanType, OfferStatus, LoanStatus, EMIStatus, CollateralStatus
 )
-from app.models.ledger import LedgerEntry, EntryType, AccountType
+from app.models.ledger import (
+    LedgerEntry, EntryType, AccountType, AccountBalance, LoanAccountBalance,
+)
+from app.models.delinquency import DelinquencySnapshot, DPDBucket
 from app.models.audit import AuditLog
+from app.models.job import JobRun, JobRunStatus, JobCheckpoint
+from app.models.task import Task, TaskStatus
+from app.models.outbox import OutboxEvent, OutboxConsumerOffset, LoanEventType
 from app.models.gov_cache import GovCache
+from app.models.payload_blob import PayloadBlob
 from app.models.recovery import RecoveryAction, RecoveryActionType, RecoveryStatus
 
 __all__ = [
@@ -16,8 +23,12 @@ __all__ = [
     "Invoice", "InvoiceStatus",
     "CreditScore", "Offer", "Loan", "EMI", "Collateral",
     "RiskGrade", "LoanType", "OfferStatus", "LoanStatus", "EMIStatus", "CollateralStatus",
-    "LedgerEntry", "EntryType", "AccountType",
+    "LedgerEntry", "EntryType", "AccountType", "AccountBalance", "LoanAccountBalance",
+    "DelinquencySnapshot", "DPDBucket",
     "AuditLog",
-    "GovCache",
+    "JobRun", "JobRunStatus", "JobCheckpoint",
+    "Task", "TaskStatus",
+    "OutboxEvent", "OutboxConsumerOffset", "LoanEventType",
+    "GovCache", "PayloadBlob",
     "RecoveryAction", "RecoveryActionType", "RecoveryStatus",
 ]
@@ -1,5 +1,5 @@
 import uuid
-from datetime import datetime
+from datetime import datetime, timezone
 from sqlalchemy import String, DateTime, ForeignKey, Text, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.dialects.postgresql import UUID
@@ -8,6 +8,10 @@ from app.database import Base
 
 class AuditLog(Base):
     __tablename__ = "audit_logs"
+    # Append-only and read newest-first: monthly partitions on `timestamp` let months past
+    # AUDIT_LOG_RETENTION_MONTHS be detached to the archive schema. Postgres wants the
+    # partition key in the primary key, so it is (id, timestamp).
+    __table_args__ = {"postgresql_partition_by": "RANGE (timestamp)"}
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
@@ -21,7 +25,11 @@ class AuditLog(Base):
     old_value: Mapped[str | None] = mapped_column(Text, nullable=True)
     new_value: Mapped[str | None] = mapped_column(Text, nullable=True)
     timestamp: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now()
+        DateTime(timezone=True),
+        primary_key=True,
+        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
+        index=True,
     )
 
     actor = relationship("User", back_populates="audit_logs")
@@ -2,7 +2,7 @@ import uuid
 from datetime import datetime
 from sqlalchemy import String, DateTime, ForeignKey, func, JSON
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from app.database import Base
 
 
@@ -18,7 +18,18 @@ class BusinessProfile(Base):
     gst_number: Mapped[str] = mapped_column(String(20), unique=True, nullable=False, index=True)
     aadhaar_number: Mapped[str] = mapped_column(String(20), nullable=False)
     pan_number: Mapped[str] = mapped_column(String(15), nullable=False)
-    verification_snapshot: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    # JSON columns are deferred with raiseload: entity loads skip them, and touching
+    # one on an instance raises instead of lazy-loading. Select them explicitly.
+    # Section → payload_blobs hash ({"aadhaar", "pan", "gst", "full_check"}); resolve
+    # with app.core.payload_store.resolve_manifest
+    snapshot_manifest: Mapped[dict | None] = mapped_column(
+        JSONB, nullable=True, deferred=True, deferred_raiseload=True
+    )
+    # Inline snapshot of rows not yet moved to payload_blobs
+    verification_snapshot: Mapped[dict | None] = mapped_column(
+        JSON, nullable=True, deferred=True, deferred_raiseload=True
+    )
+    reverified_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
     )
@@ -1,7 +1,7 @@
 import enum
 import uuid
 from datetime import datetime
-from sqlalchemy import String, DateTime, ForeignKey, Numeric, Integer, Float, func
+from sqlalchemy import String, DateTime, ForeignKey, Numeric, Integer, Float, Index, func, text
 from sqlalchemy import Enum as SAEnum
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.dialects.postgresql import UUID
@@ -119,6 +119,15 @@ class Loan(Base):
 
 class EMI(Base):
     __tablename__ = "emis"
+    __table_args__ = (
+        # Closure checks probe "any unpaid EMI for this loan"
+        Index("ix_emis_loan_id_status", "loan_id", "status"),
+        # Delinquency snapshots aggregate unpaid EMIs past a due-date cutoff
+        Index(
+            "ix_emis_unpaid_due_date", "due_date", "loan_id",
+            postgresql_where=text("status != 'PAID'"),
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
@@ -126,8 +135,12 @@ class EMI(Base):
     loan_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("loans.id", ondelete="CASCADE"), nullable=False
     )
+    installment_number: Mapped[int | None] = mapped_column(Integer, nullable=True)
     due_date: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     amount: Mapped[float] = mapped_column(Numeric(15, 2), nullable=False)
+    principal_component: Mapped[float | None] = mapped_column(Numeric(15, 2), nullable=True)
+    interest_component: Mapped[float | None] = mapped_column(Numeric(15, 2), nullable=True)
+    outstanding_balance: Mapped[float | None] = mapped_column(Numeric(15, 2), nullable=True)
     status: Mapped[EMIStatus] = mapped_column(
         SAEnum(EMIStatus, name="emistatus"), nullable=False, default=EMIStatus.PENDING
     )
@@ -0,0 +1,40 @@
+import enum
+import uuid
+from datetime import date, datetime
+from sqlalchemy import Date, DateTime, ForeignKey, Index, Integer, Numeric, func
+from sqlalchemy import Enum as SAEnum
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.dialects.postgresql import UUID
+from app.database import Base
+
+
+class DPDBucket(str, enum.Enum):
+    CURRENT = "CURRENT"
+    DPD_1_30 = "DPD_1_30"
+    DPD_31_60 = "DPD_31_60"
+    DPD_61_90 = "DPD_61_90"
+    DPD_90_PLUS = "DPD_90_PLUS"
+
+
+class DelinquencySnapshot(Base):
+    """Days-past-due per loan as of a snapshot date, rebuilt daily by the delinquency job."""
+    __tablename__ = "delinquency_snapshots"
+    __table_args__ = (
+        # Collections lists read one bucket of one snapshot
+        Index("ix_delinquency_snapshots_date_bucket", "snapshot_date", "bucket"),
+    )
+
+    snapshot_date: Mapped[date] = mapped_column(Date, primary_key=True)
+    loan_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("loans.id", ondelete="CASCADE"), primary_key=True
+    )
+    dpd: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    bucket: Mapped[DPDBucket] = mapped_column(
+        SAEnum(DPDBucket, name="dpdbucket"), nullable=False
+    )
+    overdue_amount: Mapped[float] = mapped_column(Numeric(15, 2), nullable=False, default=0)
+    overdue_emis: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    oldest_due_date: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import String, DateTime, Text
+from sqlalchemy import String, DateTime, ForeignKey, Text
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.dialects.postgresql import JSONB
 from app.database import Base
@@ -9,5 +9,10 @@ class GovCache(Base):
     __tablename__ = "gov_cache"
 
     cache_key: Mapped[str] = mapped_column(String(300), primary_key=True)
-    response_json: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    # Cached API responses live in payload_blobs; response_json only holds small,
+    # frequently rewritten entries (the shared bearer token) and pre-migration rows
+    payload_hash: Mapped[str | None] = mapped_column(
+        String(64), ForeignKey("payload_blobs.hash"), nullable=True
+    )
+    response_json: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
     expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
@@ -0,0 +1,56 @@
+import enum
+import uuid
+from datetime import datetime
+from sqlalchemy import String, DateTime, Integer, Text, Index, UniqueConstraint, func, text
+from sqlalchemy import Enum as SAEnum
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from app.database import Base
+
+
+class JobRunStatus(str, enum.Enum):
+    RUNNING = "RUNNING"
+    SUCCEEDED = "SUCCEEDED"
+    FAILED = "FAILED"
+
+
+class JobRun(Base):
+    """One execution of a background job, written by app.jobs.runner; the RUNNING row is the job's lease."""
+    __tablename__ = "job_runs"
+    __table_args__ = (
+        Index("ix_job_runs_job_id_started_at", "job_id", "started_at"),
+        # One run per scheduled fire time, however many schedulers fire it
+        UniqueConstraint("job_id", "scheduled_for", name="uq_job_runs_job_id_scheduled_for"),
+        # At most one run of a job in flight
+        Index("ux_job_runs_running", "job_id", unique=True, postgresql_where=text("status = 'RUNNING'")),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    )
+    job_id: Mapped[str] = mapped_column(String(100), nullable=False)
+    status: Mapped[JobRunStatus] = mapped_column(
+        SAEnum(JobRunStatus, name="jobrunstatus"), nullable=False, default=JobRunStatus.RUNNING
+    )
+    host: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    # Fire time for scheduled runs; NULL for manual runs
+    scheduled_for: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    lease_expires_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    started_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    duration_ms: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    rows_processed: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    error: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+
+class JobCheckpoint(Base):
+    """Resumable progress of a long-running job; cleared when a pass completes."""
+    __tablename__ = "job_checkpoints"
+
+    job_id: Mapped[str] = mapped_column(String(100), primary_key=True)
+    state: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now()
+    )
@@ -1,6 +1,6 @@
 import enum
 import uuid
-from datetime import datetime
+from datetime import datetime, timezone
 from sqlalchemy import String, DateTime, ForeignKey, Numeric, func
 from sqlalchemy import Enum as SAEnum
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -22,12 +22,16 @@ class AccountType(str, enum.Enum):
 
 class LedgerEntry(Base):
     __tablename__ = "ledger_entries"
+    # Monthly partitions on `timestamp` keep inserts and recent-period reports on small
+    # tables. Balances sum a loan's whole history, so LEDGER_ENTRY_RETENTION_MONTHS defaults
+    # to 0 (never archive). `timestamp` is in the primary key because it is the partition key.
+    __table_args__ = {"postgresql_partition_by": "RANGE (timestamp)"}
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
     )
     loan_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("loans.id", ondelete="CASCADE"), nullable=False
+        UUID(as_uuid=True), ForeignKey("loans.id", ondelete="CASCADE"), nullable=False, index=True
     )
     entry_type: Mapped[EntryType] = mapped_column(
         SAEnum(EntryType, name="entrytype"), nullable=False
@@ -38,7 +42,42 @@ class LedgerEntry(Base):
     amount: Mapped[float] = mapped_column(Numeric(15, 2), nullable=False)
     description: Mapped[str] = mapped_column(String(500), nullable=True)
     timestamp: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now()
+        DateTime(timezone=True),
+        primary_key=True,
+        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
+        index=True,
     )
 
     loan = relationship("Loan", back_populates="ledger_entries")
+
+
+class AccountBalance(Base):
+    """Running totals per ledger account, maintained with every posting."""
+    __tablename__ = "account_balances"
+
+    account_type: Mapped[AccountType] = mapped_column(
+        SAEnum(AccountType, name="accounttype"), primary_key=True
+    )
+    debit_total: Mapped[float] = mapped_column(Numeric(18, 2), nullable=False, default=0)
+    credit_total: Mapped[float] = mapped_column(Numeric(18, 2), nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
+
+
+class LoanAccountBalance(Base):
+    """Running totals per (loan, account), maintained with every posting."""
+    __tablename__ = "loan_account_balances"
+
+    loan_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("loans.id", ondelete="CASCADE"), primary_key=True
+    )
+    account_type: Mapped[AccountType] = mapped_column(
+        SAEnum(AccountType, name="accounttype"), primary_key=True
+    )
+    debit_total: Mapped[float] = mapped_column(Numeric(18, 2), nullable=False, default=0)
+    credit_total: Mapped[float] = mapped_column(Numeric(18, 2), nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
@@ -0,0 +1,55 @@
+import enum
+import uuid
+from datetime import datetime
+from sqlalchemy import BigInteger, String, DateTime, Index, func, text
+from sqlalchemy import Enum as SAEnum
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from app.database import Base
+
+
+class LoanEventType(str, enum.Enum):
+    OFFER_GENERATED = "OFFER_GENERATED"
+    LOAN_DISBURSED = "LOAN_DISBURSED"
+    EMI_PAID = "EMI_PAID"
+    EMI_BOUNCED = "EMI_BOUNCED"
+    LOAN_CLOSED = "LOAN_CLOSED"
+    LOAN_DEFAULTED = "LOAN_DEFAULTED"
+    RECOVERY_INITIATED = "RECOVERY_INITIATED"
+    RECOVERY_COMPLETED = "RECOVERY_COMPLETED"
+
+
+class OutboxEvent(Base):
+    """Lifecycle event written in the same transaction as the state change it describes."""
+    __tablename__ = "outbox_events"
+    __table_args__ = (
+        # Consumers page through events in (txid, id) order
+        Index("ix_outbox_events_txid_id", "txid", "id"),
+    )
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    # Writing transaction's id; events become readable once every older transaction has finished
+    txid: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, server_default=text("txid_current()")
+    )
+    event_type: Mapped[LoanEventType] = mapped_column(
+        SAEnum(LoanEventType, name="loaneventtype"), nullable=False
+    )
+    aggregate_type: Mapped[str] = mapped_column(String(50), nullable=False)
+    aggregate_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
+    payload: Mapped[dict] = mapped_column(JSONB, nullable=False, default=dict)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+
+
+class OutboxConsumerOffset(Base):
+    """Last event position delivered to each named consumer."""
+    __tablename__ = "outbox_consumer_offsets"
+
+    consumer: Mapped[str] = mapped_column(String(100), primary_key=True)
+    last_txid: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0, server_default="0")
+    last_id: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0, server_default="0")
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
@@ -0,0 +1,16 @@
+from datetime import datetime
+from sqlalchemy import String, DateTime, Integer, LargeBinary, func
+from sqlalchemy.orm import Mapped, mapped_column
+from app.database import Base
+
+
+class PayloadBlob(Base):
+    """Immutable, zlib-compressed JSON payload keyed by the SHA-256 of its canonical form."""
+    __tablename__ = "payload_blobs"
+
+    hash: Mapped[str] = mapped_column(String(64), primary_key=True)
+    data: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    size: Mapped[int] = mapped_column(Integer, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
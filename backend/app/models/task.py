@@ -0,0 +1,51 @@
+import enum
+import uuid
+from datetime import datetime
+from sqlalchemy import String, DateTime, Integer, Text, Index, func, text
+from sqlalchemy import Enum as SAEnum
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from app.database import Base
+
+
+class TaskStatus(str, enum.Enum):
+    PENDING = "PENDING"
+    RUNNING = "RUNNING"
+    DONE = "DONE"
+    FAILED = "FAILED"
+
+
+class Task(Base):
+    """Durable background work, claimed by worker pools with FOR UPDATE SKIP LOCKED."""
+    __tablename__ = "tasks"
+    __table_args__ = (
+        # Workers dequeue due PENDING tasks, and RUNNING ones whose lease expired
+        Index("ix_tasks_status_run_after", "status", "run_after"),
+        # At most one live (queued or running) task per dedup key
+        Index(
+            "uq_tasks_dedup_key_live", "dedup_key", unique=True,
+            postgresql_where=text("status IN ('PENDING', 'RUNNING')"),
+        ),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    )
+    kind: Mapped[str] = mapped_column(String(100), nullable=False)
+    payload: Mapped[dict] = mapped_column(JSONB, nullable=False, default=dict)
+    status: Mapped[TaskStatus] = mapped_column(
+        SAEnum(TaskStatus, name="taskstatus"), nullable=False, default=TaskStatus.PENDING
+    )
+    dedup_key: Mapped[str | None] = mapped_column(String(200), nullable=True)
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    max_attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=5, server_default="5")
+    run_after: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+    locked_until: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+    started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
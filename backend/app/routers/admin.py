@@ -1,22 +1,29 @@
 """Admin router — portfolio monitoring, overrides, user management."""
 import uuid
+from datetime import date
 from typing import Optional
 
 from fastapi import APIRouter, Depends, Query
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.dependencies import require_admin
 from app.database import get_db
 from app.models.credit import LoanStatus
+from app.models.delinquency import DPDBucket
+from app.models.task import Task, TaskStatus
 from app.models.user import User
 from app.services.admin_service import (
     get_portfolio_summary,
     get_ledger_summary,
+    get_loan_ledger_balances,
     get_audit_logs,
+    get_job_runs,
     override_loan_status,
     admin_freeze_user,
 )
+from app.services.delinquency_service import get_delinquency_summary, list_delinquent_loans
+from app.services.task_service import enqueue_task, list_tasks, redacted_payload
 
 router = APIRouter(prefix="/admin", tags=["Admin"])
 
@@ -37,14 +44,45 @@ async def ledger_summary(
     return {"ledger": await get_ledger_summary(db)}
 
 
+@router.get("/ledger/loans/{loan_id}")
+async def loan_ledger_balances(
+    loan_id: uuid.UUID,
+    admin: User = Depends(require_admin),
+    db: AsyncSession = Depends(get_db),
+):
+    return await get_loan_ledger_balances(db, loan_id)
+
+
+@router.get("/delinquency/summary")
+async def delinquency_summary(
+    snapshot_date: Optional[date] = Query(None),
+    admin: User = Depends(require_admin),
+    db: AsyncSession = Depends(get_db),
+):
+    return await get_delinquency_summary(db, snapshot_date)
+
+
+@router.get("/delinquency/loans")
+async def delinquent_loans(
+    bucket: Optional[DPDBucket] = Query(None),
+    snapshot_date: Optional[date] = Query(None),
+    limit: int = Query(100, le=1000),
+    offset: int = Query(0, ge=0),
+    admin: User = Depends(require_admin),
+    db: AsyncSession = Depends(get_db),
+):
+    return await list_delinquent_loans(db, bucket, snapshot_date, limit=limit, offset=offset)
+
+
 @router.get("/audit-logs")
 async def audit_logs(
     entity_type: Optional[str] = Query(None),
     limit: int = Query(100, le=500),
+    days: Optional[int] = Query(None, ge=1, le=3650),
     admin: User = Depends(require_admin),
     db: AsyncSession = Depends(get_db),
 ):
-    logs = await get_audit_logs(db, entity_type=entity_type, limit=limit)
+    logs = await get_audit_logs(db, entity_type=entity_type, limit=limit, days=days)
     return {
         "logs": [
             {
@@ -62,6 +100,92 @@ async def audit_logs(
     }
 
 
+@router.get("/jobs/runs")
+async def job_runs(
+    job_id: Optional[str] = Query(None),
+    limit: int = Query(50, le=500),
+    admin: User = Depends(require_admin),
+    db: AsyncSession = Depends(get_db),
+):
+    runs = await get_job_runs(db, job_id=job_id, limit=limit)
+    return {
+        "runs": [
+            {
+                "id": str(r.id),
+                "job_id": r.job_id,
+                "status": r.status,
+                "host": r.host,
+                "started_at": r.started_at.isoformat(),
+                "finished_at": r.finished_at.isoformat() if r.finished_at else None,
+                "duration_ms": r.duration_ms,
+                "rows_processed": r.rows_processed,
+                "error": r.error,
+            }
+            for r in runs
+        ]
+    }
+
+
+class EnqueueTaskRequest(BaseModel):
+    kind: str
+    payload: dict = {}
+    dedup_key: Optional[str] = None
+
+
+def _task_dict(t: Task) -> dict:
+    return {
+        "id": str(t.id),
+        "kind": t.kind,
+        # Pending OTP deliveries and the like must not leak through the admin API
+        "payload": redacted_payload(t),
+        "status": t.status,
+        "dedup_key": t.dedup_key,
+        "attempts": t.attempts,
+        "max_attempts": t.max_attempts,
+        "run_after": t.run_after.isoformat() if t.run_after else None,
+        "created_at": t.created_at.isoformat() if t.created_at else None,
+        "started_at": t.started_at.isoformat() if t.started_at else None,
+        "finished_at": t.finished_at.isoformat() if t.finished_at else None,
+        "last_error": t.last_error,
+    }
+
+
+@router.post("/tasks", status_code=202)
+async def enqueue_task_endpoint(
+    body: EnqueueTaskRequest,
+    admin: User = Depends(require_admin),
+    db: AsyncSession = Depends(get_db),
+):
+    """Queue ad-hoc work (e.g. rescore_business, run_job) for the task workers."""
+    task = await enqueue_task(db, body.kind, body.payload, dedup_key=body.dedup_key)
+    return {"task_id": str(task.id), "kind": task.kind, "status": task.status}
+
+
+@router.get("/tasks")
+async def tasks(
+    status: Optional[TaskStatus] = Query(None),
+    limit: int = Query(50, le=500),
+    admin: User = Depends(require_admin),
+    db: AsyncSession = Depends(get_db),
+):
+    return {"tasks": [_task_dict(t) for t in await list_tasks(db, status, limit)]}
+
+
+class ReverifyRequest(BaseModel):
+    gst_numbers: list[str] = Field(..., min_length=1, max_length=5000)
+
+
+@router.post("/kyc/reverify", status_code=202)
+async def reverify_kyc(
+    body: ReverifyRequest,
+    admin: User = Depends(require_admin),
+    db: AsyncSession = Depends(get_db),
+):
+    """Queue a GST / PAN re-check of the listed businesses (the full pass is the kyc_reverify job)."""
+    task = await enqueue_task(db, "reverify_businesses", {"gst_numbers": body.gst_numbers})
+    return {"task_id": str(task.id), "kind": task.kind, "status": task.status}
+
+
 class OverrideLoanRequest(BaseModel):
     new_status: LoanStatus
 
@@ -3,7 +3,7 @@ Businesses router — view business profile, credit score, collaterals.
 """
 import uuid
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import String, cast, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.dependencies import get_current_user, require_officer
@@ -17,6 +17,15 @@ from app.services.scoring_service import calculate_credit_score, get_latest_cred
 
 router = APIRouter(prefix="/businesses", tags=["Businesses"])
 
+# Only the columns BusinessProfileResponse needs; ids are cast to text in SQL
+_PROFILE_COLUMNS = (
+    cast(BusinessProfile.id, String).label("id"),
+    cast(BusinessProfile.user_id, String).label("user_id"),
+    BusinessProfile.gst_number,
+    BusinessProfile.pan_number,
+    BusinessProfile.created_at,
+)
+
 
 @router.get("/me", response_model=BusinessProfileResponse)
 async def get_my_business(
@@ -25,21 +34,15 @@ async def get_my_business(
 ):
     """Get the current borrower's business profile."""
     result = await db.execute(
-        select(BusinessProfile).where(BusinessProfile.user_id == current_user.id)
+        select(*_PROFILE_COLUMNS).where(BusinessProfile.user_id == current_user.id)
     )
-    profile = result.scalar_one_or_none()
-    if not profile:
+    row = result.one_or_none()
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="No business profile found. Please complete KYC.",
         )
-    return BusinessProfileResponse(
-        id=str(profile.id),
-        user_id=str(profile.user_id),
-        gst_number=profile.gst_number,
-        pan_number=profile.pan_number,
-        created_at=profile.created_at,
-    )
+    return BusinessProfileResponse.model_validate(row)
 
 
 @router.get("/me/dashboard", response_model=DashboardResponse)
@@ -1,10 +1,15 @@
 """
 Identity pass-through router.
 Exposes direct lookups to the Government Sandbox API for the frontend.
+
+Every lookup is audited as a read of identity data, with the number masked to
+its last four characters. Read audits are not part of a business transaction,
+so they go through the write-behind buffer (`durable=False`) when it is enabled.
 """
 from fastapi import APIRouter, Depends, Path
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.audit import log_audit
 from app.core.dependencies import get_current_user
 from app.database import get_db
 from app.integrations import government_client as gov
@@ -13,6 +18,10 @@ from app.models.user import User
 router = APIRouter(prefix="/identity", tags=["Identity Lookups"])
 
 
+def _masked(number: str) -> str:
+    return "*" * (len(number) - 4) + number[-4:]
+
+
 @router.get("/aadhaar/{aadhaar_number}")
 async def get_aadhaar_info(
     aadhaar_number: str = Path(..., min_length=12, max_length=12),
@@ -20,7 +29,12 @@ async def get_aadhaar_info(
     db: AsyncSession = Depends(get_db),
 ):
     """Fetch Aadhaar details from the Government Sandbox."""
-    return await gov.verify_aadhaar(db, aadhaar_number)
+    result = await gov.verify_aadhaar(db, aadhaar_number)
+    await log_audit(
+        db, actor_id=current_user.id, action="AADHAAR_LOOKUP", entity_type="Identity",
+        entity_id=_masked(aadhaar_number), durable=False,
+    )
+    return result
 
 
 @router.get("/pan/{pan_number}")
@@ -30,4 +44,9 @@ async def get_pan_info(
     db: AsyncSession = Depends(get_db),
 ):
     """Fetch PAN details from the Government Sandbox."""
-    return await gov.verify_pan(db, pan_number)
+    result = await gov.verify_pan(db, pan_number)
+    await log_audit(
+        db, actor_id=current_user.id, action="PAN_LOOKUP", entity_type="Identity",
+        entity_id=_masked(pan_number), durable=False,
+    )
+    return result
@@ -7,10 +7,11 @@ from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel
-from sqlalchemy import select
+from sqlalchemy import String, cast, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.dependencies import get_current_user
+from app.core.responses import rows_json
 from app.database import get_db
 from app.models.business import BusinessProfile
 from app.models.invoice import Invoice, InvoiceStatus
@@ -19,6 +20,18 @@ from app.schemas.schemas import InvoiceResponse
 
 router = APIRouter(prefix="/invoices", tags=["Invoices"])
 
+# Only the columns InvoiceResponse needs; ids are cast to text in SQL
+_INVOICE_COLUMNS = (
+    cast(Invoice.id, String).label("id"),
+    cast(Invoice.business_id, String).label("business_id"),
+    Invoice.invoice_number,
+    Invoice.amount,
+    Invoice.due_date,
+    Invoice.delay_days,
+    Invoice.status,
+    Invoice.created_at,
+)
+
 
 class AddInvoiceRequest(BaseModel):
     invoice_number: str
@@ -34,38 +47,27 @@ async def list_my_invoices(
     db: AsyncSession = Depends(get_db),
 ):
     """List all invoices for the current borrower's business profile."""
-    bp_result = await db.execute(
-        select(BusinessProfile).where(BusinessProfile.user_id == current_user.id)
+    business_id = await db.scalar(
+        select(BusinessProfile.id).where(BusinessProfile.user_id == current_user.id)
     )
-    profile = bp_result.scalar_one_or_none()
-    if not profile:
+    if not business_id:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="No business profile found. Please complete KYC first.",
         )
 
-    from app.services import invoice_service
-    await invoice_service.sync_borrower_invoices(db, profile)
+    # Refresh from the Government API in the background; one live sync per business
+    from app.services.task_service import enqueue_task
+    await enqueue_task(
+        db, "sync_invoices", {"business_id": str(business_id)}, dedup_key=f"sync_invoices:{business_id}"
+    )
 
-    q = select(Invoice).where(Invoice.business_id == profile.id).order_by(Invoice.created_at.desc())
+    q = select(*_INVOICE_COLUMNS).where(Invoice.business_id == business_id).order_by(Invoice.created_at.desc())
     if status_filter:
         q = q.where(Invoice.status == status_filter)
 
     result = await db.execute(q)
-    invoices = result.scalars().all()
-    return [
-        InvoiceResponse(
-            id=str(inv.id),
-            business_id=str(inv.business_id),
-            invoice_number=inv.invoice_number,
-            amount=float(inv.amount),
-            due_date=inv.due_date,
-            delay_days=inv.delay_days,
-            status=inv.status,
-            created_at=inv.created_at,
-        )
-        for inv in invoices
-    ]
+    return rows_json(result)
 
 
 @router.get("/{identifier}", response_model=InvoiceResponse)
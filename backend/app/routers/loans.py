@@ -3,15 +3,16 @@ import uuid
 from typing import Optional
 
 from fastapi import APIRouter, Depends
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings
 from app.core.dependencies import get_current_user, require_officer
 from app.database import get_db
 from app.models.credit import Loan
 from app.models.user import User
-from app.services.loan_service import sanction_loan
+from app.services.loan_service import sanction_loan, sanction_loans_batch, BatchSanctionItem
 
 router = APIRouter(prefix="/loans", tags=["Loan Lifecycle"])
 
@@ -22,6 +23,10 @@ class SanctionRequest(BaseModel):
     asset_value: Optional[float] = None
 
 
+class BatchSanctionRequest(BaseModel):
+    items: list[SanctionRequest] = Field(..., min_length=1, max_length=settings.LOAN_BATCH_MAX_OFFERS)
+
+
 @router.post("/sanction")
 async def sanction(
     body: SanctionRequest,
@@ -40,6 +45,29 @@ async def sanction(
     }
 
 
+@router.post("/sanction/batch")
+async def sanction_batch(
+    body: BatchSanctionRequest,
+    officer: User = Depends(require_officer),
+    db: AsyncSession = Depends(get_db),
+):
+    """Sanction + disburse many offers in chunked bulk transactions (operations)."""
+    results = await sanction_loans_batch(
+        db,
+        [
+            BatchSanctionItem(item.offer_id, item.asset_description, item.asset_value)
+            for item in body.items
+        ],
+        officer,
+    )
+    return {
+        "message": "Batch processed",
+        "requested": len(body.items),
+        "disbursed": sum(1 for r in results if r["status"] == "DISBURSED"),
+        "results": results,
+    }
+
+
 @router.get("/user/my")
 async def get_my_loans(
     current_user: User = Depends(get_current_user),
@@ -48,20 +76,16 @@ async def get_my_loans(
     from app.models.business import BusinessProfile
     from app.models.credit import Offer
     from app.models.invoice import Invoice
-    
-    bp_result = await db.execute(select(BusinessProfile).where(BusinessProfile.user_id == current_user.id))
-    profile = bp_result.scalar_one_or_none()
-    if not profile:
-        return {"loans": []}
-        
+
+    # One lean query: the borrower's profile is a join, not a separate entity load
     result = await db.execute(
-        select(Loan)
+        select(Loan.id, Loan.offer_id, Loan.principal, Loan.status, Loan.created_at)
         .join(Offer, Offer.id == Loan.offer_id)
         .join(Invoice, Invoice.id == Offer.invoice_id)
-        .where(Invoice.business_id == profile.id)
+        .join(BusinessProfile, BusinessProfile.id == Invoice.business_id)
+        .where(BusinessProfile.user_id == current_user.id)
         .order_by(Loan.created_at.desc())
     )
-    loans = result.scalars().all()
     return {
         "loans": [
             {
@@ -71,7 +95,7 @@ async def get_my_loans(
                 "status": loan.status,
                 "created_at": loan.created_at.isoformat(),
             }
-            for loan in loans
+            for loan in result
         ]
     }
 
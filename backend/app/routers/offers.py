@@ -2,13 +2,15 @@
 import uuid
 from fastapi import APIRouter, Depends
 from pydantic import BaseModel
-from sqlalchemy import select
+from sqlalchemy import String, cast, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.dependencies import get_current_user
+from app.core.responses import rows_json
 from app.database import get_db
 from app.models.user import User
 from app.models.credit import Offer
+from app.schemas.schemas import OfferListResponse
 from app.services.offer_service import generate_offers_for_invoice
 
 router = APIRouter(prefix="/offers", tags=["Offer Engine"])
@@ -79,24 +81,21 @@ async def get_my_offers(
         ]
     }
 
-@router.get("/invoice/{invoice_id}")
+@router.get("/invoice/{invoice_id}", response_model=OfferListResponse)
 async def list_offers_for_invoice(
     invoice_id: uuid.UUID,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    result = await db.execute(select(Offer).where(Offer.invoice_id == invoice_id))
-    offers = result.scalars().all()
-    return {
-        "offers": [
-            {
-                "offer_id": str(o.id),
-                "loan_type": o.loan_type,
-                "status": o.status,
-                "percentage": o.percentage,
-                "interest_rate": o.interest_rate,
-                "expires_at": o.expires_at.isoformat(),
-            }
-            for o in offers
-        ]
-    }
+    result = await db.execute(
+        select(
+            cast(Offer.id, String).label("offer_id"),
+            Offer.loan_type,
+            Offer.percentage,
+            Offer.interest_rate,
+            Offer.tenure_months,
+            Offer.status,
+            Offer.expires_at,
+        ).where(Offer.invoice_id == invoice_id)
+    )
+    return rows_json(result, key="offers")
@@ -1,19 +1,28 @@
-"""Repayment router — EMI pay, bounce."""
+"""Repayment router — EMI pay, bounce, settlement and return file import."""
 import uuid
 
-from fastapi import APIRouter, Depends
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, File, Query, UploadFile
+from pydantic import BaseModel, Field
+from sqlalchemy import String, cast, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.dependencies import get_current_user
+from app.core.dependencies import get_current_user, require_officer
+from app.core.responses import rows_json
 from app.database import get_db
 from app.models.credit import EMI, Loan
 from app.models.user import User
-from app.services.repayment_service import pay_emi, bounce_emi
+from app.schemas.schemas import EMIListResponse
+from app.services.file_ingest import FileFormat
+from app.services.repayment_service import pay_emi, bounce_emi, bounce_emis
+from app.services.settlement_service import import_return_file, import_settlement_file
 
 router = APIRouter(prefix="/repayments", tags=["Repayments"])
 
 
+class BulkBounceRequest(BaseModel):
+    emi_ids: list[uuid.UUID] = Field(..., min_length=1, max_length=10_000)
+
+
 @router.post("/emi/{emi_id}/pay")
 async def pay_emi_endpoint(
     emi_id: uuid.UUID,
@@ -39,23 +48,57 @@ async def bounce_emi_endpoint(
     }
 
 
-@router.get("/loan/{loan_id}/emis")
+@router.post("/emi/bounce/bulk")
+async def bulk_bounce_endpoint(
+    body: BulkBounceRequest,
+    officer: User = Depends(require_officer),
+    db: AsyncSession = Depends(get_db),
+):
+    """Bounce many EMIs in one transaction; loans crossing the retry limit are defaulted."""
+    return await bounce_emis(db, body.emi_ids)
+
+
+@router.post("/returns/import")
+async def import_returns_endpoint(
+    file: UploadFile = File(...),
+    format: FileFormat = Query(FileFormat.CSV),
+    officer: User = Depends(require_officer),
+    db: AsyncSession = Depends(get_db),
+):
+    """Apply an ECS/NACH mandate return file and return the bounce report with stage timings."""
+    return await import_return_file(db, file.file, format)
+
+
+@router.post("/settlements/import")
+async def import_settlement_endpoint(
+    file: UploadFile = File(...),
+    format: FileFormat = Query(FileFormat.CSV),
+    officer: User = Depends(require_officer),
+    db: AsyncSession = Depends(get_db),
+):
+    """Apply a bank settlement file (CSV or fixed-width) and return the reconciliation report."""
+    return await import_settlement_file(db, file.file, format, officer)
+
+
+@router.get("/loan/{loan_id}/emis", response_model=EMIListResponse)
 async def list_emis(
     loan_id: uuid.UUID,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    result = await db.execute(select(EMI).where(EMI.loan_id == loan_id).order_by(EMI.due_date))
-    emis = result.scalars().all()
-    return {
-        "emis": [
-            {
-                "emi_id": str(e.id),
-                "due_date": e.due_date.isoformat(),
-                "amount": float(e.amount),
-                "status": e.status,
-                "retry_count": e.retry_count,
-            }
-            for e in emis
-        ]
-    }
+    result = await db.execute(
+        select(
+            cast(EMI.id, String).label("emi_id"),
+            EMI.installment_number,
+            EMI.due_date,
+            EMI.amount,
+            EMI.principal_component,
+            EMI.interest_component,
+            EMI.outstanding_balance,
+            EMI.status,
+            EMI.retry_count,
+        )
+        .where(EMI.loan_id == loan_id)
+        .order_by(EMI.due_date)
+    )
+    return rows_json(result, key="emis")
@@ -4,9 +4,9 @@ from app.schemas.schemas import (
     TokenResponse, AccessTokenResponse,
     KYCRequest, KYCResponse,
     BusinessProfileResponse, InvoiceResponse,
-    GenerateOfferRequest, OfferResponse,
+    GenerateOfferRequest, OfferResponse, OfferListResponse,
     SanctionRequest, LoanResponse, CollateralResponse,
-    EMIResponse,
+    EMIResponse, EMIListResponse,
     CreditScoreResponse,
     LedgerSummaryItem,
     PortfolioSummaryResponse, AuditLogResponse, OverrideLoanRequest, BorrowerExposureItem,
@@ -17,9 +17,9 @@ __all__ = [
     "TokenResponse", "AccessTokenResponse",
     "KYCRequest", "KYCResponse",
     "BusinessProfileResponse", "InvoiceResponse",
-    "GenerateOfferRequest", "OfferResponse",
+    "GenerateOfferRequest", "OfferResponse", "OfferListResponse",
     "SanctionRequest", "LoanResponse", "CollateralResponse",
-    "EMIResponse",
+    "EMIResponse", "EMIListResponse",
     "CreditScoreResponse",
     "LedgerSummaryItem",
     "PortfolioSummaryResponse", "AuditLogResponse", "OverrideLoanRequest", "BorrowerExposureItem",
@@ -130,6 +130,10 @@ class OfferResponse(BaseModel):
     model_config = {"from_attributes": True}
 
 
+class OfferListResponse(BaseModel):
+    offers: list[OfferResponse]
+
+
 # ── Loans ─────────────────────────────────────────────────────────────────────
 
 class SanctionRequest(BaseModel):
@@ -161,14 +165,22 @@ class CollateralResponse(BaseModel):
 
 class EMIResponse(BaseModel):
     emi_id: str
+    installment_number: Optional[int] = None
     due_date: datetime
     amount: float
+    principal_component: Optional[float] = None
+    interest_component: Optional[float] = None
+    outstanding_balance: Optional[float] = None
     status: EMIStatus
     retry_count: int
 
     model_config = {"from_attributes": True}
 
 
+class EMIListResponse(BaseModel):
+    emis: list[EMIResponse]
+
+
 # ── Credit Scoring ────────────────────────────────────────────────────────────
 
 class CreditScoreResponse(BaseModel):
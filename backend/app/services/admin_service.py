@@ -3,6 +3,7 @@ Admin Service
 
 Portfolio monitoring, overrides, user freeze.
 """
+from datetime import datetime, timedelta, timezone
 from uuid import UUID
 from typing import Optional
 
@@ -17,10 +18,14 @@ from app.models.business import BusinessProfile
 from app.models.credit import (
     Loan, LoanStatus, Collateral, CollateralStatus, CreditScore,
 )
-from app.models.ledger import LedgerEntry
+from app.models.job import JobRun
+from app.models.ledger import EntryType
 from app.models.invoice import Invoice, InvoiceStatus
 from app.models.user import User
 from app.services.auth_service import freeze_user as _freeze_user
+from app.services.ledger_service import (
+    get_account_balances, get_loan_balances, get_loan_outstanding,
+)
 
 
 async def get_portfolio_summary(db: AsyncSession) -> dict:
@@ -95,35 +100,67 @@ async def get_borrower_exposure(db: AsyncSession) -> list[dict]:
 
 
 async def get_ledger_summary(db: AsyncSession) -> list[dict]:
-    result = await db.execute(
-        select(
-            LedgerEntry.account_type,
-            LedgerEntry.entry_type,
-            safunc.sum(LedgerEntry.amount).label("total"),
-        ).group_by(LedgerEntry.account_type, LedgerEntry.entry_type)
-    )
-    return [
-        {
-            "account_type": row.account_type,
-            "entry_type": row.entry_type,
-            "total": float(row.total),
-        }
-        for row in result.all()
-    ]
+    """Ledger totals by account, read from the running balance table."""
+    summary = []
+    for balance in await get_account_balances(db):
+        for entry_type, total in (
+            (EntryType.DEBIT, balance.debit_total),
+            (EntryType.CREDIT, balance.credit_total),
+        ):
+            if total:
+                summary.append({
+                    "account_type": balance.account_type,
+                    "entry_type": entry_type,
+                    "total": float(total),
+                })
+    return summary
+
+
+async def get_loan_ledger_balances(db: AsyncSession, loan_id: UUID) -> dict:
+    balances = await get_loan_balances(db, loan_id)
+    return {
+        "loan_id": str(loan_id),
+        "outstanding": await get_loan_outstanding(db, loan_id),
+        "accounts": [
+            {
+                "account_type": b.account_type,
+                "debit_total": float(b.debit_total),
+                "credit_total": float(b.credit_total),
+                "updated_at": b.updated_at.isoformat() if b.updated_at else None,
+            }
+            for b in balances
+        ],
+    }
 
 
 async def get_audit_logs(
     db: AsyncSession,
     entity_type: Optional[str] = None,
     limit: int = 100,
+    days: Optional[int] = None,
 ) -> list[AuditLog]:
     q = select(AuditLog).order_by(AuditLog.timestamp.desc()).limit(limit)
+    if days:
+        # Bounding the window lets Postgres prune to the recent monthly partitions
+        q = q.where(AuditLog.timestamp >= datetime.now(timezone.utc) - timedelta(days=days))
     if entity_type:
         q = q.where(AuditLog.entity_type == entity_type)
     result = await db.execute(q)
     return result.scalars().all()
 
 
+async def get_job_runs(
+    db: AsyncSession,
+    job_id: Optional[str] = None,
+    limit: int = 50,
+) -> list[JobRun]:
+    q = select(JobRun).order_by(JobRun.started_at.desc()).limit(limit)
+    if job_id:
+        q = q.where(JobRun.job_id == job_id)
+    result = await db.execute(q)
+    return result.scalars().all()
+
+
 async def override_loan_status(
     db: AsyncSession,
     loan_id: UUID,
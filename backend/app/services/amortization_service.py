@@ -0,0 +1,151 @@
+"""
+Amortization Engine
+
+Builds full EMI schedules — principal, interest and outstanding balance per
+installment, with calendar-month due dates — for one or many loans at once.
+
+Offers come from a handful of (rate, tenure) products and a disbursement batch
+shares one start date, so the annuity factor and the due-date vector are
+computed once per distinct key and reused across every loan in the pass.
+Schedules are persisted with a single multi-row INSERT.
+"""
+import calendar
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal, ROUND_HALF_UP
+from functools import lru_cache
+from typing import Iterable
+from uuid import UUID
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.credit import EMI, EMIStatus
+
+_CENT = Decimal("0.01")
+
+
+def _money(value: Decimal) -> Decimal:
+    return value.quantize(_CENT, rounding=ROUND_HALF_UP)
+
+
+@dataclass(frozen=True)
+class LoanTerms:
+    loan_id: UUID
+    principal: float
+    annual_rate: float
+    tenure_months: int
+    start: datetime
+
+    def __post_init__(self) -> None:
+        _check_tenure(self.tenure_months)
+
+
+@dataclass(frozen=True)
+class Installment:
+    installment_number: int
+    due_date: datetime
+    amount: Decimal
+    principal_component: Decimal
+    interest_component: Decimal
+    outstanding_balance: Decimal
+
+
+def _check_tenure(months: int) -> None:
+    if months < 1:
+        raise ValueError(f"Tenure must be at least one month, got {months}")
+
+
+def add_months(start: datetime, months: int) -> datetime:
+    """Same day-of-month `months` later, clamped to the month's last day (Jan 31 → Feb 28)."""
+    index = start.year * 12 + (start.month - 1) + months
+    year, month = index // 12, index % 12 + 1
+    day = min(start.day, calendar.monthrange(year, month)[1])
+    return start.replace(year=year, month=month, day=day)
+
+
+@lru_cache(maxsize=256)
+def _monthly_rate(annual_rate: float) -> Decimal:
+    return Decimal(str(annual_rate)) / Decimal(1200)
+
+
+@lru_cache(maxsize=256)
+def _annuity_factor(annual_rate: float, months: int) -> Decimal:
+    """EMI per unit of principal: r(1+r)^n / ((1+r)^n − 1), or 1/n at zero rate."""
+    r = _monthly_rate(annual_rate)
+    if r == 0:
+        return Decimal(1) / Decimal(months)
+    growth = (1 + r) ** months
+    return r * growth / (growth - 1)
+
+
+def emi_amount(principal: float, annual_rate: float, months: int) -> Decimal:
+    """Standard EMI formula: P × r × (1+r)^n / ((1+r)^n - 1)"""
+    return _money(Decimal(str(principal)) * _annuity_factor(annual_rate, months))
+
+
+def build_schedule(principal: float, annual_rate: float, months: int, start: datetime,
+                   due_dates: list[datetime] | None = None) -> list[Installment]:
+    """
+    Reducing-balance schedule. The final installment absorbs rounding so the
+    principal components sum exactly to the principal.
+    """
+    _check_tenure(months)
+    r = _monthly_rate(annual_rate)
+    emi = emi_amount(principal, annual_rate, months)
+    due_dates = due_dates or [add_months(start, i) for i in range(1, months + 1)]
+
+    balance = _money(Decimal(str(principal)))
+    schedule = []
+    for i in range(months):
+        interest = _money(balance * r)
+        if i == months - 1:
+            principal_part = balance
+        else:
+            principal_part = min(emi - interest, balance)
+        balance -= principal_part
+        schedule.append(Installment(
+            installment_number=i + 1,
+            due_date=due_dates[i],
+            amount=principal_part + interest,
+            principal_component=principal_part,
+            interest_component=interest,
+            outstanding_balance=balance,
+        ))
+    return schedule
+
+
+def build_schedules(loans: Iterable[LoanTerms]) -> list[dict]:
+    """EMI rows for many loans in one pass, sharing due-date vectors across equal (start, tenure)."""
+    due_date_cache: dict[tuple[datetime, int], list[datetime]] = {}
+    rows = []
+    for terms in loans:
+        key = (terms.start, terms.tenure_months)
+        if key not in due_date_cache:
+            due_date_cache[key] = [add_months(terms.start, i) for i in range(1, terms.tenure_months + 1)]
+        for inst in build_schedule(
+            terms.principal, terms.annual_rate, terms.tenure_months, terms.start, due_date_cache[key]
+        ):
+            rows.append({
+                "loan_id": terms.loan_id,
+                "installment_number": inst.installment_number,
+                "due_date": inst.due_date,
+                "amount": inst.amount,
+                "principal_component": inst.principal_component,
+                "interest_component": inst.interest_component,
+                "outstanding_balance": inst.outstanding_balance,
+                "status": EMIStatus.PENDING,
+                "retry_count": 0,
+            })
+    return rows
+
+
+async def insert_schedules(db: AsyncSession, loans: Iterable[LoanTerms]) -> int:
+    """Generate and persist schedules for `loans` with one multi-row INSERT. Returns EMI count."""
+    rows = build_schedules(loans)
+    if not rows:
+        return 0
+    # Loans must be written before their EMIs reference them
+    await db.flush()
+    await db.execute(insert(EMI), rows)
+    return len(rows)
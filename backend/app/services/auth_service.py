@@ -10,7 +10,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
 from app.core.security import (
-    generate_otp, hash_otp, verify_otp_hash,
+    generate_otp, hash_otp, verify_otp_hash, seal_otp,
     generate_refresh_token, hash_refresh_token,
     create_access_token,
 )
@@ -69,10 +69,11 @@ async def send_otp(db: AsyncSession, phone: str) -> str:
     await db.flush()
     logger.info("otp.generated", phone=phone)
 
-    # Dispatch via WhatsApp Integration
-    from app.integrations.whatsapp_client import send_whatsapp_message
-    await send_whatsapp_message(to_phone=phone, otp=otp)
-    
+    # Delivered by the task workers once this transaction commits; the payload
+    # (visible to officers in /admin/tasks) only carries the OTP encrypted
+    from app.services.task_service import enqueue_task
+    await enqueue_task(db, "send_whatsapp_otp", {"phone": phone, "sealed_otp": seal_otp(otp)})
+
     return otp
 
 
@@ -0,0 +1,177 @@
+"""
+Delinquency Service — daily days-past-due (DPD) snapshots.
+
+One row per ACTIVE/DEFAULT loan per day in `delinquency_snapshots`, built with a
+single INSERT ... SELECT over the unpaid-EMI partial index. DPD counts from the
+oldest unpaid EMI due before the snapshot date:
+
+  0 → CURRENT, 1-30, 31-60, 61-90, 90+
+
+Collections and NPA reporting read the snapshot instead of scanning `emis`.
+Rebuilding a day rewrites it: rows are upserted and rows of loans that have
+since left ACTIVE/DEFAULT are deleted, in the caller's transaction.
+"""
+from datetime import date, datetime, time, timezone
+from typing import Optional
+
+from sqlalchemy import Date, Integer, case, cast, delete, exists, func, literal, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.logging_config import logger
+from app.models.credit import EMI, EMIStatus, Loan, LoanStatus
+from app.models.delinquency import DelinquencySnapshot, DPDBucket
+
+
+def _bucket_expr(dpd):
+    return cast(
+        case(
+            (dpd <= 0, DPDBucket.CURRENT.value),
+            (dpd <= 30, DPDBucket.DPD_1_30.value),
+            (dpd <= 60, DPDBucket.DPD_31_60.value),
+            (dpd <= 90, DPDBucket.DPD_61_90.value),
+            else_=DPDBucket.DPD_90_PLUS.value,
+        ),
+        DelinquencySnapshot.__table__.c.bucket.type,
+    )
+
+
+async def build_delinquency_snapshot(db: AsyncSession, as_of: Optional[date] = None) -> int:
+    """Write (or rewrite) the snapshot for `as_of` (default: today, UTC). Returns rows written."""
+    as_of = as_of or datetime.now(timezone.utc).date()
+    tracked = [LoanStatus.ACTIVE, LoanStatus.DEFAULT]
+    cutoff = datetime.combine(as_of, time.min, tzinfo=timezone.utc)
+    snapshot_day = cast(literal(as_of), Date)
+
+    overdue = (
+        select(
+            EMI.loan_id,
+            func.min(EMI.due_date).label("oldest_due_date"),
+            func.sum(EMI.amount).label("overdue_amount"),
+            func.count().label("overdue_emis"),
+        )
+        .where(EMI.status != EMIStatus.PAID, EMI.due_date < cutoff)
+        .group_by(EMI.loan_id)
+        .subquery()
+    )
+    oldest_day = cast(func.timezone("UTC", overdue.c.oldest_due_date), Date)
+    dpd = func.coalesce(cast(snapshot_day - oldest_day, Integer), 0)
+    per_loan = (
+        select(
+            Loan.id.label("loan_id"),
+            dpd.label("dpd"),
+            func.coalesce(overdue.c.overdue_amount, 0).label("overdue_amount"),
+            func.coalesce(overdue.c.overdue_emis, 0).label("overdue_emis"),
+            overdue.c.oldest_due_date,
+        )
+        .outerjoin(overdue, overdue.c.loan_id == Loan.id)
+        .where(Loan.status.in_(tracked))
+        .subquery()
+    )
+
+    stmt = pg_insert(DelinquencySnapshot).from_select(
+        ["snapshot_date", "loan_id", "dpd", "bucket", "overdue_amount", "overdue_emis", "oldest_due_date"],
+        select(
+            snapshot_day,
+            per_loan.c.loan_id,
+            per_loan.c.dpd,
+            _bucket_expr(per_loan.c.dpd),
+            per_loan.c.overdue_amount,
+            per_loan.c.overdue_emis,
+            per_loan.c.oldest_due_date,
+        ),
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["snapshot_date", "loan_id"],
+        set_={
+            "dpd": stmt.excluded.dpd,
+            "bucket": stmt.excluded.bucket,
+            "overdue_amount": stmt.excluded.overdue_amount,
+            "overdue_emis": stmt.excluded.overdue_emis,
+            "oldest_due_date": stmt.excluded.oldest_due_date,
+            "created_at": func.now(),
+        },
+    )
+    result = await db.execute(stmt)
+
+    # A same-day rebuild must not keep rows for loans closed since the earlier run
+    stale = await db.execute(
+        delete(DelinquencySnapshot)
+        .where(
+            DelinquencySnapshot.snapshot_date == as_of,
+            ~exists().where(Loan.id == DelinquencySnapshot.loan_id, Loan.status.in_(tracked)),
+        )
+        .execution_options(synchronize_session=False)
+    )
+    logger.info(
+        "delinquency.snapshot_built", snapshot_date=as_of.isoformat(), rows=result.rowcount, removed=stale.rowcount,
+    )
+    return result.rowcount
+
+
+async def _resolve_snapshot_date(db: AsyncSession, snapshot_date: Optional[date]) -> Optional[date]:
+    if snapshot_date:
+        return snapshot_date
+    result = await db.execute(select(func.max(DelinquencySnapshot.snapshot_date)))
+    return result.scalar()
+
+
+async def get_delinquency_summary(db: AsyncSession, snapshot_date: Optional[date] = None) -> dict:
+    """Loan count and overdue amount per DPD bucket for one snapshot (default: latest)."""
+    snapshot_date = await _resolve_snapshot_date(db, snapshot_date)
+    buckets = {b.value: {"loans": 0, "overdue_amount": 0.0} for b in DPDBucket}
+    if snapshot_date is None:
+        return {"snapshot_date": None, "buckets": buckets}
+
+    result = await db.execute(
+        select(
+            DelinquencySnapshot.bucket,
+            func.count().label("loans"),
+            func.coalesce(func.sum(DelinquencySnapshot.overdue_amount), 0).label("overdue_amount"),
+        )
+        .where(DelinquencySnapshot.snapshot_date == snapshot_date)
+        .group_by(DelinquencySnapshot.bucket)
+    )
+    for row in result.all():
+        buckets[row.bucket.value] = {"loans": row.loans, "overdue_amount": float(row.overdue_amount)}
+    return {"snapshot_date": snapshot_date.isoformat(), "buckets": buckets}
+
+
+async def list_delinquent_loans(
+    db: AsyncSession,
+    bucket: Optional[DPDBucket] = None,
+    snapshot_date: Optional[date] = None,
+    limit: int = 100,
+    offset: int = 0,
+) -> dict:
+    """Loans in a snapshot, most days past due first. Without `bucket`, only delinquent loans."""
+    snapshot_date = await _resolve_snapshot_date(db, snapshot_date)
+    if snapshot_date is None:
+        return {"snapshot_date": None, "loans": []}
+
+    q = (
+        select(DelinquencySnapshot)
+        .where(DelinquencySnapshot.snapshot_date == snapshot_date)
+        .order_by(DelinquencySnapshot.dpd.desc(), DelinquencySnapshot.loan_id)
+        .limit(limit)
+        .offset(offset)
+    )
+    if bucket:
+        q = q.where(DelinquencySnapshot.bucket == bucket)
+    else:
+        q = q.where(DelinquencySnapshot.bucket != DPDBucket.CURRENT)
+    result = await db.execute(q)
+    return {
+        "snapshot_date": snapshot_date.isoformat(),
+        "loans": [
+            {
+                "loan_id": str(s.loan_id),
+                "dpd": s.dpd,
+                "bucket": s.bucket,
+                "overdue_amount": float(s.overdue_amount),
+                "overdue_emis": s.overdue_emis,
+                "oldest_due_date": s.oldest_due_date.isoformat() if s.oldest_due_date else None,
+            }
+            for s in result.scalars().all()
+        ],
+    }
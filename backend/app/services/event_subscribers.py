@@ -0,0 +1,23 @@
+"""
+Outbox subscribers — in-process consumers of loan lifecycle events.
+
+Register a consumer with `@subscribe(name, *event_types)`; the name keys its
+offset row, so renaming a consumer replays the retained stream to it. Handlers
+may see an event more than once and must be idempotent.
+
+  loan_lifecycle_log  every event → one structured log line (reporting feed)
+"""
+from app.core.outbox import LoanEvent, subscribe
+from app.logging_config import logger
+
+
+@subscribe("loan_lifecycle_log")
+async def log_lifecycle_event(event: LoanEvent) -> None:
+    logger.info(
+        "loan_event.published",
+        event_id=event.id,
+        event_type=event.event_type.value,
+        aggregate_type=event.aggregate_type,
+        aggregate_id=str(event.aggregate_id),
+        payload=event.payload,
+    )
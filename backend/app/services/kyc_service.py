@@ -13,6 +13,7 @@ from fastapi import HTTPException, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core import payload_store
 from app.integrations import government_client as gov
 from app.logging_config import logger
 from app.models.business import BusinessProfile
@@ -90,7 +91,7 @@ async def run_kyc_and_onboard(
         gst_number=gst_number,
         aadhaar_number=aadhaar_number,
         pan_number=pan_number,
-        verification_snapshot=snapshot,
+        snapshot_manifest=await payload_store.put_manifest(db, snapshot),
     )
     db.add(profile)
     await db.flush()
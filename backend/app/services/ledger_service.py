@@ -1,70 +1,244 @@
 """
 Ledger Service — Double-entry bookkeeping.
+
+Postings go through a Journal: each transaction is validated (debits == credits)
+when it is added, and the whole journal is written with a single multi-row INSERT.
+
+Outside a batch, every record_* call posts its own one-transaction journal.
+Inside `ledger_batch(db)`, record_* calls only queue their legs and the batch
+is written once on exit — used by jobs that post for many loans at a time.
+
+Every post also upserts the running totals in `account_balances` and
+`loan_account_balances` in the same DB transaction, so balance reads never
+have to sum the journal.
 """
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from decimal import Decimal, ROUND_HALF_UP
+from typing import AsyncIterator
 from uuid import UUID
 
+from sqlalchemy import insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.ledger import LedgerEntry, EntryType, AccountType
+from app.logging_config import logger
+from app.models.ledger import (
+    LedgerEntry, EntryType, AccountType, AccountBalance, LoanAccountBalance,
+)
+
+_BATCH_KEY = "ledger_journal"
+_CENT = Decimal("0.01")
+
+
+class UnbalancedTransactionError(ValueError):
+    """Raised when a journal transaction's debits and credits differ."""
+
+
+def _to_money(amount) -> Decimal:
+    return Decimal(str(amount)).quantize(_CENT, rounding=ROUND_HALF_UP)
+
+
+@dataclass(frozen=True)
+class JournalLine:
+    entry_type: EntryType
+    account_type: AccountType
+    amount: float
+    description: str
+
+
+class Journal:
+    """An in-memory set of ledger transactions, written in one INSERT."""
+
+    def __init__(self) -> None:
+        self._rows: list[dict] = []
+        self.transaction_count = 0
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def add(self, loan_id: UUID, lines: list[JournalLine], memo: bool = False) -> None:
+        """
+        Queue one transaction. Balanced transactions must have equal debit and
+        credit totals. Memo postings (NPA provisioning, recovery) are single-legged
+        records and are exempt from the balance check.
+        """
+        if not lines:
+            raise UnbalancedTransactionError("Ledger transaction has no lines")
+
+        debits = sum((_to_money(l.amount) for l in lines if l.entry_type == EntryType.DEBIT), Decimal(0))
+        credits = sum((_to_money(l.amount) for l in lines if l.entry_type == EntryType.CREDIT), Decimal(0))
+        if not memo and debits != credits:
+            raise UnbalancedTransactionError(
+                f"Unbalanced ledger transaction for loan {loan_id}: debits={debits} credits={credits}"
+            )
+
+        self._rows.extend(
+            {
+                "loan_id": loan_id,
+                "entry_type": line.entry_type,
+                "account_type": line.account_type,
+                "amount": _to_money(line.amount),
+                "description": line.description,
+            }
+            for line in lines
+        )
+        self.transaction_count += 1
+
+    async def post(self, db: AsyncSession) -> int:
+        """Write all queued entries with one multi-row INSERT. Returns rows written."""
+        if not self._rows:
+            return 0
+        # Pending loans must exist before their ledger rows reference them
+        await db.flush()
+        rows, self._rows = self._rows, []
+        await db.execute(insert(LedgerEntry), rows)
+        await _apply_balances(db, rows)
+        logger.info("ledger.posted", entries=len(rows), transactions=self.transaction_count)
+        self.transaction_count = 0
+        return len(rows)
+
+
+def _totals(rows: list[dict], key) -> list[dict]:
+    """Aggregate rows into debit/credit totals, sorted by key for a stable lock order."""
+    totals: dict = {}
+    for row in rows:
+        k = key(row)
+        debit, credit = totals.get(k, (Decimal(0), Decimal(0)))
+        if row["entry_type"] == EntryType.DEBIT:
+            debit += row["amount"]
+        else:
+            credit += row["amount"]
+        totals[k] = (debit, credit)
+    return [
+        {"key": k, "debit_total": d, "credit_total": c}
+        for k, (d, c) in sorted(totals.items(), key=lambda kv: str(kv[0]))
+    ]
+
+
+async def _upsert_balances(db: AsyncSession, model, values: list[dict], index_elements: list[str]) -> None:
+    stmt = pg_insert(model).values(values)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=index_elements,
+        set_={
+            "debit_total": model.debit_total + stmt.excluded.debit_total,
+            "credit_total": model.credit_total + stmt.excluded.credit_total,
+            "updated_at": stmt.excluded.updated_at,
+        },
+    )
+    await db.execute(stmt)
+
+
+async def _apply_balances(db: AsyncSession, rows: list[dict]) -> None:
+    """Fold posted rows into the running balance tables (two upserts)."""
+    now = datetime.now(timezone.utc)
+    per_account = _totals(rows, lambda r: r["account_type"])
+    await _upsert_balances(
+        db,
+        AccountBalance,
+        [
+            {"account_type": t["key"], "debit_total": t["debit_total"],
+             "credit_total": t["credit_total"], "updated_at": now}
+            for t in per_account
+        ],
+        ["account_type"],
+    )
+    per_loan = _totals(rows, lambda r: (r["loan_id"], r["account_type"]))
+    await _upsert_balances(
+        db,
+        LoanAccountBalance,
+        [
+            {"loan_id": t["key"][0], "account_type": t["key"][1], "debit_total": t["debit_total"],
+             "credit_total": t["credit_total"], "updated_at": now}
+            for t in per_loan
+        ],
+        ["loan_id", "account_type"],
+    )
+
+
+@asynccontextmanager
+async def ledger_batch(db: AsyncSession) -> AsyncIterator[Journal]:
+    """
+    Collect every posting made on `db` inside the block and write them together.
+    Nested batches join the outermost one.
+    """
+    existing = db.info.get(_BATCH_KEY)
+    if existing is not None:
+        yield existing
+        return
+
+    journal = Journal()
+    db.info[_BATCH_KEY] = journal
+    try:
+        yield journal
+        await journal.post(db)
+    finally:
+        db.info.pop(_BATCH_KEY, None)
+
+
+async def _post(db: AsyncSession, loan_id: UUID, lines: list[JournalLine], memo: bool = False) -> None:
+    batch = db.info.get(_BATCH_KEY)
+    if batch is not None:
+        batch.add(loan_id, lines, memo=memo)
+        return
+    journal = Journal()
+    journal.add(loan_id, lines, memo=memo)
+    await journal.post(db)
 
 
 async def record_disbursement(db: AsyncSession, loan_id: UUID, amount: float) -> None:
     """Debit BANK_CAPITAL, Credit BORROWER."""
-    db.add(LedgerEntry(
-        loan_id=loan_id,
-        entry_type=EntryType.DEBIT,
-        account_type=AccountType.BANK_CAPITAL,
-        amount=amount,
-        description="Loan disbursement — bank capital debit",
-    ))
-    db.add(LedgerEntry(
-        loan_id=loan_id,
-        entry_type=EntryType.CREDIT,
-        account_type=AccountType.BORROWER,
-        amount=amount,
-        description="Loan disbursement — borrower credit",
-    ))
-    await db.flush()
+    await _post(db, loan_id, [
+        JournalLine(EntryType.DEBIT, AccountType.BANK_CAPITAL, amount, "Loan disbursement — bank capital debit"),
+        JournalLine(EntryType.CREDIT, AccountType.BORROWER, amount, "Loan disbursement — borrower credit"),
+    ])
 
 
 async def record_repayment(db: AsyncSession, loan_id: UUID, amount: float) -> None:
     """Debit BORROWER, Credit BANK_CAPITAL."""
-    db.add(LedgerEntry(
-        loan_id=loan_id,
-        entry_type=EntryType.DEBIT,
-        account_type=AccountType.BORROWER,
-        amount=amount,
-        description="EMI repayment — borrower debit",
-    ))
-    db.add(LedgerEntry(
-        loan_id=loan_id,
-        entry_type=EntryType.CREDIT,
-        account_type=AccountType.BANK_CAPITAL,
-        amount=amount,
-        description="EMI repayment — bank capital credit",
-    ))
-    await db.flush()
+    await _post(db, loan_id, [
+        JournalLine(EntryType.DEBIT, AccountType.BORROWER, amount, "EMI repayment — borrower debit"),
+        JournalLine(EntryType.CREDIT, AccountType.BANK_CAPITAL, amount, "EMI repayment — bank capital credit"),
+    ])
 
 
 async def record_provisioning(db: AsyncSession, loan_id: UUID, amount: float) -> None:
-    """NPA provisioning entry."""
-    db.add(LedgerEntry(
-        loan_id=loan_id,
-        entry_type=EntryType.DEBIT,
-        account_type=AccountType.PROVISIONING,
-        amount=amount,
-        description="NPA provisioning — loan defaulted",
-    ))
-    await db.flush()
+    """NPA provisioning entry (memo)."""
+    await _post(db, loan_id, [
+        JournalLine(EntryType.DEBIT, AccountType.PROVISIONING, amount, "NPA provisioning — loan defaulted"),
+    ], memo=True)
 
 
 async def record_recovery(db: AsyncSession, loan_id: UUID, amount: float) -> None:
-    """Recovery credit entry."""
-    db.add(LedgerEntry(
-        loan_id=loan_id,
-        entry_type=EntryType.CREDIT,
-        account_type=AccountType.RECOVERY,
-        amount=amount,
-        description="Recovery action — collateral seized",
-    ))
-    await db.flush()
+    """Recovery credit entry (memo)."""
+    await _post(db, loan_id, [
+        JournalLine(EntryType.CREDIT, AccountType.RECOVERY, amount, "Recovery action — collateral seized"),
+    ], memo=True)
+
+
+# ── Balance reads ─────────────────────────────────────────────────────────────
+
+async def get_account_balances(db: AsyncSession) -> list[AccountBalance]:
+    result = await db.execute(select(AccountBalance).order_by(AccountBalance.account_type))
+    return result.scalars().all()
+
+
+async def get_loan_balances(db: AsyncSession, loan_id: UUID) -> list[LoanAccountBalance]:
+    result = await db.execute(
+        select(LoanAccountBalance)
+        .where(LoanAccountBalance.loan_id == loan_id)
+        .order_by(LoanAccountBalance.account_type)
+    )
+    return result.scalars().all()
+
+
+async def get_loan_outstanding(db: AsyncSession, loan_id: UUID) -> float:
+    """Borrower outstanding = disbursed (BORROWER credits) − repaid (BORROWER debits)."""
+    result = await db.execute(
+        select(LoanAccountBalance.credit_total - LoanAccountBalance.debit_total).where(
+            LoanAccountBalance.loan_id == loan_id,
+            LoanAccountBalance.account_type == AccountType.BORROWER,
+        )
+    )
+    return float(result.scalar() or 0)
@@ -5,34 +5,32 @@ Covers:
 - Sanction (accept offer)
 - Collateral registration (SECURED loans)
 - Disbursement (ledger entries + status ACTIVE)
-- EMI schedule generation
+- EMI schedule generation (amortization_service)
+- Batch sanction + disbursement for operations
 """
-import math
-from datetime import datetime, timedelta, timezone
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Optional
 from uuid import UUID
 
 from fastapi import HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import select, insert, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings
 from app.core.audit import log_audit
+from app.core.outbox import emit_event
 from app.logging_config import logger
 from app.models.credit import (
     Offer, OfferStatus, Loan, LoanStatus, LoanType,
-    EMI, EMIStatus, Collateral, CollateralStatus,
+    Collateral, CollateralStatus,
 )
 from app.models.invoice import Invoice, InvoiceStatus
+from app.models.outbox import LoanEventType
 from app.models.user import User
-from app.services.ledger_service import record_disbursement
-
-
-def _calculate_emi_amount(principal: float, annual_rate: float, months: int) -> float:
-    """Standard EMI formula: P × r × (1+r)^n / ((1+r)^n - 1)"""
-    if annual_rate == 0:
-        return principal / months
-    r = annual_rate / (12 * 100)
-    emi = principal * r * (1 + r) ** months / ((1 + r) ** months - 1)
-    return round(emi, 2)
+from app.services.amortization_service import LoanTerms, insert_schedules
+from app.services.ledger_service import ledger_batch, record_disbursement
 
 
 async def sanction_loan(
@@ -118,21 +116,169 @@ async def _disburse_loan(db: AsyncSession, loan: Loan, offer: Offer) -> None:
     await record_disbursement(db, loan.id, loan.principal)
 
     # Generate EMI schedule
-    emi_amount = _calculate_emi_amount(loan.principal, offer.interest_rate, offer.tenure_months)
-    now = datetime.now(timezone.utc)
-    for i in range(1, offer.tenure_months + 1):
-        due_date = now + timedelta(days=30 * i)
-        db.add(EMI(
-            loan_id=loan.id,
-            due_date=due_date,
-            amount=emi_amount,
-            status=EMIStatus.PENDING,
-            retry_count=0,
-        ))
+    await insert_schedules(db, [LoanTerms(
+        loan_id=loan.id,
+        principal=float(loan.principal),
+        annual_rate=offer.interest_rate,
+        tenure_months=offer.tenure_months,
+        start=datetime.now(timezone.utc),
+    )])
 
     # Activate loan
     loan.status = LoanStatus.ACTIVE
     loan.disbursed_amount = loan.principal
     await db.flush()
 
+    await emit_event(db, LoanEventType.LOAN_DISBURSED, loan.id, {
+        "offer_id": offer.id, "loan_type": offer.loan_type, "principal": loan.principal,
+    })
+
     logger.info("loan.disbursed", loan_id=str(loan.id), amount=loan.principal)
+
+
+# ── Batch sanction / disbursement ─────────────────────────────────────────────
+
+@dataclass(frozen=True)
+class BatchSanctionItem:
+    offer_id: UUID
+    asset_description: Optional[str] = None
+    asset_value: Optional[float] = None
+
+
+async def sanction_loans_batch(
+    db: AsyncSession,
+    items: list[BatchSanctionItem],
+    officer: User,
+    chunk_size: int | None = None,
+) -> list[dict]:
+    """
+    Sanction and disburse many accepted offers. Offers are processed in chunks of
+    `chunk_size`; each chunk is one transaction with bulk inserts for loans,
+    collateral, ledger entries and EMI schedules. Returns one outcome per offer.
+    """
+    chunk_size = chunk_size or settings.LOAN_BATCH_CHUNK_SIZE
+    officer_id = officer.id  # officer is expired if a chunk rolls back
+    outcomes: list[dict] = []
+
+    for start in range(0, len(items), chunk_size):
+        chunk = items[start:start + chunk_size]
+        try:
+            chunk_outcomes = await _sanction_chunk(db, chunk, officer_id)
+            await db.commit()
+        except Exception as exc:
+            await db.rollback()
+            logger.error("loan.batch_chunk_failed", offers=len(chunk), error=str(exc))
+            chunk_outcomes = [
+                {"offer_id": str(item.offer_id), "status": "FAILED", "reason": "Chunk failed; nothing was disbursed"}
+                for item in chunk
+            ]
+        outcomes.extend(chunk_outcomes)
+
+    logger.info(
+        "loan.batch_disbursed",
+        requested=len(items),
+        disbursed=sum(1 for o in outcomes if o["status"] == "DISBURSED"),
+    )
+    return outcomes
+
+
+async def _sanction_chunk(db: AsyncSession, chunk: list[BatchSanctionItem], officer_id: UUID) -> list[dict]:
+    offer_ids = [item.offer_id for item in chunk]
+    # Lock the chunk's offers in one statement; offers held by a concurrent sanction are skipped
+    result = await db.execute(
+        select(Offer, Invoice.amount)
+        .join(Invoice, Invoice.id == Offer.invoice_id)
+        .where(Offer.id.in_(offer_ids))
+        .with_for_update(of=Offer, skip_locked=True)
+    )
+    found = {offer.id: (offer, invoice_amount) for offer, invoice_amount in result.all()}
+
+    now = datetime.now(timezone.utc)
+    outcomes: dict[UUID, dict] = {}
+    expired_ids: list[UUID] = []
+    seen_invoices: set[UUID] = set()
+    loan_rows, collateral_rows, terms = [], [], []
+
+    for item in chunk:
+        key = str(item.offer_id)
+        if item.offer_id in outcomes:
+            continue
+        if item.offer_id not in found:
+            outcomes[item.offer_id] = {"offer_id": key, "status": "SKIPPED", "reason": "Offer not found or locked"}
+            continue
+        offer, invoice_amount = found[item.offer_id]
+        if offer.status != OfferStatus.GENERATED:
+            outcomes[item.offer_id] = {"offer_id": key, "status": "SKIPPED", "reason": f"Offer is {offer.status}"}
+            continue
+        if offer.expires_at.replace(tzinfo=timezone.utc) < now:
+            expired_ids.append(offer.id)
+            outcomes[item.offer_id] = {"offer_id": key, "status": "SKIPPED", "reason": "Offer has expired"}
+            continue
+        if offer.invoice_id in seen_invoices:
+            outcomes[item.offer_id] = {"offer_id": key, "status": "SKIPPED", "reason": "Invoice already financed in this batch"}
+            continue
+        if offer.loan_type == LoanType.SECURED and (not item.asset_description or not item.asset_value):
+            outcomes[item.offer_id] = {"offer_id": key, "status": "SKIPPED", "reason": "Collateral details required for SECURED loan"}
+            continue
+
+        seen_invoices.add(offer.invoice_id)
+        loan_id = uuid.uuid4()
+        principal = float(invoice_amount) * (offer.percentage / 100)
+        loan_rows.append({
+            "id": loan_id,
+            "offer_id": offer.id,
+            "status": LoanStatus.ACTIVE,
+            "principal": principal,
+            "disbursed_amount": principal,
+        })
+        if offer.loan_type == LoanType.SECURED:
+            collateral_rows.append({
+                "loan_id": loan_id,
+                "asset_description": item.asset_description,
+                "asset_value": item.asset_value,
+                "status": CollateralStatus.PLEDGED,
+            })
+        terms.append(LoanTerms(
+            loan_id=loan_id,
+            principal=principal,
+            annual_rate=offer.interest_rate,
+            tenure_months=offer.tenure_months,
+            start=now,
+        ))
+        outcomes[item.offer_id] = {
+            "offer_id": key, "status": "DISBURSED", "loan_id": str(loan_id), "principal": principal,
+        }
+
+    if expired_ids:
+        await db.execute(update(Offer).where(Offer.id.in_(expired_ids)).values(status=OfferStatus.EXPIRED))
+
+    if loan_rows:
+        await db.execute(insert(Loan), loan_rows)
+        await db.execute(
+            update(Offer)
+            .where(Offer.id.in_([row["offer_id"] for row in loan_rows]))
+            .values(status=OfferStatus.ACCEPTED)
+        )
+        if collateral_rows:
+            await db.execute(insert(Collateral), collateral_rows)
+        async with ledger_batch(db):
+            for row in loan_rows:
+                await record_disbursement(db, row["id"], row["principal"])
+        await insert_schedules(db, terms)
+        offers = {offer.id: offer for offer, _ in found.values()}
+        for row in loan_rows:
+            await emit_event(db, LoanEventType.LOAN_DISBURSED, row["id"], {
+                "offer_id": row["offer_id"],
+                "loan_type": offers[row["offer_id"]].loan_type,
+                "principal": row["principal"],
+            })
+            await log_audit(
+                db,
+                actor_id=officer_id,
+                action="LOAN_SANCTIONED_AND_DISBURSED",
+                entity_type="Loan",
+                entity_id=str(row["id"]),
+                new_value={"status": LoanStatus.ACTIVE, "principal": row["principal"], "batch": True},
+            )
+
+    return [outcomes[item_id] for item_id in dict.fromkeys(offer_ids)]
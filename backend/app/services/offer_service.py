@@ -18,10 +18,12 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.audit import log_audit
+from app.core.outbox import emit_event
 from app.logging_config import logger
 from app.models.business import BusinessProfile
 from app.models.credit import CreditScore, Offer, RiskGrade, LoanType, OfferStatus
 from app.models.invoice import Invoice, InvoiceStatus
+from app.models.outbox import LoanEventType
 from app.models.user import User
 from app.services.credit_decision import evaluate_credit_decision, CreditDecision
 from app.services.exposure_service import check_exposure_caps
@@ -130,6 +132,14 @@ async def generate_offers_for_invoice(
         old_value=InvoiceStatus.UNPAID,
         new_value=InvoiceStatus.OFFER_GENERATED,
     )
+    await emit_event(db, LoanEventType.OFFER_GENERATED, invoice_id, {
+        "business_id": invoice.business_id,
+        "risk_grade": credit_score.risk_grade,
+        "offers": [
+            {"offer_id": o.id, "loan_type": o.loan_type, "interest_rate": o.interest_rate}
+            for o in (unsecured_offer, secured_offer)
+        ],
+    }, aggregate_type="Invoice")
 
     logger.info(
         "offer.generated",
@@ -0,0 +1,182 @@
+"""
+Partition Service — monthly range partitions for append-only tables.
+
+`audit_logs` and `ledger_entries` are partitioned by RANGE (timestamp), one
+partition per calendar month named `<table>_yYYYYmMM`, plus a DEFAULT partition
+as a safety net. Partitions are created ahead of time; partitions older than the
+table's retention window are detached and moved to the archive schema, where
+they stay queryable but are no longer scanned by the live table.
+
+Partition DDL runs under a transaction-level advisory lock, so API workers
+starting together and the daily job take turns instead of racing on
+CREATE TABLE ... PARTITION OF; whoever goes second finds the partitions made.
+Being transaction-scoped, the lock is held and released on the same backend
+behind the PgBouncer transaction pooler.
+"""
+import re
+from datetime import date, datetime, timezone
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from app.config import settings
+from app.logging_config import logger
+
+
+_DDL_LOCK_KEY = "partition_ddl"
+
+
+async def _lock_partition_ddl(db: AsyncSession | AsyncConnection) -> None:
+    await db.execute(text("SELECT pg_advisory_xact_lock(hashtext(:key))"), {"key": _DDL_LOCK_KEY})
+
+
+def _retention_months() -> dict[str, int]:
+    """Partitioned tables → retention in months (0 keeps every partition attached)."""
+    return {
+        "audit_logs": settings.AUDIT_LOG_RETENTION_MONTHS,
+        "ledger_entries": settings.LEDGER_ENTRY_RETENTION_MONTHS,
+    }
+
+
+def _add_months(d: date, months: int) -> date:
+    index = d.year * 12 + (d.month - 1) + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(table: str, month: date) -> str:
+    return f"{table}_y{month.year:04d}m{month.month:02d}"
+
+
+def _parse_partition_month(table: str, name: str) -> date | None:
+    match = re.fullmatch(rf"{table}_y(\d{{4}})m(\d{{2}})", name)
+    if not match:
+        return None
+    return date(int(match.group(1)), int(match.group(2)), 1)
+
+
+async def list_partitions(db: AsyncSession | AsyncConnection, table: str) -> list[str]:
+    result = await db.execute(
+        text("""
+            SELECT c.relname
+            FROM pg_inherits i
+            JOIN pg_class c ON c.oid = i.inhrelid
+            JOIN pg_class p ON p.oid = i.inhparent
+            WHERE p.relname = :table
+            ORDER BY c.relname
+        """),
+        {"table": table},
+    )
+    return [row[0] for row in result.all()]
+
+
+async def _create_month_partition(
+    db: AsyncSession | AsyncConnection,
+    table: str,
+    name: str,
+    start: date,
+    end: date,
+) -> None:
+    """
+    Create one month's partition. If maintenance fell behind and that month's rows
+    already landed in the DEFAULT partition, CREATE ... PARTITION OF would fail on
+    them, so the partition is built as a plain table, the rows are moved out of
+    DEFAULT into it, and it is then attached.
+    """
+    bounds = f"FROM ('{start.isoformat()} 00:00:00+00') TO ('{end.isoformat()} 00:00:00+00')"
+    in_range = f"timestamp >= '{start.isoformat()} 00:00:00+00' AND timestamp < '{end.isoformat()} 00:00:00+00'"
+    stranded = await db.scalar(text(f"SELECT EXISTS (SELECT 1 FROM {table}_default WHERE {in_range})"))
+    if not stranded:
+        await db.execute(text(f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {table} FOR VALUES {bounds}"))
+        return
+
+    await db.execute(text(f"CREATE TABLE {name} (LIKE {table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"))
+    moved = await db.execute(text(
+        f"WITH moved AS (DELETE FROM {table}_default WHERE {in_range} RETURNING *) "
+        f"INSERT INTO {name} SELECT * FROM moved"
+    ))
+    # Attaching builds the partition's share of the table's indexes and foreign keys
+    await db.execute(text(f"ALTER TABLE {table} ATTACH PARTITION {name} FOR VALUES {bounds}"))
+    logger.warning("partitions.default_rows_moved", table=table, partition=name, rows=moved.rowcount)
+
+
+async def ensure_monthly_partitions(
+    db: AsyncSession | AsyncConnection,
+    table: str,
+    months_ahead: int | None = None,
+) -> list[str]:
+    """
+    Create the current month's partition, `months_ahead` future ones and any month
+    that has rows stranded in DEFAULT. Returns new names.
+    """
+    months_ahead = settings.PARTITION_MONTHS_AHEAD if months_ahead is None else months_ahead
+    existing = set(await list_partitions(db, table))
+    created = []
+
+    if f"{table}_default" not in existing:
+        await db.execute(text(f"CREATE TABLE IF NOT EXISTS {table}_default PARTITION OF {table} DEFAULT"))
+        created.append(f"{table}_default")
+
+    this_month = datetime.now(timezone.utc).date().replace(day=1)
+    months = {_add_months(this_month, offset) for offset in range(months_ahead + 1)}
+    if f"{table}_default" in existing:
+        # Months whose rows fell into DEFAULT while maintenance was behind get their partition too
+        result = await db.execute(text(
+            f"SELECT DISTINCT date_trunc('month', timestamp AT TIME ZONE 'UTC')::date FROM {table}_default"
+        ))
+        months.update(row[0] for row in result.all())
+    for start in sorted(months):
+        name = partition_name(table, start)
+        if name in existing:
+            continue
+        await _create_month_partition(db, table, name, start, _add_months(start, 1))
+        created.append(name)
+
+    if created:
+        logger.info("partitions.created", table=table, partitions=created)
+    return created
+
+
+async def archive_old_partitions(
+    db: AsyncSession | AsyncConnection,
+    table: str,
+    retention_months: int,
+) -> list[str]:
+    """
+    Detach monthly partitions that end before the retention window and move them
+    to the archive schema. Returns the archived partition names.
+    """
+    if retention_months <= 0:
+        return []
+
+    cutoff = _add_months(datetime.now(timezone.utc).date().replace(day=1), -retention_months)
+    schema = settings.PARTITION_ARCHIVE_SCHEMA
+    archived = []
+    for name in await list_partitions(db, table):
+        month = _parse_partition_month(table, name)
+        if month is None or _add_months(month, 1) > cutoff:
+            continue
+        await db.execute(text(f"CREATE SCHEMA IF NOT EXISTS {schema}"))
+        await db.execute(text(f"ALTER TABLE {table} DETACH PARTITION {name}"))
+        await db.execute(text(f"ALTER TABLE {name} SET SCHEMA {schema}"))
+        archived.append(name)
+
+    if archived:
+        logger.info("partitions.archived", table=table, partitions=archived, schema=schema)
+    return archived
+
+
+async def ensure_all_partitions(db: AsyncSession | AsyncConnection) -> None:
+    await _lock_partition_ddl(db)
+    for table in _retention_months():
+        await ensure_monthly_partitions(db, table)
+
+
+async def run_partition_maintenance(db: AsyncSession | AsyncConnection) -> dict:
+    await _lock_partition_ddl(db)
+    summary = {}
+    for table, retention in _retention_months().items():
+        summary[table] = {
+            "created": await ensure_monthly_partitions(db, table),
+            "archived": await archive_old_partitions(db, table, retention),
+        }
+    return summary
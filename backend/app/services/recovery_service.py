@@ -9,8 +9,10 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.audit import log_audit
+from app.core.outbox import emit_event
 from app.logging_config import logger
 from app.models.credit import Loan, LoanStatus
+from app.models.outbox import LoanEventType
 from app.models.recovery import RecoveryAction, RecoveryActionType, RecoveryStatus
 from app.models.user import User
 from app.services.ledger_service import record_recovery
@@ -51,6 +53,9 @@ async def initiate_recovery(
         entity_id=str(loan_id),
         new_value={"action_type": action_type, "recovery_id": str(recovery.id)},
     )
+    await emit_event(db, LoanEventType.RECOVERY_INITIATED, loan_id, {
+        "recovery_id": recovery.id, "action_type": action_type,
+    })
     logger.info("recovery.initiated", loan_id=str(loan_id), action_type=action_type)
     return recovery
 
@@ -75,6 +80,9 @@ async def complete_recovery(
 
     # Record recovery ledger entry
     await record_recovery(db, recovery.loan_id, amount_recovered)
+    await emit_event(db, LoanEventType.RECOVERY_COMPLETED, recovery.loan_id, {
+        "recovery_id": recovery_id, "amount_recovered": amount_recovered,
+    })
 
     await log_audit(
         db,
@@ -3,6 +3,7 @@ Repayment & Default Service
 
 EMI lifecycle: PENDING → PAID | BOUNCED
 Default handling: loan DEFAULT, collateral SEIZED, provisioning ledger
+Bulk bounces (mandate return files) default loans set-based.
 """
 from datetime import datetime, timezone
 from uuid import UUID
@@ -12,13 +13,18 @@ from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.audit import log_audit
+from app.core.outbox import emit_event
+from app.core.timing import stage_timer
 from app.logging_config import logger
 from app.models.credit import (
     EMI, EMIStatus, Loan, LoanStatus, Collateral, CollateralStatus, Offer
 )
 from app.models.invoice import Invoice, InvoiceStatus
+from app.models.outbox import LoanEventType
 from app.models.user import User
-from app.services.ledger_service import record_repayment, record_provisioning, record_recovery
+from app.services.ledger_service import (
+    ledger_batch, record_repayment, record_provisioning, record_recovery,
+)
 
 MAX_EMI_RETRIES = 2
 
@@ -39,6 +45,7 @@ async def pay_emi(db: AsyncSession, emi_id: UUID, user: User) -> EMI:
     await db.flush()
 
     await record_repayment(db, emi.loan_id, float(emi.amount))
+    await emit_event(db, LoanEventType.EMI_PAID, emi.loan_id, {"emi_id": emi.id, "amount": emi.amount})
 
     # Check if all EMIs paid → close loan
     await _check_loan_closure(db, emi.loan_id)
@@ -59,6 +66,9 @@ async def bounce_emi(db: AsyncSession, emi_id: UUID) -> EMI:
     emi.status = EMIStatus.BOUNCED
     emi.retry_count += 1
     await db.flush()
+    await emit_event(db, LoanEventType.EMI_BOUNCED, emi.loan_id, {
+        "emi_id": emi.id, "retry_count": emi.retry_count,
+    })
 
     if emi.retry_count >= MAX_EMI_RETRIES:
         await _trigger_default(db, emi.loan_id)
@@ -66,80 +76,164 @@ async def bounce_emi(db: AsyncSession, emi_id: UUID) -> EMI:
     return emi
 
 
+async def bounce_emis(
+    db: AsyncSession,
+    emi_ids: list[UUID],
+    timings: dict[str, float] | None = None,
+) -> dict:
+    """
+    Bounce many EMIs at once. `retry_count` is incremented with one UPDATE;
+    loans whose EMIs reach MAX_EMI_RETRIES are defaulted via `_trigger_defaults`.
+    PAID and unknown EMIs are skipped and reported.
+    """
+    timings = {} if timings is None else timings
+    emi_ids = list(dict.fromkeys(emi_ids))
+
+    with stage_timer(timings, "bounce_emis"):
+        result = await db.execute(
+            update(EMI)
+            .where(EMI.id.in_(emi_ids), EMI.status != EMIStatus.PAID)
+            .values(status=EMIStatus.BOUNCED, retry_count=EMI.retry_count + 1)
+            .returning(EMI.id, EMI.loan_id, EMI.retry_count)
+        )
+        bounced = result.all()
+    for row in bounced:
+        await emit_event(db, LoanEventType.EMI_BOUNCED, row.loan_id, {
+            "emi_id": row.id, "retry_count": row.retry_count,
+        })
+
+    skipped = []
+    bounced_ids = {row.id for row in bounced}
+    missing = [emi_id for emi_id in emi_ids if emi_id not in bounced_ids]
+    if missing:
+        with stage_timer(timings, "classify_skipped"):
+            result = await db.execute(select(EMI.id).where(EMI.id.in_(missing)))
+            paid = set(result.scalars().all())
+        skipped = [
+            {"emi_id": str(emi_id), "reason": "ALREADY_PAID" if emi_id in paid else "UNKNOWN_EMI"}
+            for emi_id in missing
+        ]
+
+    crossing = list({row.loan_id for row in bounced if row.retry_count >= MAX_EMI_RETRIES})
+    defaulted = await _trigger_defaults(db, crossing, timings)
+
+    logger.info(
+        "emi.bounced_bulk",
+        bounced=len(bounced),
+        skipped=len(skipped),
+        loans_defaulted=len(defaulted),
+        timings_ms=timings,
+    )
+    return {
+        "bounced": len(bounced),
+        "skipped": skipped,
+        "loans_defaulted": [str(loan_id) for loan_id in defaulted],
+        "timings_ms": timings,
+    }
+
+
 async def _check_loan_closure(db: AsyncSession, loan_id: UUID) -> None:
     """Close loan if all EMIs are paid."""
+    await _close_paid_off_loans(db, [loan_id])
+
+
+async def _close_paid_off_loans(db: AsyncSession, loan_ids: list[UUID]) -> list[UUID]:
+    """
+    Close every loan in `loan_ids` that has no unpaid EMI and mark its financed
+    invoice REPAID — one statement, using the (loan_id, status) EMI index for
+    the EXISTS probe. Returns the ids of loans that were closed.
+    """
+    if not loan_ids:
+        return []
+    unpaid = (
+        select(EMI.id)
+        .where(EMI.loan_id == Loan.id, EMI.status != EMIStatus.PAID)
+        .exists()
+    )
+    closed = (
+        update(Loan)
+        .where(Loan.id.in_(loan_ids), Loan.status != LoanStatus.CLOSED, ~unpaid)
+        .values(status=LoanStatus.CLOSED)
+        .returning(Loan.id, Loan.offer_id)
+        .cte("closed_loans")
+    )
     result = await db.execute(
-        select(EMI).where(EMI.loan_id == loan_id, EMI.status != EMIStatus.PAID)
+        update(Invoice)
+        .where(Invoice.id == Offer.invoice_id, Offer.id == closed.c.offer_id)
+        .values(status=InvoiceStatus.REPAID)
+        .returning(closed.c.id)
     )
-    pending = result.scalars().all()
-    if not pending:
-        await db.execute(
-            update(Loan).where(Loan.id == loan_id).values(status=LoanStatus.CLOSED)
-        )
-        # Mark related invoice as REPAID
-        await _mark_invoice_repaid(db, loan_id)
+    closed_ids = list(result.scalars().all())
+    for loan_id in closed_ids:
         logger.info("loan.closed", loan_id=str(loan_id))
-
-
-async def _mark_invoice_repaid(db: AsyncSession, loan_id: UUID) -> None:
-    """Mark the financed invoice as REPAID."""
-    loan_result = await db.execute(select(Loan).where(Loan.id == loan_id))
-    loan = loan_result.scalar_one_or_none()
-    if not loan:
-        return
-    offer_result = await db.execute(select(Offer).where(Offer.id == loan.offer_id))
-    offer = offer_result.scalar_one_or_none()
-    if not offer:
-        return
-    await db.execute(
-        update(Invoice).where(Invoice.id == offer.invoice_id).values(status=InvoiceStatus.REPAID)
-    )
-    await db.flush()
+        await emit_event(db, LoanEventType.LOAN_CLOSED, loan_id)
+    return closed_ids
 
 
 async def _trigger_default(db: AsyncSession, loan_id: UUID) -> None:
     """Handle loan default: status, invoice, collateral, provisioning."""
-    # Default loan
-    await db.execute(
-        update(Loan).where(Loan.id == loan_id).values(status=LoanStatus.DEFAULT)
-    )
-
-    # Get loan to check collateral
-    loan_result = await db.execute(select(Loan).where(Loan.id == loan_id))
-    loan = loan_result.scalar_one_or_none()
-    if not loan:
-        return
+    await _trigger_defaults(db, [loan_id])
+
+
+async def _trigger_defaults(
+    db: AsyncSession,
+    loan_ids: list[UUID],
+    timings: dict[str, float] | None = None,
+) -> list[UUID]:
+    """
+    Default every non-defaulted, non-closed loan in `loan_ids` set-based: one
+    UPDATE per table (loans, invoices, collateral), one ledger journal for all
+    provisioning/recovery postings. Returns the ids of loans defaulted.
+    """
+    timings = {} if timings is None else timings
+    if not loan_ids:
+        return []
+
+    with stage_timer(timings, "default_loans"):
+        result = await db.execute(
+            update(Loan)
+            .where(Loan.id.in_(loan_ids), Loan.status.notin_([LoanStatus.DEFAULT, LoanStatus.CLOSED]))
+            .values(status=LoanStatus.DEFAULT)
+            .returning(Loan.id, Loan.offer_id, Loan.disbursed_amount)
+        )
+        defaulted = result.all()
+    if not defaulted:
+        return []
+    defaulted_ids = [row.id for row in defaulted]
 
-    # Mark invoice DEFAULTED
-    offer_result = await db.execute(select(Offer).where(Offer.id == loan.offer_id))
-    offer = offer_result.scalar_one_or_none()
-    if offer:
+    with stage_timer(timings, "default_invoices"):
         await db.execute(
-            update(Invoice).where(Invoice.id == offer.invoice_id).values(status=InvoiceStatus.DEFAULTED)
+            update(Invoice)
+            .where(Invoice.id == Offer.invoice_id, Offer.id.in_([row.offer_id for row in defaulted]))
+            .values(status=InvoiceStatus.DEFAULTED)
         )
 
-    # Seize collateral if SECURED
-    coll_result = await db.execute(
-        select(Collateral).where(
-            Collateral.loan_id == loan_id,
-            Collateral.status == CollateralStatus.PLEDGED,
+    with stage_timer(timings, "seize_collateral"):
+        result = await db.execute(
+            update(Collateral)
+            .where(Collateral.loan_id.in_(defaulted_ids), Collateral.status == CollateralStatus.PLEDGED)
+            .values(status=CollateralStatus.SEIZED)
+            .returning(Collateral.loan_id, Collateral.asset_value)
         )
-    )
-    collaterals = coll_result.scalars().all()
-    total_recovery = 0.0
-    for col in collaterals:
-        col.status = CollateralStatus.SEIZED
-        total_recovery += float(col.asset_value)
-
-    await db.flush()
-
-    # Provisioning and recovery ledger entries
-    await record_provisioning(db, loan_id, float(loan.disbursed_amount))
-    if total_recovery > 0:
-        await record_recovery(db, loan_id, total_recovery)
-
-    logger.warning("loan.defaulted", loan_id=str(loan_id), recovery_value=total_recovery)
-    await log_audit(
-        db, actor_id=None, action="LOAN_DEFAULTED", entity_type="Loan",
-        entity_id=str(loan_id), new_value={"status": LoanStatus.DEFAULT}
-    )
+        recovery: dict[UUID, float] = {}
+        for loan_id, asset_value in result.all():
+            recovery[loan_id] = recovery.get(loan_id, 0.0) + float(asset_value)
+
+    with stage_timer(timings, "ledger"):
+        async with ledger_batch(db):
+            for row in defaulted:
+                await record_provisioning(db, row.id, float(row.disbursed_amount))
+                if recovery.get(row.id, 0.0) > 0:
+                    await record_recovery(db, row.id, recovery[row.id])
+
+    with stage_timer(timings, "audit"):
+        for loan_id in defaulted_ids:
+            logger.warning("loan.defaulted", loan_id=str(loan_id), recovery_value=recovery.get(loan_id, 0.0))
+            await emit_event(db, LoanEventType.LOAN_DEFAULTED, loan_id, {
+                "collateral_seized_value": recovery.get(loan_id, 0.0),
+            })
+            await log_audit(
+                db, actor_id=None, action="LOAN_DEFAULTED", entity_type="Loan",
+                entity_id=str(loan_id), new_value={"status": LoanStatus.DEFAULT}
+            )
+    return defaulted_ids
@@ -0,0 +1,192 @@
+"""
+KYC Re-verification Service — periodic GST / PAN re-checks of onboarded businesses.
+
+Businesses are processed in id order, KYC_REVERIFY_CHUNK_SIZE at a time:
+1. Load the chunk's id, GSTIN, PAN and snapshot (keyset pagination on id)
+2. Resolve every GSTIN and PAN with `government_client.bulk_lookup` — one cache
+   read, bounded-concurrency API calls, one cache upsert per lookup kind
+3. Point each snapshot manifest at the refreshed `gst` / `pan` payloads and
+   stamp `reverified_at` with one bulk UPDATE; GST or PAN status changes are
+   audited. Rows still carrying an inline snapshot are moved to payload_blobs
+4. Commit the chunk together with the job checkpoint
+
+A crashed or redeployed run resumes after the last committed chunk; a full
+pass clears the checkpoint. `reverify_gstins` re-checks an explicit list of
+GSTINs (queued by admins as a `reverify_businesses` task), also committing
+chunk by chunk.
+"""
+from datetime import datetime, timezone
+from typing import Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy import null, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.core import payload_store
+from app.core.audit import log_audit
+from app.database import AsyncSessionLocal
+from app.integrations import government_client as gov
+from app.jobs.runner import clear_checkpoint, load_checkpoint, save_checkpoint
+from app.logging_config import logger
+from app.models.business import BusinessProfile
+
+JOB_ID = "kyc_reverify"
+
+_COLUMNS = (
+    BusinessProfile.id,
+    BusinessProfile.gst_number,
+    BusinessProfile.pan_number,
+    BusinessProfile.snapshot_manifest,
+    BusinessProfile.verification_snapshot,
+)
+_CHECKS = ("gst", "pan")
+
+
+def _status(payload: Optional[dict]) -> Optional[str]:
+    return payload.get("status") if isinstance(payload, dict) else None
+
+
+async def _reverify_rows(db: AsyncSession, rows: Sequence) -> dict[str, int]:
+    """Re-check one chunk of businesses and update their snapshot manifests (no commit)."""
+    results = {
+        "gst": await gov.bulk_lookup(db, "gst", [row.gst_number for row in rows]),
+        "pan": await gov.bulk_lookup(db, "pan", [row.pan_number for row in rows]),
+    }
+
+    # Rows still holding an inline snapshot move to payload_blobs as they are re-verified
+    manifests = {row.id: dict(row.snapshot_manifest or {}) for row in rows}
+    legacy_sections = [
+        (row.id, name, payload)
+        for row in rows if row.snapshot_manifest is None and row.verification_snapshot
+        for name, payload in row.verification_snapshot.items() if isinstance(payload, dict)
+    ]
+    legacy_hashes = await payload_store.put_many(db, [payload for _, _, payload in legacy_sections])
+    for (business_id, name, _), digest in zip(legacy_sections, legacy_hashes):
+        manifests[business_id][name] = digest
+    known = {digest: payload for (_, _, payload), digest in zip(legacy_sections, legacy_hashes)}
+
+    counts = {"verified": 0, "failed": 0, "changed": 0}
+    verified = []
+    for row in rows:
+        gst_data = results["gst"].get(row.gst_number)
+        pan_data = results["pan"].get(row.pan_number)
+        if isinstance(gst_data, Exception) or isinstance(pan_data, Exception):
+            counts["failed"] += 1
+            error = gst_data if isinstance(gst_data, Exception) else pan_data
+            logger.warning("kyc.reverification_failed", business_id=str(row.id), error=str(error))
+            continue
+        verified.append((row, {"gst": gst_data, "pan": pan_data}))
+
+    new_hashes = iter(await payload_store.put_many(
+        db, [payloads[check] for _, payloads in verified for check in _CHECKS]
+    ))
+    pending = []
+    for row, payloads in verified:
+        manifest = manifests[row.id]
+        for check in _CHECKS:
+            digest = next(new_hashes)
+            if manifest.get(check) != digest:
+                pending.append((row.id, check, manifest.get(check), payloads[check]))
+            manifest[check] = digest
+
+    # Old payloads are only needed where the hash moved; fetch them in one query
+    previous = await payload_store.get_many(db, [old for _, _, old, _ in pending if old and old not in known])
+    previous.update(known)
+    for business_id, check, old_digest, payload in pending:
+        old_status, new_status = _status(previous.get(old_digest)), _status(payload)
+        if old_status and new_status and old_status != new_status:
+            counts["changed"] += 1
+            logger.warning(
+                "kyc.reverification_status_changed", business_id=str(business_id),
+                check=check, old_status=old_status, new_status=new_status,
+            )
+            await log_audit(
+                db,
+                actor_id=None,
+                action=f"KYC_{check.upper()}_STATUS_CHANGED",
+                entity_type="BusinessProfile",
+                entity_id=str(business_id),
+                old_value=old_status,
+                new_value=new_status,
+            )
+
+    now = datetime.now(timezone.utc)
+    updates = [{"id": row.id, "snapshot_manifest": manifests[row.id], "reverified_at": now} for row, _ in verified]
+    counts["verified"] = len(updates)
+    if updates:
+        # ORM bulk UPDATE by primary key: one executemany for the whole chunk
+        await db.execute(update(BusinessProfile), updates)
+    migrated = [row.id for row, _ in verified if row.verification_snapshot is not None]
+    if migrated:
+        # SQL NULL rather than a JSON 'null' document
+        await db.execute(
+            update(BusinessProfile).where(BusinessProfile.id.in_(migrated)).values(verification_snapshot=null())
+        )
+    return counts
+
+
+async def reverify_all_businesses(chunk_size: Optional[int] = None) -> int:
+    """
+    One pass over every business, resuming from the job checkpoint.
+    Returns the number of businesses re-checked in this run.
+    """
+    chunk_size = chunk_size or settings.KYC_REVERIFY_CHUNK_SIZE
+    async with AsyncSessionLocal() as db:
+        state = await load_checkpoint(db, JOB_ID) or {}
+    after_id = UUID(state["after_id"]) if state.get("after_id") else None
+    totals = {key: state.get(key, 0) for key in ("verified", "failed", "changed")}
+    if after_id:
+        logger.info("kyc.reverification_resumed", after_id=str(after_id), **totals)
+
+    processed = 0
+    while True:
+        async with AsyncSessionLocal() as db:
+            stmt = select(*_COLUMNS).order_by(BusinessProfile.id).limit(chunk_size)
+            if after_id is not None:
+                stmt = stmt.where(BusinessProfile.id > after_id)
+            rows = (await db.execute(stmt)).all()
+            if not rows:
+                await clear_checkpoint(db, JOB_ID)
+                await db.commit()
+                break
+
+            counts = await _reverify_rows(db, rows)
+            after_id = rows[-1].id
+            for key, value in counts.items():
+                totals[key] += value
+            await save_checkpoint(db, JOB_ID, {"after_id": str(after_id), **totals})
+            await db.commit()
+
+        processed += len(rows)
+        logger.info("kyc.reverification_chunk", processed=processed, after_id=str(after_id), **counts)
+
+    logger.info("kyc.reverification_complete", processed=processed, **totals)
+    return processed
+
+
+async def reverify_gstins(gst_numbers: list[str], chunk_size: Optional[int] = None) -> dict[str, int]:
+    """
+    Re-check the businesses behind an explicit list of GSTINs. Each chunk is its
+    own transaction, so a failure keeps the chunks already committed; a retry
+    re-reads their lookups from gov_cache instead of calling the API again.
+    """
+    chunk_size = chunk_size or settings.KYC_REVERIFY_CHUNK_SIZE
+    totals = {"requested": len(gst_numbers), "found": 0, "verified": 0, "failed": 0, "changed": 0}
+    unique = list(dict.fromkeys(gst_numbers))
+    for start in range(0, len(unique), chunk_size):
+        chunk = unique[start:start + chunk_size]
+        async with AsyncSessionLocal() as db:
+            rows = (
+                await db.execute(select(*_COLUMNS).where(BusinessProfile.gst_number.in_(chunk)))
+            ).all()
+            totals["found"] += len(rows)
+            if not rows:
+                continue
+            counts = await _reverify_rows(db, rows)
+            await db.commit()
+        for key, value in counts.items():
+            totals[key] += value
+        logger.info("kyc.reverification_chunk", processed=start + len(chunk), **counts)
+    logger.info("kyc.reverification_gstins", **totals)
+    return totals
@@ -0,0 +1,302 @@
+"""
+Settlement Service — bulk repayment and bounce ingestion from bank files.
+
+Settlement files (credits) flow:
+1. Stream the file line by line (CSV or fixed-width), reading off the event loop
+2. Group parsed lines into batches of SETTLEMENT_BATCH_SIZE
+3. Per batch, in one transaction:
+   - lock the referenced EMIs with one SELECT ... FOR UPDATE
+   - match lines to unpaid EMIs (amount must equal the EMI amount)
+   - mark matched EMIs PAID with one UPDATE
+   - post all repayments as one ledger journal
+   - close paid-off loans set-based
+4. Return a reconciliation report with every unmatched line and its reason
+
+ECS/NACH return files (bounces) are batched the same way and applied through
+`repayment_service.bounce_emis`; the report carries per-stage timings.
+
+File layouts:
+  Settlement CSV:         header `emi_id,amount,reference,value_date`
+  Settlement fixed-width: emi_id [0:36] amount [36:51] reference [51:81] value_date [81:91]
+  Return CSV:             header `emi_id,return_code,reference`
+  Return fixed-width:     emi_id [0:36] return_code [36:40] reference [40:70]
+"""
+from decimal import Decimal, InvalidOperation
+from typing import BinaryIO
+from uuid import UUID
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.core.audit import log_audit
+from app.core.outbox import emit_event
+from app.core.timing import stage_timer
+from app.logging_config import logger
+from app.models.credit import EMI, EMIStatus
+from app.models.outbox import LoanEventType
+from app.models.user import User
+from app.services.file_ingest import (
+    FileFormat, FixedWidthField, RecordError, iter_records, record_chunks, text_lines,
+)
+from app.services.ledger_service import ledger_batch, record_repayment
+from app.services.repayment_service import _close_paid_off_loans, bounce_emis
+
+SETTLEMENT_FIELDS = [
+    FixedWidthField("emi_id", 0, 36),
+    FixedWidthField("amount", 36, 51),
+    FixedWidthField("reference", 51, 81),
+    FixedWidthField("value_date", 81, 91),
+]
+
+RETURN_FIELDS = [
+    FixedWidthField("emi_id", 0, 36),
+    FixedWidthField("return_code", 36, 40),
+    FixedWidthField("reference", 40, 70),
+]
+
+_CENT = Decimal("0.01")
+
+
+class _FileReport:
+    def __init__(self) -> None:
+        self.total_lines = 0
+        self.unmatched: list[dict] = []
+
+    def reject(self, line_no: int, reason: str, emi_id: str | None = None, reference: str | None = None) -> None:
+        self.unmatched.append({
+            "line": line_no,
+            "emi_id": emi_id,
+            "reference": reference,
+            "reason": reason,
+        })
+
+
+class SettlementReport(_FileReport):
+    def __init__(self) -> None:
+        super().__init__()
+        self.matched = 0
+        self.amount_applied = Decimal(0)
+        self.loans_closed = 0
+
+    def as_dict(self) -> dict:
+        return {
+            "total_lines": self.total_lines,
+            "matched": self.matched,
+            "unmatched_count": len(self.unmatched),
+            "amount_applied": float(self.amount_applied),
+            "loans_closed": self.loans_closed,
+            "unmatched": self.unmatched,
+        }
+
+
+async def import_settlement_file(
+    db: AsyncSession,
+    stream: BinaryIO,
+    fmt: FileFormat,
+    actor: User,
+    batch_size: int | None = None,
+) -> dict:
+    """Apply a settlement file and return its reconciliation report."""
+    batch_size = batch_size or settings.SETTLEMENT_BATCH_SIZE
+    actor_id = actor.id
+    report = SettlementReport()
+    seen: set[UUID] = set()
+    batch: list[tuple[int, UUID, Decimal, str]] = []
+
+    records = iter_records(text_lines(stream), fmt, SETTLEMENT_FIELDS)
+    async for chunk in record_chunks(records, batch_size):
+        for line_no, record in chunk:
+            report.total_lines += 1
+            if isinstance(record, RecordError):
+                report.reject(line_no, f"PARSE_ERROR: {record.reason}")
+                continue
+            reference = record["reference"] or None
+            try:
+                emi_id = UUID(record["emi_id"])
+            except ValueError:
+                report.reject(line_no, "PARSE_ERROR: invalid emi_id", record["emi_id"], reference)
+                continue
+            try:
+                amount = Decimal(record["amount"]).quantize(_CENT)
+            except InvalidOperation:
+                report.reject(line_no, "PARSE_ERROR: invalid amount", str(emi_id), reference)
+                continue
+            if emi_id in seen:
+                report.reject(line_no, "DUPLICATE_LINE", str(emi_id), reference)
+                continue
+            seen.add(emi_id)
+
+            batch.append((line_no, emi_id, amount, reference))
+            if len(batch) >= batch_size:
+                await _apply_batch(db, batch, actor_id, report)
+                batch = []
+
+    if batch:
+        await _apply_batch(db, batch, actor_id, report)
+
+    logger.info(
+        "settlement.imported",
+        total_lines=report.total_lines,
+        matched=report.matched,
+        unmatched=len(report.unmatched),
+        loans_closed=report.loans_closed,
+    )
+    return report.as_dict()
+
+
+async def _apply_batch(
+    db: AsyncSession,
+    batch: list[tuple[int, UUID, Decimal, str]],
+    actor_id: UUID,
+    report: SettlementReport,
+) -> None:
+    first_rejection = len(report.unmatched)
+    try:
+        # Ordered locking keeps concurrent imports from deadlocking each other
+        result = await db.execute(
+            select(EMI.id, EMI.loan_id, EMI.amount, EMI.status)
+            .where(EMI.id.in_([emi_id for _, emi_id, _, _ in batch]))
+            .order_by(EMI.id)
+            .with_for_update()
+        )
+        emis = {row.id: row for row in result.all()}
+
+        matched = []
+        for line_no, emi_id, amount, reference in batch:
+            emi = emis.get(emi_id)
+            if emi is None:
+                report.reject(line_no, "UNKNOWN_EMI", str(emi_id), reference)
+            elif emi.status == EMIStatus.PAID:
+                report.reject(line_no, "ALREADY_PAID", str(emi_id), reference)
+            elif amount != Decimal(emi.amount).quantize(_CENT):
+                report.reject(line_no, f"AMOUNT_MISMATCH: expected {emi.amount}", str(emi_id), reference)
+            else:
+                matched.append((emi, amount))
+
+        if not matched:
+            return
+
+        await db.execute(
+            update(EMI)
+            .where(EMI.id.in_([emi.id for emi, _ in matched]))
+            .values(status=EMIStatus.PAID)
+        )
+        async with ledger_batch(db):
+            for emi, amount in matched:
+                await record_repayment(db, emi.loan_id, float(amount))
+        for emi, amount in matched:
+            await emit_event(db, LoanEventType.EMI_PAID, emi.loan_id, {"emi_id": emi.id, "amount": amount})
+        closed = await _close_paid_off_loans(db, list({emi.loan_id for emi, _ in matched}))
+        for emi, _ in matched:
+            await log_audit(db, actor_id=actor_id, action="EMI_PAID", entity_type="EMI", entity_id=str(emi.id))
+        await db.commit()
+    except Exception as exc:
+        await db.rollback()
+        logger.error("settlement.batch_failed", lines=len(batch), error=str(exc))
+        # Lines already rejected by matching keep their reason; only the rest failed with the batch
+        rejected = {entry["line"] for entry in report.unmatched[first_rejection:]}
+        for line_no, emi_id, _, reference in batch:
+            if line_no not in rejected:
+                report.reject(line_no, "BATCH_FAILED", str(emi_id), reference)
+        return
+
+    report.matched += len(matched)
+    report.amount_applied += sum((amount for _, amount in matched), Decimal(0))
+    report.loans_closed += len(closed)
+
+
+class ReturnFileReport(_FileReport):
+    def __init__(self) -> None:
+        super().__init__()
+        self.bounced = 0
+        self.loans_defaulted: list[str] = []
+        self.timings_ms: dict[str, float] = {}
+
+    def as_dict(self) -> dict:
+        return {
+            "total_lines": self.total_lines,
+            "bounced": self.bounced,
+            "unmatched_count": len(self.unmatched),
+            "loans_defaulted": self.loans_defaulted,
+            "timings_ms": self.timings_ms,
+            "unmatched": self.unmatched,
+        }
+
+
+async def import_return_file(
+    db: AsyncSession,
+    stream: BinaryIO,
+    fmt: FileFormat,
+    batch_size: int | None = None,
+) -> dict:
+    """Apply an ECS/NACH mandate return file and return its report."""
+    batch_size = batch_size or settings.SETTLEMENT_BATCH_SIZE
+    report = ReturnFileReport()
+    seen: set[UUID] = set()
+    batch: list[tuple[int, UUID, str]] = []
+
+    with stage_timer(report.timings_ms, "total"):
+        chunks = record_chunks(iter_records(text_lines(stream), fmt, RETURN_FIELDS), batch_size)
+        while True:
+            with stage_timer(report.timings_ms, "parse"):
+                chunk = await anext(chunks, None)
+            if chunk is None:
+                break
+            for line_no, record in chunk:
+                report.total_lines += 1
+                if isinstance(record, RecordError):
+                    report.reject(line_no, f"PARSE_ERROR: {record.reason}")
+                    continue
+                reference = record["reference"] or None
+                try:
+                    emi_id = UUID(record["emi_id"])
+                except ValueError:
+                    report.reject(line_no, "PARSE_ERROR: invalid emi_id", record["emi_id"], reference)
+                    continue
+                if emi_id in seen:
+                    report.reject(line_no, "DUPLICATE_LINE", str(emi_id), reference)
+                    continue
+                seen.add(emi_id)
+
+                batch.append((line_no, emi_id, reference))
+                if len(batch) >= batch_size:
+                    await _apply_return_batch(db, batch, report)
+                    batch = []
+
+        if batch:
+            await _apply_return_batch(db, batch, report)
+
+    logger.info(
+        "settlement.returns_imported",
+        total_lines=report.total_lines,
+        bounced=report.bounced,
+        unmatched=len(report.unmatched),
+        loans_defaulted=len(report.loans_defaulted),
+        timings_ms=report.timings_ms,
+    )
+    return report.as_dict()
+
+
+async def _apply_return_batch(
+    db: AsyncSession,
+    batch: list[tuple[int, UUID, str]],
+    report: ReturnFileReport,
+) -> None:
+    try:
+        result = await bounce_emis(db, [emi_id for _, emi_id, _ in batch], report.timings_ms)
+        with stage_timer(report.timings_ms, "commit"):
+            await db.commit()
+    except Exception as exc:
+        await db.rollback()
+        logger.error("settlement.return_batch_failed", lines=len(batch), error=str(exc))
+        for line_no, emi_id, reference in batch:
+            report.reject(line_no, "BATCH_FAILED", str(emi_id), reference)
+        return
+
+    lines = {emi_id: (line_no, reference) for line_no, emi_id, reference in batch}
+    for skipped in result["skipped"]:
+        line_no, reference = lines[UUID(skipped["emi_id"])]
+        report.reject(line_no, skipped["reason"], skipped["emi_id"], reference)
+    report.bounced += result["bounced"]
+    report.loans_defaulted.extend(result["loans_defaulted"])
@@ -0,0 +1,420 @@
+"""
+Task Service — durable background work queued in the `tasks` table.
+
+Services enqueue a task (kind + JSON payload) inside their own transaction
+instead of doing slow work inline; it becomes visible to workers on commit.
+
+Delivery:
+- Dequeue with FOR UPDATE SKIP LOCKED, so any number of worker processes and
+  coroutines poll the same table without handing one task to two of them
+- A claim leases the task until `locked_until` (visibility timeout), renewed
+  every third of the timeout while the handler runs; a worker that dies
+  mid-task leaves it to be reclaimed once the lease expires, or marked FAILED
+  if that claim was its last attempt
+- Failures retry with exponential backoff via `run_after` until `max_attempts`;
+  client errors (HTTP 4xx) fail immediately
+- `dedup_key` is unique among PENDING/RUNNING tasks, so re-enqueueing work that
+  is already queued is a no-op
+- Sensitive payload fields (e.g. sealed OTPs) are redacted once the task
+  finishes, and whenever a payload is listed
+
+Task kinds:
+  rescore_business   {"business_id"}    — recalculate one credit score
+  sync_invoices      {"business_id"}    — pull unpaid invoices from the Government API
+  send_whatsapp_otp  {"phone", "sealed_otp"} — deliver a login OTP (encrypted, see seal_otp)
+  run_job            {"job_id"}         — run a scheduled job now
+  reverify_businesses {"gst_numbers"}   — re-check GST / PAN status of listed businesses
+"""
+import asyncio
+import random
+import traceback
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Optional
+from uuid import UUID
+
+from cryptography.fernet import InvalidToken
+from fastapi import HTTPException, status
+from sqlalchemy import Integer, String, cast, event, func, literal, or_, select, text, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.logging_config import logger
+from app.models.task import Task, TaskStatus
+
+_ENQUEUED_KEY = "tasks_enqueued"
+_REDACTED = "***"
+# Must match the predicate of uq_tasks_dedup_key_live for ON CONFLICT to infer it
+_LIVE_DEDUP_PREDICATE = text("status IN ('PENDING', 'RUNNING')")
+
+
+# ── Handlers ─────────────────────────────────────────────────────────────────
+
+async def _rescore_business(db: AsyncSession, payload: dict) -> None:
+    from app.services.scoring_service import calculate_credit_score
+    await calculate_credit_score(db, UUID(payload["business_id"]))
+
+
+async def _sync_invoices(db: AsyncSession, payload: dict) -> None:
+    from app.models.business import BusinessProfile
+    from app.services.invoice_service import sync_borrower_invoices
+    profile = await db.get(BusinessProfile, UUID(payload["business_id"]))
+    if profile is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Business not found")
+    await sync_borrower_invoices(db, profile)
+
+
+async def _send_whatsapp_otp(db: AsyncSession, payload: dict) -> None:
+    from app.core.security import open_otp
+    from app.integrations.whatsapp_client import send_whatsapp_message
+    from app.services.auth_service import OTP_EXPIRY_MINUTES
+    try:
+        otp = open_otp(payload["sealed_otp"], max_age_seconds=OTP_EXPIRY_MINUTES * 60)
+    except InvalidToken:
+        raise ValueError("Sealed OTP is invalid or has expired")
+    if not await send_whatsapp_message(to_phone=payload["phone"], otp=otp):
+        raise RuntimeError("WhatsApp delivery failed")
+
+
+async def _run_job(db: AsyncSession, payload: dict) -> None:
+    from app.jobs.runner import run_job
+    await run_job(payload["job_id"])
+
+
+async def _reverify_businesses(db: AsyncSession, payload: dict) -> None:
+    from app.services.reverification_service import reverify_gstins
+    # Commits chunk by chunk in its own sessions, like the scheduled full pass
+    await reverify_gstins(payload["gst_numbers"])
+
+
+@dataclass(frozen=True)
+class TaskKind:
+    handler: Callable[[AsyncSession, dict], Awaitable[Any]]
+    max_attempts: int = settings.TASK_MAX_ATTEMPTS
+    redact: tuple[str, ...] = ()
+
+
+TASK_KINDS: dict[str, TaskKind] = {
+    "rescore_business": TaskKind(_rescore_business),
+    "sync_invoices": TaskKind(_sync_invoices),
+    # An OTP is only useful for a few minutes — retry quickly, then give up
+    "send_whatsapp_otp": TaskKind(_send_whatsapp_otp, max_attempts=3, redact=("otp", "sealed_otp")),
+    "run_job": TaskKind(_run_job, max_attempts=1),
+    "reverify_businesses": TaskKind(_reverify_businesses),
+}
+
+
+# ── Enqueue ──────────────────────────────────────────────────────────────────
+
+async def enqueue_task(
+    db: AsyncSession,
+    kind: str,
+    payload: Optional[dict] = None,
+    dedup_key: Optional[str] = None,
+    delay_seconds: float = 0,
+) -> Task:
+    """
+    Queue a task in the caller's transaction. With `dedup_key`, returns the
+    already-live task instead of queueing a duplicate.
+    """
+    spec = TASK_KINDS.get(kind)
+    if spec is None:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Unknown task kind: {kind}")
+
+    now = datetime.now(timezone.utc)
+    stmt = (
+        pg_insert(Task)
+        .values(
+            kind=kind,
+            payload=payload or {},
+            status=TaskStatus.PENDING,
+            dedup_key=dedup_key,
+            max_attempts=spec.max_attempts,
+            run_after=now + timedelta(seconds=delay_seconds),
+            created_at=now,
+        )
+        .on_conflict_do_nothing(index_elements=[Task.dedup_key], index_where=_LIVE_DEDUP_PREDICATE)
+        .returning(Task)
+    )
+    task = (await db.execute(stmt)).scalar_one_or_none()
+    if task is None:
+        result = await db.execute(
+            select(Task).where(
+                Task.dedup_key == dedup_key,
+                Task.status.in_([TaskStatus.PENDING, TaskStatus.RUNNING]),
+            )
+        )
+        existing = result.scalar_one_or_none()
+        logger.info("task.deduplicated", kind=kind, dedup_key=dedup_key)
+        if existing is not None:
+            return existing
+        # The live task finished between the INSERT and the SELECT
+        return await enqueue_task(db, kind, payload, dedup_key, delay_seconds)
+
+    db.info[_ENQUEUED_KEY] = True
+    logger.info("task.enqueued", task_id=str(task.id), kind=kind)
+    return task
+
+
+async def fan_out(db: AsyncSession, kind: str, ids_stmt, dedup_prefix: str) -> int:
+    """
+    Enqueue one task per row of `ids_stmt` (a SELECT of one labelled id column)
+    with a single INSERT ... SELECT. The payload is {label: id}; rows that already
+    have a live task are skipped. Returns the number of tasks queued.
+    """
+    spec = TASK_KINDS[kind]
+    source = ids_stmt.subquery()
+    column = list(source.c)[0]
+    stmt = (
+        pg_insert(Task)
+        .from_select(
+            ["id", "kind", "payload", "status", "dedup_key", "max_attempts"],
+            select(
+                func.gen_random_uuid(),
+                cast(literal(kind), String),
+                func.jsonb_build_object(cast(literal(column.name), String), column),
+                cast(literal(TaskStatus.PENDING.value), Task.__table__.c.status.type),
+                func.concat(cast(literal(f"{dedup_prefix}:"), String), column),
+                cast(literal(spec.max_attempts), Integer),
+            ),
+            # Python-side defaults would arrive as untyped parameters; let the server defaults apply
+            include_defaults=False,
+        )
+        .on_conflict_do_nothing(index_elements=[Task.dedup_key], index_where=_LIVE_DEDUP_PREDICATE)
+    )
+    result = await db.execute(stmt)
+    db.info[_ENQUEUED_KEY] = True
+    logger.info("task.fan_out", kind=kind, enqueued=result.rowcount)
+    return result.rowcount
+
+
+@event.listens_for(Session, "after_commit")
+def _wake_local_workers(session: Session) -> None:
+    """Let an in-process pool pick up freshly committed tasks without waiting for its poll."""
+    if session.info.pop(_ENQUEUED_KEY, False) and task_pool.running:
+        task_pool.wake()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_enqueued_flag(session: Session) -> None:
+    session.info.pop(_ENQUEUED_KEY, None)
+
+
+# ── Claim / execute ──────────────────────────────────────────────────────────
+
+async def claim_tasks(limit: int = 1) -> list[Task]:
+    """
+    Lease up to `limit` due tasks: PENDING with run_after <= now, or RUNNING with
+    an expired lease. Each claim counts as an attempt; an expired task with no
+    attempts left is marked FAILED instead of being run again.
+    """
+    now = datetime.now(timezone.utc)
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            select(Task)
+            .where(or_(
+                (Task.status == TaskStatus.PENDING) & (Task.run_after <= now),
+                (Task.status == TaskStatus.RUNNING) & (Task.locked_until < now),
+            ))
+            .order_by(Task.run_after)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        due = list(result.scalars().all())
+        if not due:
+            return []
+
+        exhausted = [t for t in due if t.status == TaskStatus.RUNNING and t.attempts >= t.max_attempts]
+        for task in exhausted:
+            task.status = TaskStatus.FAILED
+            task.payload = redacted_payload(task)
+            task.locked_until = None
+            task.finished_at = now
+            task.last_error = f"Lease expired on attempt {task.attempts} (worker lost)"
+            logger.error(
+                "task.failed", task_id=str(task.id), kind=task.kind, attempts=task.attempts, error=task.last_error,
+            )
+
+        ids = [t.id for t in due if t not in exhausted]
+        tasks = []
+        if ids:
+            result = await db.execute(
+                update(Task)
+                .where(Task.id.in_(ids))
+                .values(
+                    status=TaskStatus.RUNNING,
+                    attempts=Task.attempts + 1,
+                    started_at=now,
+                    locked_until=now + timedelta(seconds=settings.TASK_VISIBILITY_TIMEOUT_SECONDS),
+                )
+                .returning(Task)
+                .execution_options(synchronize_session=False)
+            )
+            tasks = list(result.scalars().all())
+        await db.commit()
+        return tasks
+
+
+async def _renew_lease(task: Task) -> None:
+    """Extend `task`'s lease until cancelled, so long handlers are not reclaimed mid-run."""
+    timeout = settings.TASK_VISIBILITY_TIMEOUT_SECONDS
+    while True:
+        await asyncio.sleep(timeout / 3)
+        try:
+            async with AsyncSessionLocal() as db:
+                result = await db.execute(
+                    update(Task)
+                    .where(Task.id == task.id, Task.attempts == task.attempts, Task.status == TaskStatus.RUNNING)
+                    .values(locked_until=datetime.now(timezone.utc) + timedelta(seconds=timeout))
+                    .execution_options(synchronize_session=False)
+                )
+                await db.commit()
+        except Exception as exc:
+            logger.warning("task.lease_renew_failed", task_id=str(task.id), kind=task.kind, error=str(exc))
+            continue
+        if result.rowcount == 0:
+            logger.error("task.lease_lost", task_id=str(task.id), kind=task.kind, attempts=task.attempts)
+            return
+
+
+def _retry_delay(attempts: int) -> float:
+    """Exponential backoff with full jitter, capped at TASK_RETRY_MAX_SECONDS."""
+    ceiling = min(settings.TASK_RETRY_MAX_SECONDS, settings.TASK_RETRY_BASE_SECONDS * 2 ** (attempts - 1))
+    return random.uniform(ceiling / 2, ceiling)
+
+
+def _is_permanent(exc: Exception) -> bool:
+    """Errors a retry cannot fix: client errors and malformed payloads."""
+    if isinstance(exc, HTTPException):
+        return exc.status_code < 500
+    return isinstance(exc, (KeyError, ValueError))
+
+
+def redacted_payload(task: Task) -> dict:
+    """`task.payload` with its kind's sensitive fields masked."""
+    spec = TASK_KINDS.get(task.kind)
+    if not spec or not spec.redact:
+        return task.payload
+    return {k: (_REDACTED if k in spec.redact else v) for k, v in task.payload.items()}
+
+
+async def _finish_task(task: Task, values: dict) -> None:
+    if values["status"] in (TaskStatus.DONE, TaskStatus.FAILED):
+        values["payload"] = redacted_payload(task)
+    async with AsyncSessionLocal() as db:
+        # Only the holder of the current lease may finish the task
+        await db.execute(
+            update(Task)
+            .where(Task.id == task.id, Task.attempts == task.attempts, Task.status == TaskStatus.RUNNING)
+            .values(locked_until=None, **values)
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+
+
+async def execute_task(task: Task) -> bool:
+    """Run a claimed task in its own transaction. Returns True on success."""
+    spec = TASK_KINDS.get(task.kind)
+    lease = asyncio.create_task(_renew_lease(task))
+    async with AsyncSessionLocal() as db:
+        try:
+            if spec is None:
+                raise ValueError(f"Unknown task kind: {task.kind}")
+            await spec.handler(db, task.payload)
+            await db.commit()
+        except Exception as exc:
+            await db.rollback()
+            error = "".join(traceback.format_exception_only(type(exc), exc)).strip()
+            if task.attempts >= task.max_attempts or _is_permanent(exc):
+                await _finish_task(task, {
+                    "status": TaskStatus.FAILED,
+                    "finished_at": datetime.now(timezone.utc),
+                    "last_error": error,
+                })
+                logger.error("task.failed", task_id=str(task.id), kind=task.kind, attempts=task.attempts, error=error)
+            else:
+                delay = _retry_delay(task.attempts)
+                await _finish_task(task, {
+                    "status": TaskStatus.PENDING,
+                    "run_after": datetime.now(timezone.utc) + timedelta(seconds=delay),
+                    "last_error": error,
+                })
+                logger.warning(
+                    "task.retry_scheduled", task_id=str(task.id), kind=task.kind,
+                    attempts=task.attempts, delay_seconds=round(delay, 1), error=error,
+                )
+            return False
+        finally:
+            lease.cancel()
+
+    await _finish_task(task, {"status": TaskStatus.DONE, "finished_at": datetime.now(timezone.utc)})
+    logger.info("task.done", task_id=str(task.id), kind=task.kind, attempts=task.attempts)
+    return True
+
+
+# ── Worker pool ──────────────────────────────────────────────────────────────
+
+class TaskWorkerPool:
+    """`concurrency` coroutines draining the queue; idle ones sleep until woken or polled."""
+
+    def __init__(self, concurrency: int, poll_interval: float) -> None:
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self._wakeup = asyncio.Event()
+        self._workers: list[asyncio.Task] = []
+
+    @property
+    def running(self) -> bool:
+        return any(not w.done() for w in self._workers)
+
+    def wake(self) -> None:
+        self._wakeup.set()
+
+    def start(self) -> None:
+        if not self.running:
+            self._workers = [asyncio.create_task(self._run(i)) for i in range(self.concurrency)]
+            logger.info("tasks.pool_started", concurrency=self.concurrency)
+
+    async def stop(self) -> None:
+        """Cancel the workers; a task cut off mid-run is retried once its lease expires."""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    async def _run(self, index: int) -> None:
+        while True:
+            try:
+                tasks = await claim_tasks(1)
+            except Exception as exc:
+                logger.error("tasks.claim_failed", worker=index, error=str(exc))
+                tasks = []
+            if tasks:
+                await execute_task(tasks[0])
+                continue
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+
+task_pool = TaskWorkerPool(
+    concurrency=settings.TASK_WORKER_CONCURRENCY,
+    poll_interval=settings.WORKER_POLL_SECONDS,
+)
+
+
+async def list_tasks(
+    db: AsyncSession,
+    task_status: Optional[TaskStatus] = None,
+    limit: int = 50,
+) -> list[Task]:
+    q = select(Task).order_by(Task.created_at.desc()).limit(limit)
+    if task_status:
+        q = q.where(Task.status == task_status)
+    result = await db.execute(q)
+    return result.scalars().all()
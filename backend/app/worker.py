@@ -0,0 +1,82 @@
+"""
+Background Worker — runs scheduled jobs and queued tasks outside the API.
+
+    python -m app.worker
+
+The worker builds its own engine with a real connection pool (the API uses
+NullPool) and rebinds the shared session factory to it, so every service and
+job imported here uses the worker's pool. It hosts the APScheduler jobs (still
+single-flight via job_runs leases) and a pool of TASK_WORKER_CONCURRENCY task
+workers draining the `tasks` table, and publishes outbox events to their
+subscribers. Scale task throughput by running more worker processes.
+
+Run the API with SCHEDULER_ENABLED=false once a worker is deployed so heavy
+jobs no longer share the request event loop.
+"""
+import asyncio
+import signal
+
+from app import database
+from app.config import settings
+from app.core.audit import audit_writer
+from app.core.outbox import outbox_publisher
+from app.integrations import government_client
+from app.integrations.government_client import token_manager as gov_token_manager
+from app.logging_config import logger, setup_logging
+from app.jobs.scheduler import scheduler, setup_scheduler
+from app.services.task_service import task_pool
+import app.services.event_subscribers  # noqa: F401
+
+# Register every model with Base.metadata before the first query
+import app.models  # noqa: F401
+
+
+def _bind_worker_engine() -> None:
+    engine = database.make_engine(
+        pool_size=settings.WORKER_DB_POOL_SIZE,
+        max_overflow=settings.WORKER_DB_MAX_OVERFLOW,
+        pool_pre_ping=True,
+    )
+    database.engine = engine
+    database.AsyncSessionLocal.configure(bind=engine)
+
+
+async def main() -> None:
+    setup_logging()
+    _bind_worker_engine()
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    setup_scheduler(None)
+    scheduler.start()
+    if settings.AUDIT_WRITE_BEHIND_ENABLED:
+        audit_writer.start()
+    task_pool.start()
+    outbox_publisher.start()
+    if settings.GOV_API_TOKEN_REFRESH_IN_BACKGROUND:
+        gov_token_manager.start()
+    logger.info(
+        "worker.started",
+        job_count=len(scheduler.get_jobs()),
+        pool_size=settings.WORKER_DB_POOL_SIZE,
+        task_concurrency=task_pool.concurrency,
+    )
+
+    try:
+        await stop.wait()
+    finally:
+        scheduler.shutdown(wait=False)
+        await task_pool.stop()
+        await outbox_publisher.stop()
+        await gov_token_manager.stop()
+        await government_client.aclose()
+        await audit_writer.stop()
+        await database.engine.dispose()
+        logger.info("worker.stopped")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
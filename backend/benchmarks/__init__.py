@@ -0,0 +1,13 @@
+"""
+Benchmark harness — seeded Postgres, fake external APIs, load driver.
+
+    python -m benchmarks.seed --reset               # dedicated *bench* database
+    python -m benchmarks.fake_apis --port 9100      # Government + WhatsApp stand-in
+    python -m benchmarks.gov_sandbox --port 9200    # Government stand-in with latency and faults
+    GOV_API_BASE_URL=http://127.0.0.1:9100 \
+    WHATSAPP_API_URL=http://127.0.0.1:9100/whatsapp/send/template \
+        uvicorn main:app --port 8000
+    python -m benchmarks.run --baseline baseline.json
+    python -m benchmarks.memory                     # memory per request, entity vs lean reads
+    python -m benchmarks.serialization              # list response serialization, no database
+"""
@@ -0,0 +1,64 @@
+"""
+Shared seed layout for the benchmark seeder and load driver.
+
+Every seeded row has a deterministic id, `md5('<kind>-<n>')::uuid` in SQL and
+`bench_id(kind, n)` here, so the driver can address rows without reading the
+database. Layout for a `SeedSize`:
+
+  users 1..businesses            borrowers with a business profile + credit score
+  users businesses+1..+kyc_users borrowers without a profile (KYC scenario)
+  invoices 1..loans              FINANCED, each with an ACCEPTED offer and ACTIVE loan
+  invoices loans+1..invoices     UNPAID (offer scenario)
+  emis                           TENURE per loan; installments 1-2 PAID, the rest PENDING
+
+Invoice n belongs to business ((n - 1) % businesses) + 1.
+"""
+import argparse
+import hashlib
+import math
+import uuid
+from dataclasses import dataclass
+
+TENURE = 5
+PAID_INSTALLMENTS = 2
+
+
+def bench_id(kind: str, n: int) -> uuid.UUID:
+    return uuid.UUID(hashlib.md5(f"bench-{kind}-{n}".encode()).hexdigest())
+
+
+def kyc_gst_number(n: int) -> str:
+    return f"BK{n:013d}"
+
+
+@dataclass(frozen=True)
+class SeedSize:
+    businesses: int = 100_000
+    invoices: int = 1_000_000
+    emis: int = 500_000
+    kyc_users: int = 5_000
+
+    @property
+    def loans(self) -> int:
+        return math.ceil(self.emis / TENURE)
+
+    def business_of_invoice(self, invoice: int) -> int:
+        return (invoice - 1) % self.businesses + 1
+
+    def validate(self) -> None:
+        if self.loans > self.invoices:
+            raise ValueError(f"{self.emis} EMIs need {self.loans} financed invoices; only {self.invoices} seeded")
+
+
+def add_size_arguments(parser: argparse.ArgumentParser) -> None:
+    defaults = SeedSize()
+    parser.add_argument("--businesses", type=int, default=defaults.businesses)
+    parser.add_argument("--invoices", type=int, default=defaults.invoices)
+    parser.add_argument("--emis", type=int, default=defaults.emis)
+    parser.add_argument("--kyc-users", type=int, default=defaults.kyc_users)
+
+
+def size_from_args(args: argparse.Namespace) -> SeedSize:
+    size = SeedSize(args.businesses, args.invoices, args.emis, args.kyc_users)
+    size.validate()
+    return size
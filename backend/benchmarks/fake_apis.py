@@ -0,0 +1,47 @@
+"""
+Local stand-in for the Government Sandbox and WhatsApp APIs.
+
+    python -m benchmarks.fake_apis --port 9100 [--latency-ms 20]
+
+Start the API under test with
+    GOV_API_BASE_URL=http://127.0.0.1:9100
+    WHATSAPP_API_URL=http://127.0.0.1:9100/whatsapp/send/template
+
+Government endpoints come from `benchmarks.gov_sandbox` with the fault-free
+"fast" profile and a fixed latency; use that module directly for latency
+distributions, injected errors and rate limits.
+"""
+import argparse
+import asyncio
+
+from fastapi import FastAPI
+
+from benchmarks.gov_sandbox import create_app as create_sandbox_app, load_config
+
+
+def create_app(latency_ms: float = 0.0) -> FastAPI:
+    config = load_config("fast", {"default": {"latency": {"dist": "fixed", "ms": latency_ms}}})
+    app = create_sandbox_app(config)
+    app.title = "Benchmark fake APIs"
+
+    @app.post("/whatsapp/send/template")
+    async def whatsapp_send():
+        await asyncio.sleep(latency_ms / 1000)
+        return {"status": "queued"}
+
+    return app
+
+
+def main() -> None:
+    import uvicorn
+
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.fake_apis")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9100)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Fixed delay added to every response")
+    args = parser.parse_args()
+    uvicorn.run(create_app(args.latency_ms), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
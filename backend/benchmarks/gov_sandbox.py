@@ -0,0 +1,382 @@
+"""
+Local Government Sandbox stand-in with latency and fault injection.
+
+    python -m benchmarks.gov_sandbox --port 9200 --profile realistic --seed 7
+    python -m benchmarks.gov_sandbox --config sandbox.json
+
+Implements the contracts `government_client` uses:
+
+  POST /auth/login, /auth/register
+  GET  /identity/aadhaar/{n}, /identity/pan/{n}
+  GET  /business/company/{gst}, .../unpaid-invoices, .../returns
+  POST /verification/full-check, /external/v1/credit-evaluate
+
+Every call passes through the same simulation, in order:
+
+1. auth        — non-auth endpoints need a bearer token from /auth/login that
+                 has not expired (`token_ttl_seconds`), else 401
+2. rate limit  — token bucket per client token (`rate_limit.rps`, `burst`),
+                 429 with Retry-After when empty
+3. faults      — `error_rate` → 500/502/503, `timeout_rate` → hang for
+                 `hang_ms` then 504 (exercises client timeouts)
+4. latency     — sampled from the endpoint's distribution:
+                 fixed | uniform | normal | lognormal | pareto
+
+Profiles (`fast`, `realistic`, `degraded`) set defaults; a JSON config file
+overrides any field, per endpoint under "endpoints". Endpoint names match the
+client's metric labels: auth, aadhaar, pan, gst, unpaid_invoices, returns,
+full_check, credit_evaluate. Random draws come from one RNG per endpoint
+seeded from `seed`, so a given request sequence reproduces the same latencies
+and faults. Response bodies are deterministic per identifier.
+
+  GET /_sandbox/stats    calls and outcomes per endpoint
+  GET /_sandbox/config   active configuration
+  PUT /_sandbox/config   replace it (same JSON shape); resets stats, RNGs and
+                         rate limits, issued tokens stay valid
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import math
+import random
+import secrets
+import time
+from dataclasses import asdict, dataclass, field, fields, is_dataclass
+from datetime import date, timedelta
+from typing import Any, Optional
+
+from fastapi import FastAPI, HTTPException, Request
+
+ENDPOINTS = (
+    "auth", "aadhaar", "pan", "gst", "unpaid_invoices", "returns", "full_check", "credit_evaluate",
+)
+
+
+@dataclass
+class Latency:
+    dist: str = "fixed"
+    # fixed/normal/lognormal: median; uniform: low end; pareto: minimum (scale)
+    ms: float = 0.0
+    # uniform: width; normal: stddev ms; lognormal: sigma; pareto: alpha (shape)
+    spread: float = 0.0
+    max_ms: float = 30_000.0
+
+    def sample(self, rng: random.Random) -> float:
+        if self.dist == "fixed":
+            value = self.ms
+        elif self.dist == "uniform":
+            value = self.ms + rng.random() * self.spread
+        elif self.dist == "normal":
+            value = rng.gauss(self.ms, self.spread)
+        elif self.dist == "lognormal":
+            value = rng.lognormvariate(math.log(max(self.ms, 1e-3)), self.spread)
+        elif self.dist == "pareto":
+            value = self.ms * rng.paretovariate(self.spread or 1.5)
+        else:
+            raise ValueError(f"Unknown latency distribution: {self.dist}")
+        return min(max(value, 0.0), self.max_ms) / 1000
+
+
+@dataclass
+class Faults:
+    error_rate: float = 0.0
+    timeout_rate: float = 0.0
+    hang_ms: float = 60_000.0
+
+
+@dataclass
+class EndpointProfile:
+    latency: Latency = field(default_factory=Latency)
+    faults: Faults = field(default_factory=Faults)
+
+
+@dataclass
+class RateLimit:
+    rps: float = 0.0  # 0 disables
+    burst: int = 1
+
+
+@dataclass
+class SandboxConfig:
+    seed: int = 0
+    default: EndpointProfile = field(default_factory=EndpointProfile)
+    endpoints: dict[str, EndpointProfile] = field(default_factory=dict)
+    rate_limit: RateLimit = field(default_factory=RateLimit)
+    token_ttl_seconds: int = 900
+    invoices_per_gst: int = 5
+    returns_per_gst: int = 12
+    # Extra bytes in company / invoice payloads, to model heavy responses
+    padding_bytes: int = 0
+
+    def profile(self, endpoint: str) -> EndpointProfile:
+        return self.endpoints.get(endpoint, self.default)
+
+
+def _build(cls, data: Any):
+    """Dataclass from a (possibly partial) dict, defaults for missing keys."""
+    if not is_dataclass(cls) or not isinstance(data, dict):
+        return data
+    kwargs = {}
+    for f in fields(cls):
+        if f.name not in data:
+            continue
+        value = data[f.name]
+        if f.name == "endpoints":
+            value = {name: _build(EndpointProfile, p) for name, p in value.items()}
+        elif isinstance(f.default_factory, type) and is_dataclass(f.default_factory):
+            value = _build(f.default_factory, value)
+        kwargs[f.name] = value
+    return cls(**kwargs)
+
+
+def _merge(base: dict, override: dict) -> dict:
+    merged = dict(base)
+    for key, value in override.items():
+        merged[key] = _merge(base[key], value) if isinstance(value, dict) and isinstance(base.get(key), dict) else value
+    return merged
+
+
+PROFILES: dict[str, dict] = {
+    "fast": {},
+    "realistic": {
+        "default": {"latency": {"dist": "lognormal", "ms": 120, "spread": 0.5},
+                    "faults": {"error_rate": 0.01, "timeout_rate": 0.002}},
+        "endpoints": {
+            "auth": {"latency": {"dist": "lognormal", "ms": 80, "spread": 0.3}},
+            "unpaid_invoices": {"latency": {"dist": "lognormal", "ms": 250, "spread": 0.6},
+                                "faults": {"error_rate": 0.01, "timeout_rate": 0.002}},
+            "credit_evaluate": {"latency": {"dist": "lognormal", "ms": 400, "spread": 0.7},
+                                "faults": {"error_rate": 0.02, "timeout_rate": 0.005}},
+        },
+        "rate_limit": {"rps": 50, "burst": 100},
+        "invoices_per_gst": 20,
+    },
+    "degraded": {
+        "default": {"latency": {"dist": "pareto", "ms": 150, "spread": 1.2},
+                    "faults": {"error_rate": 0.05, "timeout_rate": 0.02, "hang_ms": 30_000}},
+        "rate_limit": {"rps": 10, "burst": 20},
+        "invoices_per_gst": 20,
+        "padding_bytes": 20_000,
+    },
+}
+
+
+def load_config(profile: str = "fast", overrides: Optional[dict] = None, seed: Optional[int] = None) -> SandboxConfig:
+    data = _merge(PROFILES[profile], overrides or {})
+    if seed is not None:
+        data["seed"] = seed
+    return _build(SandboxConfig, data)
+
+
+class _TokenBucket:
+    def __init__(self, rps: float, burst: int) -> None:
+        self.rps = rps
+        self.capacity = max(burst, 1)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+
+    def take(self) -> float:
+        """0 if a token was taken, else seconds until one is available."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rps)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rps
+
+
+class Sandbox:
+    def __init__(self, config: SandboxConfig) -> None:
+        self.tokens: dict[str, float] = {}
+        self.configure(config)
+
+    def configure(self, config: SandboxConfig) -> None:
+        self.config = config
+        self.rngs = {name: random.Random(f"{config.seed}:{name}") for name in ENDPOINTS}
+        self.buckets: dict[str, _TokenBucket] = {}
+        self.stats: dict[str, dict[str, int]] = {name: {} for name in ENDPOINTS}
+
+    def _count(self, endpoint: str, outcome: str) -> None:
+        counts = self.stats[endpoint]
+        counts[outcome] = counts.get(outcome, 0) + 1
+
+    def issue_token(self) -> str:
+        token = secrets.token_hex(16)
+        self.tokens[token] = time.monotonic() + self.config.token_ttl_seconds
+        return token
+
+    async def simulate(self, request: Request, endpoint: str) -> None:
+        """Auth, rate limit, faults and latency for one call; raises the injected HTTP error."""
+        config = self.config
+        rng = self.rngs[endpoint]
+        client = "anonymous"
+
+        if endpoint != "auth":
+            header = request.headers.get("authorization", "")
+            client = header.removeprefix("Bearer ").strip()
+            expires = self.tokens.get(client)
+            if expires is None or expires < time.monotonic():
+                self._count(endpoint, "401")
+                raise HTTPException(status_code=401, detail="Invalid or expired token")
+
+        if config.rate_limit.rps > 0:
+            bucket = self.buckets.get(client)
+            if bucket is None:
+                bucket = self.buckets[client] = _TokenBucket(config.rate_limit.rps, config.rate_limit.burst)
+            wait = bucket.take()
+            if wait:
+                self._count(endpoint, "429")
+                raise HTTPException(
+                    status_code=429, detail="Rate limit exceeded",
+                    headers={"Retry-After": str(max(1, math.ceil(wait)))},
+                )
+
+        profile = config.profile(endpoint)
+        roll = rng.random()
+        delay = profile.latency.sample(rng)
+        if roll < profile.faults.timeout_rate:
+            self._count(endpoint, "hang")
+            await asyncio.sleep(profile.faults.hang_ms / 1000)
+            raise HTTPException(status_code=504, detail="Upstream timeout")
+        await asyncio.sleep(delay)
+        if roll < profile.faults.timeout_rate + profile.faults.error_rate:
+            status = rng.choice((500, 502, 503))
+            self._count(endpoint, str(status))
+            raise HTTPException(status_code=status, detail="Injected sandbox error")
+        self._count(endpoint, "200")
+
+    def padding(self) -> dict:
+        return {"filler": "x" * self.config.padding_bytes} if self.config.padding_bytes else {}
+
+
+def _h(value: str) -> int:
+    return int(hashlib.md5(value.encode()).hexdigest()[:8], 16)
+
+
+def create_app(config: SandboxConfig) -> FastAPI:
+    sandbox = Sandbox(config)
+    app = FastAPI(title="Government Sandbox stand-in")
+    app.state.sandbox = sandbox
+
+    @app.post("/auth/login")
+    async def login(request: Request):
+        await sandbox.simulate(request, "auth")
+        return {
+            "access_token": sandbox.issue_token(),
+            "token_type": "bearer",
+            "expires_in": sandbox.config.token_ttl_seconds,
+        }
+
+    @app.post("/auth/register", status_code=201)
+    async def register(request: Request):
+        await sandbox.simulate(request, "auth")
+        return {"status": "registered"}
+
+    @app.get("/identity/aadhaar/{aadhaar_number}")
+    async def aadhaar(aadhaar_number: str, request: Request):
+        await sandbox.simulate(request, "aadhaar")
+        return {
+            "aadhaar_number": aadhaar_number,
+            "name": f"Sandbox User {_h(aadhaar_number) % 100000}",
+            "status": "VERIFIED",
+        }
+
+    @app.get("/identity/pan/{pan_number}")
+    async def pan(pan_number: str, request: Request):
+        await sandbox.simulate(request, "pan")
+        return {"pan_number": pan_number, "status": "VALID", "category": "COMPANY"}
+
+    @app.get("/business/company/{gst_number}")
+    async def company(gst_number: str, request: Request):
+        await sandbox.simulate(request, "gst")
+        return {
+            "gst_number": gst_number,
+            "legal_name": f"Sandbox Traders {_h(gst_number) % 100000}",
+            "status": "ACTIVE",
+            "registration_date": "2018-04-01",
+            **sandbox.padding(),
+        }
+
+    @app.get("/business/company/{gst_number}/unpaid-invoices")
+    async def unpaid_invoices(gst_number: str, request: Request):
+        await sandbox.simulate(request, "unpaid_invoices")
+        seed = _h(gst_number)
+        today = date.today()
+        return {
+            "gst_number": gst_number,
+            "invoices": [
+                {
+                    "invoice_number": f"{gst_number}-{i}",
+                    "grand_total": 10000 + (seed * (i + 1)) % 490000,
+                    "due_date": (today + timedelta(days=15 + 15 * (i % 8))).isoformat(),
+                    "delay_days": (seed >> (i % 24)) % 30,
+                }
+                for i in range(sandbox.config.invoices_per_gst)
+            ],
+            **sandbox.padding(),
+        }
+
+    @app.get("/business/company/{gst_number}/returns")
+    async def returns(gst_number: str, request: Request):
+        await sandbox.simulate(request, "returns")
+        seed = _h(gst_number)
+        return {
+            "gst_number": gst_number,
+            "returns": [
+                {"period": f"{2025 - m // 12}-{m % 12 + 1:02d}", "status": "FILED" if (seed >> (m % 24)) % 5 else "PENDING"}
+                for m in range(sandbox.config.returns_per_gst)
+            ],
+        }
+
+    @app.post("/verification/full-check")
+    async def full_check(body: dict, request: Request):
+        await sandbox.simulate(request, "full_check")
+        return {"verified": True, "gst_number": body.get("gst_number")}
+
+    @app.post("/external/v1/credit-evaluate")
+    async def credit_evaluate(body: dict, request: Request):
+        await sandbox.simulate(request, "credit_evaluate")
+        return {"gst_number": body.get("gst_number"), "score": 450 + _h(str(body.get("gst_number"))) % 400}
+
+    @app.get("/_sandbox/stats")
+    async def stats():
+        return sandbox.stats
+
+    @app.get("/_sandbox/config")
+    async def get_config():
+        return asdict(sandbox.config)
+
+    @app.put("/_sandbox/config")
+    async def put_config(body: dict):
+        try:
+            sandbox.configure(_build(SandboxConfig, body))
+        except (TypeError, ValueError) as exc:
+            raise HTTPException(status_code=422, detail=str(exc))
+        return asdict(sandbox.config)
+
+    return app
+
+
+def main() -> None:
+    import uvicorn
+
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.gov_sandbox")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9200)
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="realistic")
+    parser.add_argument("--config", help="JSON file overriding profile fields")
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    overrides = {}
+    if args.config:
+        with open(args.config) as fh:
+            overrides = json.load(fh)
+    config = load_config(args.profile, overrides, args.seed)
+    uvicorn.run(create_app(config), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,209 @@
+"""
+Memory per request for the hot borrower reads, full ORM entities vs lean projections.
+
+    python -m benchmarks.memory --requests 200
+    python -m benchmarks.memory --reads invoices,loans --out memory.json
+
+Runs in-process against the seeded database (same DATABASE_URL as the API).
+Each read is measured two ways for the same random seeded borrowers:
+
+  entity  the previous read path: `select()` of whole entities, heavy JSON
+          columns included, fields hand-copied into the response
+  lean    the router as it is now: only the response's columns, rows mapped
+          straight to the schema
+
+Every call gets its own session, rolled back afterwards (listing invoices
+enqueues a sync task). The report gives tracemalloc's peak of Python
+allocations per call (mean and p95, KiB) and how many rows it returned.
+"""
+import argparse
+import asyncio
+import gc
+import json
+import random
+import tracemalloc
+from dataclasses import asdict, dataclass
+from types import SimpleNamespace
+from typing import Awaitable, Callable
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer
+
+from app import database
+from app.models.business import BusinessProfile
+from app.models.credit import Loan, Offer
+from app.models.invoice import Invoice
+from app.routers.businesses import get_my_business
+from app.routers.invoices import list_my_invoices
+from app.routers.loans import get_my_loans
+from app.schemas.schemas import BusinessProfileResponse, InvoiceResponse
+from benchmarks.common import add_size_arguments, bench_id, size_from_args
+
+import app.models  # noqa: F401
+
+Read = Callable[[AsyncSession, SimpleNamespace], Awaitable[object]]
+
+
+async def _entity_profile(db: AsyncSession, user_id) -> BusinessProfile:
+    return (await db.execute(
+        select(BusinessProfile)
+        .options(undefer(BusinessProfile.snapshot_manifest), undefer(BusinessProfile.verification_snapshot))
+        .where(BusinessProfile.user_id == user_id)
+    )).scalar_one()
+
+
+async def entity_business(db: AsyncSession, user: SimpleNamespace) -> BusinessProfileResponse:
+    profile = await _entity_profile(db, user.id)
+    return BusinessProfileResponse(
+        id=str(profile.id),
+        user_id=str(profile.user_id),
+        gst_number=profile.gst_number,
+        pan_number=profile.pan_number,
+        created_at=profile.created_at,
+    )
+
+
+async def entity_invoices(db: AsyncSession, user: SimpleNamespace) -> list[InvoiceResponse]:
+    profile = await _entity_profile(db, user.id)
+    invoices = (await db.execute(
+        select(Invoice).where(Invoice.business_id == profile.id).order_by(Invoice.created_at.desc())
+    )).scalars().all()
+    return [
+        InvoiceResponse(
+            id=str(inv.id),
+            business_id=str(inv.business_id),
+            invoice_number=inv.invoice_number,
+            amount=float(inv.amount),
+            due_date=inv.due_date,
+            delay_days=inv.delay_days,
+            status=inv.status,
+            created_at=inv.created_at,
+        )
+        for inv in invoices
+    ]
+
+
+async def entity_loans(db: AsyncSession, user: SimpleNamespace) -> dict:
+    profile = await _entity_profile(db, user.id)
+    loans = (await db.execute(
+        select(Loan)
+        .join(Offer, Offer.id == Loan.offer_id)
+        .join(Invoice, Invoice.id == Offer.invoice_id)
+        .where(Invoice.business_id == profile.id)
+        .order_by(Loan.created_at.desc())
+    )).scalars().all()
+    return {
+        "loans": [
+            {
+                "id": str(loan.id),
+                "offer_id": str(loan.offer_id),
+                "amount": float(loan.principal),
+                "status": loan.status,
+                "created_at": loan.created_at.isoformat(),
+            }
+            for loan in loans
+        ]
+    }
+
+
+READS: dict[str, dict[str, Read]] = {
+    "business": {
+        "entity": entity_business,
+        "lean": lambda db, user: get_my_business(current_user=user, db=db),
+    },
+    "invoices": {
+        "entity": entity_invoices,
+        "lean": lambda db, user: list_my_invoices(status_filter=None, current_user=user, db=db),
+    },
+    "loans": {
+        "entity": entity_loans,
+        "lean": lambda db, user: get_my_loans(current_user=user, db=db),
+    },
+}
+
+
+@dataclass
+class MemoryResult:
+    calls: int = 0
+    rows: int = 0
+    mean_kib: float = 0.0
+    p95_kib: float = 0.0
+
+
+def _rows(result: object) -> int:
+    if isinstance(result, list):
+        return len(result)
+    if isinstance(result, dict):
+        return sum(len(v) for v in result.values() if isinstance(v, list))
+    return 1
+
+
+async def measure(read: Read, users: list[SimpleNamespace]) -> MemoryResult:
+    peaks, rows = [], 0
+    for user in users:
+        async with database.AsyncSessionLocal() as db:
+            gc.collect()
+            tracemalloc.reset_peak()
+            start, _ = tracemalloc.get_traced_memory()
+            result = await read(db, user)
+            _, peak = tracemalloc.get_traced_memory()
+            rows += _rows(result)
+            await db.rollback()
+        peaks.append(peak - start)
+    peaks.sort()
+    return MemoryResult(
+        calls=len(peaks),
+        rows=rows,
+        mean_kib=round(sum(peaks) / len(peaks) / 1024, 1),
+        p95_kib=round(peaks[min(len(peaks) - 1, int(len(peaks) * 0.95))] / 1024, 1),
+    )
+
+
+async def _main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.memory")
+    parser.add_argument("--reads", default=",".join(READS))
+    parser.add_argument("--requests", type=int, default=200, help="Calls per read and variant")
+    parser.add_argument("--seed", type=int, default=42, help="RNG seed for borrower selection")
+    parser.add_argument("--out", help="Write the JSON report here")
+    add_size_arguments(parser)
+    args = parser.parse_args()
+
+    size = size_from_args(args)
+    reads = [r.strip() for r in args.reads.split(",") if r.strip()]
+    unknown = set(reads) - set(READS)
+    if unknown:
+        parser.error(f"unknown reads: {', '.join(sorted(unknown))}")
+
+    rng = random.Random(args.seed)
+    # Borrowers 1..loans have a financed invoice, so every read returns rows
+    users = [
+        SimpleNamespace(id=bench_id("user", rng.randint(1, min(size.loans, size.businesses))))
+        for _ in range(args.requests)
+    ]
+
+    report: dict = {}
+    tracemalloc.start()
+    try:
+        for name in reads:
+            for variant, read in READS[name].items():
+                async with database.AsyncSessionLocal() as db:  # warm up statement caches
+                    await read(db, users[0])
+                    await db.rollback()
+                report.setdefault(name, {})[variant] = asdict(await measure(read, users))
+    finally:
+        tracemalloc.stop()
+        await database.engine.dispose()
+
+    print(f"{'read':<10}{'variant':<8}{'calls':>7}{'rows':>8}{'mean KiB':>10}{'p95 KiB':>10}")
+    for name, variants in report.items():
+        for variant, r in variants.items():
+            print(f"{name:<10}{variant:<8}{r['calls']:>7}{r['rows']:>8}{r['mean_kib']:>10.1f}{r['p95_kib']:>10.1f}")
+    if args.out:
+        with open(args.out, "w") as fh:
+            json.dump(report, fh, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(asyncio.run(_main()))
@@ -0,0 +1,345 @@
+"""
+Load driver for the credit lifecycle endpoints and scheduler jobs.
+
+    python -m benchmarks.run --base-url http://127.0.0.1:8000 --requests 2000 --concurrency 32
+    python -m benchmarks.run --scenarios dashboard,pay_emi --out report.json
+    python -m benchmarks.run --save-baseline baseline.json
+    python -m benchmarks.run --baseline baseline.json --tolerance 0.15
+
+Scenarios run in order, each to completion:
+
+  kyc        POST /kyc/onboard           fresh users, unique GST numbers
+  offers     POST /offers/generate       UNPAID seeded invoices
+  sanction   POST /loans/sanction        UNSECURED offers from the offers scenario
+  pay_emi    POST /repayments/emi/{id}/pay  PENDING seeded EMIs
+  dashboard  GET  /businesses/me/dashboard  random seeded borrowers
+  jobs       every registered job, run in this process through the job runner
+
+HTTP scenarios report throughput, p50/p95/p99 latency and DB statements per
+request (from the API's /metrics). Jobs report duration, rows processed and
+statements executed. The driver needs the same SECRET_KEY as the API (it mints
+JWTs for seeded users) and, for `jobs`, the same DATABASE_URL.
+
+Scenarios consume seeded rows (invoices get offers, EMIs get paid): reseed with
+`python -m benchmarks.seed --reset` before runs that are compared.
+"""
+import argparse
+import asyncio
+import json
+import math
+import random
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import timedelta
+from typing import Awaitable, Callable, Optional
+
+import httpx
+
+from app.core.security import create_access_token
+from benchmarks.common import (
+    PAID_INSTALLMENTS, TENURE, SeedSize, add_size_arguments, bench_id, kyc_gst_number, size_from_args,
+)
+
+HTTP_SCENARIOS = ("kyc", "offers", "sanction", "pay_emi", "dashboard")
+ALL_SCENARIOS = HTTP_SCENARIOS + ("jobs",)
+
+
+@dataclass
+class ScenarioResult:
+    requests: int = 0
+    errors: int = 0
+    seconds: float = 0.0
+    throughput_rps: float = 0.0
+    p50_ms: float = 0.0
+    p95_ms: float = 0.0
+    p99_ms: float = 0.0
+    mean_ms: float = 0.0
+    queries_per_request: Optional[float] = None
+    statuses: dict[str, int] = field(default_factory=dict)
+
+
+@dataclass
+class JobResult:
+    seconds: float
+    rows: Optional[int]
+    statements: int
+    status: str
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, math.ceil(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+def _token(user_id) -> str:
+    return create_access_token({"sub": str(user_id), "role": "BORROWER"}, expires_delta=timedelta(hours=12))
+
+
+def _auth(n: int) -> dict[str, str]:
+    return {"Authorization": f"Bearer {_token(bench_id('user', n))}"}
+
+
+async def _db_query_totals(client: httpx.AsyncClient) -> tuple[float, float]:
+    """Sum and count of the API's per-request DB statement histogram, across routes."""
+    resp = await client.get("/metrics")
+    resp.raise_for_status()
+    total = count = 0.0
+    for line in resp.text.splitlines():
+        if line.startswith("http_request_db_queries_sum"):
+            total += float(line.rsplit(" ", 1)[1])
+        elif line.startswith("http_request_db_queries_count"):
+            count += float(line.rsplit(" ", 1)[1])
+    return total, count
+
+
+class Driver:
+    def __init__(self, client: httpx.AsyncClient, size: SeedSize, concurrency: int, requests: int, seed: int) -> None:
+        self.client = client
+        self.size = size
+        self.concurrency = concurrency
+        self.requests = requests
+        self.rng = random.Random(seed)
+        # (borrower index, offer id) produced by `offers`, consumed by `sanction`
+        self.offers: list[tuple[int, str]] = []
+
+    # ── request builders: i → response ──────────────────────────────────────
+
+    async def kyc(self, i: int) -> httpx.Response:
+        n = i + 1
+        return await self.client.post(
+            "/kyc/onboard",
+            headers=_auth(self.size.businesses + n),
+            json={
+                "aadhaar_number": f"{900000000000 + n}",
+                "pan_number": f"BKP{n:07d}",
+                "gst_number": kyc_gst_number(n),
+            },
+        )
+
+    async def generate_offers(self, i: int) -> httpx.Response:
+        invoice = self.size.loans + 1 + i
+        borrower = self.size.business_of_invoice(invoice)
+        resp = await self.client.post(
+            "/offers/generate", headers=_auth(borrower), json={"invoice_id": str(bench_id("invoice", invoice))},
+        )
+        if resp.status_code == 200:
+            for offer in resp.json()["offers"]:
+                if offer["loan_type"] == "UNSECURED":
+                    self.offers.append((borrower, offer["offer_id"]))
+        return resp
+
+    async def sanction(self, i: int) -> httpx.Response:
+        borrower, offer_id = self.offers[i]
+        return await self.client.post("/loans/sanction", headers=_auth(borrower), json={"offer_id": offer_id})
+
+    async def pay_emi(self, i: int) -> httpx.Response:
+        pending_per_loan = TENURE - PAID_INSTALLMENTS
+        loan = i // pending_per_loan + 1
+        installment = PAID_INSTALLMENTS + 1 + i % pending_per_loan
+        emi = (loan - 1) * TENURE + installment
+        return await self.client.post(
+            f"/repayments/emi/{bench_id('emi', emi)}/pay", headers=_auth(self.size.business_of_invoice(loan)),
+        )
+
+    async def dashboard(self, i: int) -> httpx.Response:
+        return await self.client.get(
+            "/businesses/me/dashboard", headers=_auth(self.rng.randint(1, self.size.businesses)),
+        )
+
+    def capacity(self, name: str) -> int:
+        """How many requests a scenario can send before it runs out of seeded rows."""
+        pending_emis = (self.size.emis // TENURE) * (TENURE - PAID_INSTALLMENTS)
+        return {
+            "kyc": self.size.kyc_users,
+            "offers": self.size.invoices - self.size.loans,
+            "sanction": len(self.offers),
+            "pay_emi": pending_emis,
+            "dashboard": self.requests,
+        }[name]
+
+    # ── execution ───────────────────────────────────────────────────────────
+
+    async def run_http(self, name: str) -> ScenarioResult:
+        send: Callable[[int], Awaitable[httpx.Response]] = {
+            "kyc": self.kyc,
+            "offers": self.generate_offers,
+            "sanction": self.sanction,
+            "pay_emi": self.pay_emi,
+            "dashboard": self.dashboard,
+        }[name]
+        total = min(self.requests, self.capacity(name))
+        result = ScenarioResult()
+        latencies: list[float] = []
+        statuses: dict[str, int] = {}
+        next_index = 0
+
+        async def worker() -> None:
+            nonlocal next_index
+            while next_index < total:
+                i, next_index = next_index, next_index + 1
+                start = time.perf_counter()
+                try:
+                    resp = await send(i)
+                    key = str(resp.status_code)
+                    ok = resp.status_code < 400
+                except httpx.HTTPError as exc:
+                    key, ok = type(exc).__name__, False
+                latencies.append(time.perf_counter() - start)
+                statuses[key] = statuses.get(key, 0) + 1
+                if not ok:
+                    result.errors += 1
+
+        queries_before = await _db_query_totals(self.client)
+        wall = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(self.concurrency)))
+        result.seconds = time.perf_counter() - wall
+        queries_after = await _db_query_totals(self.client)
+
+        latencies.sort()
+        result.requests = len(latencies)
+        result.statuses = statuses
+        if latencies:
+            result.throughput_rps = round(result.requests / result.seconds, 2)
+            result.p50_ms = round(percentile(latencies, 50) * 1000, 2)
+            result.p95_ms = round(percentile(latencies, 95) * 1000, 2)
+            result.p99_ms = round(percentile(latencies, 99) * 1000, 2)
+            result.mean_ms = round(sum(latencies) / len(latencies) * 1000, 2)
+        handled = queries_after[1] - queries_before[1]
+        if handled:
+            # The first /metrics scrape is counted in the second one; it issues no statements
+            result.queries_per_request = round((queries_after[0] - queries_before[0]) / max(handled - 1, 1), 2)
+        result.seconds = round(result.seconds, 3)
+        return result
+
+
+async def run_jobs() -> dict[str, JobResult]:
+    from app import database
+    from app.core.metrics import db_query_latency
+    from app.jobs.runner import job_registry, run_job
+    import app.models  # noqa: F401
+
+    results = {}
+    try:
+        for job_id in job_registry():
+            statements = db_query_latency.total_count()
+            start = time.perf_counter()
+            try:
+                run = await run_job(job_id)
+                status = "SKIPPED" if run is None else "SUCCEEDED"
+                rows = run.rows_processed if run else None
+            except Exception:
+                status, rows = "FAILED", None
+            results[job_id] = JobResult(
+                seconds=round(time.perf_counter() - start, 3),
+                rows=rows,
+                statements=db_query_latency.total_count() - statements,
+                status=status,
+            )
+    finally:
+        await database.engine.dispose()
+    return results
+
+
+# ── reporting / baseline ────────────────────────────────────────────────────
+
+def print_report(report: dict) -> None:
+    print(f"{'scenario':<12}{'reqs':>7}{'errs':>6}{'rps':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'q/req':>8}")
+    for name, r in report["scenarios"].items():
+        qpr = "-" if r["queries_per_request"] is None else f"{r['queries_per_request']:.1f}"
+        print(
+            f"{name:<12}{r['requests']:>7}{r['errors']:>6}{r['throughput_rps']:>9.1f}"
+            f"{r['p50_ms']:>9.1f}{r['p95_ms']:>9.1f}{r['p99_ms']:>9.1f}{qpr:>8}"
+        )
+    if report["jobs"]:
+        print(f"\n{'job':<20}{'status':>11}{'seconds':>10}{'rows':>10}{'stmts':>8}")
+        for job_id, j in report["jobs"].items():
+            rows = "-" if j["rows"] is None else j["rows"]
+            print(f"{job_id:<20}{j['status']:>11}{j['seconds']:>10.2f}{rows:>10}{j['statements']:>8}")
+
+
+def compare(report: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Regressions of `report` against `baseline`: latency, throughput, statements."""
+    problems = []
+    for name, cur in report["scenarios"].items():
+        base = baseline.get("scenarios", {}).get(name)
+        if not base:
+            continue
+        if base["p95_ms"] and cur["p95_ms"] > base["p95_ms"] * (1 + tolerance):
+            problems.append(f"{name}: p95 {cur['p95_ms']}ms > baseline {base['p95_ms']}ms")
+        if base["throughput_rps"] and cur["throughput_rps"] < base["throughput_rps"] * (1 - tolerance):
+            problems.append(f"{name}: throughput {cur['throughput_rps']} rps < baseline {base['throughput_rps']} rps")
+        if base["queries_per_request"] is not None and cur["queries_per_request"] is not None \
+                and cur["queries_per_request"] > base["queries_per_request"] + 0.5:
+            problems.append(
+                f"{name}: {cur['queries_per_request']} statements/request > baseline {base['queries_per_request']}"
+            )
+    for job_id, cur in report["jobs"].items():
+        base = baseline.get("jobs", {}).get(job_id)
+        if not base or base["status"] != "SUCCEEDED" or cur["status"] != "SUCCEEDED":
+            continue
+        if base["seconds"] and cur["seconds"] > base["seconds"] * (1 + tolerance):
+            problems.append(f"job {job_id}: {cur['seconds']}s > baseline {base['seconds']}s")
+        if cur["statements"] > base["statements"]:
+            problems.append(f"job {job_id}: {cur['statements']} statements > baseline {base['statements']}")
+    return problems
+
+
+async def _main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.run")
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--scenarios", default=",".join(ALL_SCENARIOS))
+    parser.add_argument("--requests", type=int, default=1000, help="Requests per HTTP scenario")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--seed", type=int, default=42, help="RNG seed for borrower selection")
+    parser.add_argument("--out", help="Write the JSON report here")
+    parser.add_argument("--baseline", help="Compare against this report; exit 1 on regression")
+    parser.add_argument("--save-baseline", help="Write the report as a new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed latency/throughput drift (fraction)")
+    add_size_arguments(parser)
+    args = parser.parse_args()
+
+    size = size_from_args(args)
+    scenarios = [s.strip() for s in args.scenarios.split(",") if s.strip()]
+    unknown = set(scenarios) - set(ALL_SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+
+    report: dict = {
+        "meta": {
+            "size": asdict(size),
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "started_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        },
+        "scenarios": {},
+        "jobs": {},
+    }
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=60.0, limits=limits) as client:
+        driver = Driver(client, size, args.concurrency, args.requests, args.seed)
+        for name in scenarios:
+            if name == "jobs":
+                continue
+            report["scenarios"][name] = asdict(await driver.run_http(name))
+    if "jobs" in scenarios:
+        report["jobs"] = {job_id: asdict(r) for job_id, r in (await run_jobs()).items()}
+
+    print_report(report)
+    for path in filter(None, (args.out, args.save_baseline)):
+        with open(path, "w") as fh:
+            json.dump(report, fh, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as fh:
+            problems = compare(report, json.load(fh), args.tolerance)
+        for problem in problems:
+            print(f"REGRESSION {problem}", file=sys.stderr)
+        return 1 if problems else 0
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(asyncio.run(_main()))
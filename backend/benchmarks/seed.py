@@ -0,0 +1,173 @@
+"""
+Seed a benchmark database with generate_series — no row-by-row inserts.
+
+    python -m benchmarks.seed                      # 100k businesses, 1M invoices, 500k EMIs
+    python -m benchmarks.seed --businesses 1000 --invoices 10000 --emis 5000
+    python -m benchmarks.seed --reset              # truncate every table first
+
+Point DATABASE_URL at a dedicated database. `--reset` truncates all tables and
+refuses to run unless the database name contains "bench" (override: --force).
+The layout is described in benchmarks/common.py.
+"""
+import argparse
+import asyncio
+import time
+from urllib.parse import urlparse
+
+from sqlalchemy import text
+
+from app import database
+from app.config import settings
+from app.database import Base
+from app.logging_config import logger, setup_logging
+from app.services.partition_service import ensure_all_partitions
+from benchmarks.common import PAID_INSTALLMENTS, TENURE, SeedSize, add_size_arguments, size_from_args
+
+import app.models  # noqa: F401
+
+# invoice amount for invoice :n — shared by invoices, loans and EMIs
+_AMOUNT = "(10000 + ({n} * 7919) % 490000)::numeric(15, 2)"
+
+STEPS: list[tuple[str, str]] = [
+    ("users", """
+        INSERT INTO users (id, phone, role, is_verified, is_active, created_at)
+        SELECT md5('bench-user-' || i)::uuid, 'B' || lpad(i::text, 12, '0'),
+               'BORROWER'::userrole, true, true, now()
+        FROM generate_series(1, :users) AS i
+        UNION ALL
+        SELECT md5('bench-officer-1')::uuid, 'BOFFICER', 'CREDIT_OFFICER'::userrole, true, true, now()
+    """),
+    ("business_profiles", """
+        INSERT INTO business_profiles
+            (id, user_id, gst_number, aadhaar_number, pan_number, verification_snapshot, created_at)
+        SELECT md5('bench-business-' || i)::uuid, md5('bench-user-' || i)::uuid,
+               'BG' || lpad(i::text, 13, '0'), lpad(i::text, 12, '0'), 'BP' || lpad(i::text, 8, '0'),
+               json_build_object(
+                   'aadhaar', json_build_object('aadhaar_number', lpad(i::text, 12, '0'), 'status', 'VERIFIED'),
+                   'pan', json_build_object('pan_number', 'BP' || lpad(i::text, 8, '0'), 'status', 'VERIFIED'),
+                   'gst', json_build_object(
+                       'gst_number', 'BG' || lpad(i::text, 13, '0'),
+                       'legal_name', 'Bench Traders ' || i,
+                       'filings', (SELECT json_agg(json_build_object('period', m, 'status', 'FILED'))
+                                   FROM generate_series(1, 12) AS m)
+                   ),
+                   'full_check', json_build_object('verified', true)
+               ),
+               now() - (i % 365) * interval '1 day'
+        FROM generate_series(1, :businesses) AS i
+    """),
+    ("credit_scores", """
+        INSERT INTO credit_scores (id, business_id, external_score, internal_score, final_score, risk_grade, created_at)
+        SELECT md5('bench-score-' || i)::uuid, md5('bench-business-' || i)::uuid, s.ext, s.int,
+               0.6 * s.ext + 0.4 * s.int,
+               CASE WHEN 0.6 * s.ext + 0.4 * s.int >= 650 THEN 'A'
+                    WHEN 0.6 * s.ext + 0.4 * s.int >= 500 THEN 'B'
+                    ELSE 'C' END::riskgrade,
+               now()
+        FROM generate_series(1, :businesses) AS i,
+             LATERAL (SELECT 450 + (i * 37) % 400 AS ext, 300 + (i * 53) % 500 AS int) AS s
+    """),
+    ("invoices", f"""
+        INSERT INTO invoices (id, business_id, invoice_number, amount, due_date, delay_days, status, created_at)
+        SELECT md5('bench-invoice-' || n)::uuid,
+               md5('bench-business-' || ((n - 1) % :businesses + 1))::uuid,
+               'BINV-' || n, {_AMOUNT.format(n="n")},
+               now() + ((n % 120) - 30) * interval '1 day', n % 45,
+               CASE WHEN n <= :loans THEN 'FINANCED' ELSE 'UNPAID' END::invoicestatus,
+               now() - (n % 90) * interval '1 day'
+        FROM generate_series(1, :invoices) AS n
+    """),
+    ("offers", """
+        INSERT INTO offers (id, invoice_id, loan_type, percentage, interest_rate, tenure_months, status, expires_at, created_at)
+        SELECT md5('bench-offer-' || n)::uuid, md5('bench-invoice-' || n)::uuid,
+               'UNSECURED'::loantype, 100.0, 20.0, CAST(:tenure AS integer), 'ACCEPTED'::offerstatus,
+               now() - interval '30 days', now() - interval '60 days'
+        FROM generate_series(1, :loans) AS n
+    """),
+    ("loans", f"""
+        INSERT INTO loans (id, offer_id, status, principal, disbursed_amount, created_at)
+        SELECT md5('bench-loan-' || n)::uuid, md5('bench-offer-' || n)::uuid, 'ACTIVE'::loanstatus,
+               {_AMOUNT.format(n="n")}, {_AMOUNT.format(n="n")}, now() - interval '60 days'
+        FROM generate_series(1, :loans) AS n
+    """),
+    ("emis", f"""
+        INSERT INTO emis (id, loan_id, installment_number, due_date, amount, principal_component,
+                          interest_component, outstanding_balance, status, retry_count)
+        SELECT md5('bench-emi-' || e)::uuid, md5('bench-loan-' || l)::uuid, k,
+               now() - interval '60 days' + k * interval '30 days',
+               round({_AMOUNT.format(n="l")} * 1.0833 / :tenure, 2),
+               round({_AMOUNT.format(n="l")} / :tenure, 2),
+               round({_AMOUNT.format(n="l")} * 0.0833 / :tenure, 2),
+               round({_AMOUNT.format(n="l")} * (:tenure - k) / :tenure, 2),
+               CASE WHEN k <= :paid THEN 'PAID' ELSE 'PENDING' END::emistatus, 0
+        FROM generate_series(1, :emis) AS e,
+             LATERAL (SELECT (e - 1) / :tenure + 1 AS l, (e - 1) % :tenure + 1 AS k) AS pos
+    """),
+]
+
+
+def _database_name() -> str:
+    return urlparse(settings.DATABASE_URL).path.lstrip("/")
+
+
+async def reset(force: bool) -> None:
+    name = _database_name()
+    if "bench" not in name and not force:
+        raise SystemExit(f"Refusing to truncate database {name!r}: name does not contain 'bench' (use --force)")
+    tables = ", ".join(t.name for t in Base.metadata.sorted_tables)
+    async with database.engine.begin() as conn:
+        await conn.execute(text(f"TRUNCATE {tables} CASCADE"))
+    logger.info("bench.seed.reset", database=name)
+
+
+async def seed(size: SeedSize) -> dict[str, float]:
+    params = {
+        "businesses": size.businesses,
+        "users": size.businesses + size.kyc_users,
+        "invoices": size.invoices,
+        "loans": size.loans,
+        "emis": size.emis,
+        "tenure": TENURE,
+        "paid": PAID_INSTALLMENTS,
+    }
+    timings: dict[str, float] = {}
+    async with database.engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await ensure_all_partitions(conn)
+
+    for name, sql in STEPS:
+        start = time.perf_counter()
+        async with database.engine.begin() as conn:
+            # Parameters the step doesn't reference are ignored by text()
+            result = await conn.execute(text(sql), params)
+        timings[name] = round(time.perf_counter() - start, 2)
+        logger.info("bench.seed.step", table=name, rows=result.rowcount, seconds=timings[name])
+
+    start = time.perf_counter()
+    async with database.engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await conn.execute(text("ANALYZE"))
+    timings["analyze"] = round(time.perf_counter() - start, 2)
+    return timings
+
+
+async def _main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.seed")
+    add_size_arguments(parser)
+    parser.add_argument("--reset", action="store_true", help="Truncate every table before seeding")
+    parser.add_argument("--force", action="store_true", help="Allow --reset on a database not named *bench*")
+    args = parser.parse_args()
+    size = size_from_args(args)
+
+    setup_logging()
+    try:
+        if args.reset:
+            await reset(args.force)
+        timings = await seed(size)
+    finally:
+        await database.engine.dispose()
+    logger.info("bench.seed.complete", size=str(size), seconds=timings)
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
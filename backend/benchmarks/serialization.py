@@ -0,0 +1,175 @@
+"""
+Serialization micro-benchmark for the invoice and EMI list responses.
+
+    python -m benchmarks.serialization
+    python -m benchmarks.serialization --rows 1000,50000 --repeat 7
+
+No database or server: synthetic rows shaped like the list endpoints' SQL rows
+(text ids, Decimal amounts, aware datetimes, enums) go through each path from
+route return value to response body bytes:
+
+  invoices  model    an InvoiceResponse per row, then FastAPI's response_model
+                     pass (validate + serialize) and JSONResponse
+            adapter  one TypeAdapter(list[InvoiceResponse]) validation and
+                     dump_json in pydantic-core
+            rows     `rows_json(rows)`, the endpoint's path
+  emis      dict     hand-built dicts, jsonable_encoder and JSONResponse
+            orjson   the same dicts rendered by ORJSONResponse
+            adapter  TypeAdapter(EMIListResponse) validation and dump_json
+            rows     `rows_json(rows, key="emis")`, the endpoint's path
+
+Reports the best of --repeat runs in milliseconds and the speedup over the
+first variant of each list.
+"""
+import argparse
+import asyncio
+import time
+from collections import namedtuple
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Callable
+
+from fastapi.responses import JSONResponse, ORJSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+from pydantic import TypeAdapter
+
+from app.core.responses import rows_json
+from app.models.credit import EMIStatus
+from app.models.invoice import InvoiceStatus
+from app.schemas.schemas import EMIListResponse, InvoiceResponse
+from benchmarks.common import bench_id
+
+InvoiceRow = namedtuple(
+    "InvoiceRow", "id business_id invoice_number amount due_date delay_days status created_at"
+)
+EMIRow = namedtuple(
+    "EMIRow",
+    "emi_id installment_number due_date amount principal_component interest_component "
+    "outstanding_balance status retry_count",
+)
+
+_NOW = datetime(2026, 10, 19, tzinfo=timezone.utc)
+
+
+def invoice_rows(n: int) -> list[InvoiceRow]:
+    business_id = str(bench_id("business", 1))
+    return [
+        InvoiceRow(
+            str(bench_id("invoice", i)), business_id, f"BINV-{i}", Decimal(10000 + i * 7919 % 490000) / 100,
+            _NOW + timedelta(days=i % 120), i % 45, InvoiceStatus.UNPAID, _NOW - timedelta(days=i % 90),
+        )
+        for i in range(1, n + 1)
+    ]
+
+
+def emi_rows(n: int) -> list[EMIRow]:
+    return [
+        EMIRow(
+            str(bench_id("emi", i)), i, _NOW + timedelta(days=30 * i), Decimal("2150.75"), Decimal("2000.00"),
+            Decimal("150.75"), Decimal(1_000_000 - i), EMIStatus.PENDING, 0,
+        )
+        for i in range(1, n + 1)
+    ]
+
+
+_INVOICE_FIELD = create_response_field("Response_list_my_invoices", list[InvoiceResponse], mode="serialization")
+
+
+async def invoices_model(rows: list[InvoiceRow]) -> bytes:
+    content = [
+        InvoiceResponse(
+            id=r.id, business_id=r.business_id, invoice_number=r.invoice_number, amount=float(r.amount),
+            due_date=r.due_date, delay_days=r.delay_days, status=r.status, created_at=r.created_at,
+        )
+        for r in rows
+    ]
+    return JSONResponse(await serialize_response(field=_INVOICE_FIELD, response_content=content)).body
+
+
+_INVOICE_ADAPTER = TypeAdapter(list[InvoiceResponse])
+
+
+async def invoices_adapter(rows: list[InvoiceRow]) -> bytes:
+    return _INVOICE_ADAPTER.dump_json(_INVOICE_ADAPTER.validate_python(rows, from_attributes=True))
+
+
+async def invoices_rows(rows: list[InvoiceRow]) -> bytes:
+    return rows_json(rows).body
+
+
+def _emi_dicts(rows: list[EMIRow]) -> dict:
+    return {
+        "emis": [
+            {
+                "emi_id": e.emi_id,
+                "installment_number": e.installment_number,
+                "due_date": e.due_date.isoformat(),
+                "amount": float(e.amount),
+                "principal_component": float(e.principal_component) if e.principal_component is not None else None,
+                "interest_component": float(e.interest_component) if e.interest_component is not None else None,
+                "outstanding_balance": float(e.outstanding_balance) if e.outstanding_balance is not None else None,
+                "status": e.status,
+                "retry_count": e.retry_count,
+            }
+            for e in rows
+        ]
+    }
+
+
+async def emis_dict(rows: list[EMIRow]) -> bytes:
+    return JSONResponse(await serialize_response(response_content=_emi_dicts(rows))).body
+
+
+async def emis_orjson(rows: list[EMIRow]) -> bytes:
+    return ORJSONResponse(await serialize_response(response_content=_emi_dicts(rows))).body
+
+
+_EMI_ADAPTER = TypeAdapter(EMIListResponse)
+
+
+async def emis_adapter(rows: list[EMIRow]) -> bytes:
+    return _EMI_ADAPTER.dump_json(_EMI_ADAPTER.validate_python({"emis": rows}, from_attributes=True))
+
+
+async def emis_rows(rows: list[EMIRow]) -> bytes:
+    return rows_json(rows, key="emis").body
+
+
+CASES: dict[str, tuple[Callable[[int], list], dict[str, Callable]]] = {
+    "invoices": (invoice_rows, {"model": invoices_model, "adapter": invoices_adapter, "rows": invoices_rows}),
+    "emis": (emi_rows, {"dict": emis_dict, "orjson": emis_orjson, "adapter": emis_adapter, "rows": emis_rows}),
+}
+
+
+async def best_ms(path: Callable, rows: list, repeat: int) -> float:
+    await path(rows)  # warm up adapters and validators
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await path(rows)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+async def _main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.serialization")
+    parser.add_argument("--rows", default="1000,10000", help="Comma-separated list sizes")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    sizes = [int(n) for n in args.rows.split(",") if n.strip()]
+
+    print(f"{'list':<10}{'rows':>8}  {'variant':<9}{'ms':>10}{'speedup':>9}")
+    for name, (make_rows, paths) in CASES.items():
+        for n in sizes:
+            rows = make_rows(n)
+            baseline = None
+            for variant, path in paths.items():
+                ms = await best_ms(path, rows, args.repeat)
+                baseline = baseline or ms
+                print(f"{name:<10}{n:>8}  {variant:<9}{ms:>10.2f}{baseline / ms:>8.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(asyncio.run(_main()))
@@ -8,12 +8,23 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse, PlainTextResponse
 
 from app.config import settings
+from app.core import metrics
+from app.core.audit import audit_writer
+from app.core.circuit_breaker import CircuitOpenError
+from app.core.deadline import DeadlineMiddleware
+from app.core.outbox import outbox_publisher
+from app.core.query_budget import QueryBudgetMiddleware
 from app.database import engine, Base
+from app.integrations import government_client
+from app.integrations.government_client import token_manager as gov_token_manager
 from app.logging_config import setup_logging, logger
 from app.jobs.scheduler import setup_scheduler, scheduler
+from app.services.partition_service import ensure_all_partitions
+from app.services.task_service import task_pool
+import app.services.event_subscribers  # noqa: F401
 
 # Import all models to ensure they register with Base.metadata
 import app.models  # noqa: F401
@@ -35,16 +46,44 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning("startup.db_unavailable", error=str(e))
         logger.warning("startup.db_note", msg="Server starting anyway — DB will connect on first request")
-
-    # Start APScheduler
-    setup_scheduler(app)
-    scheduler.start()
-    logger.info("startup.scheduler_started", job_count=4)
+    else:
+        # Own transaction, serialized across workers; the daily partitions job retries on failure
+        try:
+            async with engine.begin() as conn:
+                await ensure_all_partitions(conn)
+        except Exception as e:
+            logger.warning("startup.partitions_failed", error=str(e))
+
+    # Start APScheduler — off when a dedicated `python -m app.worker` process owns the jobs
+    if settings.SCHEDULER_ENABLED:
+        setup_scheduler(app)
+        scheduler.start()
+        logger.info("startup.scheduler_started", job_count=len(scheduler.get_jobs()))
+
+    if settings.AUDIT_WRITE_BEHIND_ENABLED:
+        audit_writer.start()
+
+    # Task workers in the API process — off when `python -m app.worker` is deployed
+    if settings.TASK_WORKER_IN_PROCESS:
+        task_pool.start()
+
+    # Outbox publisher — also off once the worker process delivers events
+    if settings.OUTBOX_PUBLISH_IN_PROCESS:
+        outbox_publisher.start()
+
+    if settings.GOV_API_TOKEN_REFRESH_IN_BACKGROUND:
+        gov_token_manager.start()
 
     yield
 
     # Graceful shutdown
-    scheduler.shutdown(wait=False)
+    if scheduler.running:
+        scheduler.shutdown(wait=False)
+    await task_pool.stop()
+    await outbox_publisher.stop()
+    await gov_token_manager.stop()
+    await government_client.aclose()
+    await audit_writer.stop()
     await engine.dispose()
     logger.info("shutdown.complete")
 
@@ -58,6 +97,7 @@ app = FastAPI(
     ),
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json",
@@ -71,6 +111,9 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(DeadlineMiddleware, seconds=settings.GOV_API_REQUEST_BUDGET_SECONDS)
+app.add_middleware(QueryBudgetMiddleware)
+app.add_middleware(metrics.MetricsMiddleware)
 
 
 # ── Global error handler ──────────────────────────────────────────────────────
@@ -83,6 +126,16 @@ async def global_exception_handler(request: Request, exc: Exception):
     )
 
 
+@app.exception_handler(CircuitOpenError)
+async def circuit_open_handler(request: Request, exc: CircuitOpenError):
+    logger.warning("circuit_breaker.rejected", path=str(request.url), circuit=exc.name)
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "Upstream service temporarily unavailable. Please try again later."},
+        headers={"Retry-After": str(max(1, round(exc.retry_in)))},
+    )
+
+
 # ── Routers ───────────────────────────────────────────────────────────────────
 app.include_router(auth.router)
 app.include_router(kyc.router)
@@ -107,6 +160,11 @@ async def health_check():
     }
 
 
+@app.get("/metrics", tags=["Meta"], include_in_schema=False)
+async def metrics_endpoint():
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
+
+
 @app.get("/", tags=["Meta"])
 async def root():
     return {
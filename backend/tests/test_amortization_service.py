@@ -0,0 +1,110 @@
+"""
+Amortization engine: EMI amount, reducing-balance schedule, calendar due dates.
+
+`_legacy_emi_amount` is the per-row formula loan_service used before schedules
+were built here; the flat EMI must not move by more than the rounding mode.
+"""
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from app.services.amortization_service import (
+    LoanTerms, add_months, build_schedule, build_schedules, emi_amount,
+)
+
+START = datetime(2026, 1, 31, 10, 30, tzinfo=timezone.utc)
+
+
+def _legacy_emi_amount(principal: float, annual_rate: float, months: int) -> float:
+    if annual_rate == 0:
+        return principal / months
+    r = annual_rate / (12 * 100)
+    emi = principal * r * (1 + r) ** months / ((1 + r) ** months - 1)
+    return round(emi, 2)
+
+
+@pytest.mark.parametrize("principal,rate,months", [
+    (100000, 12.0, 12),
+    (96000, 14.5, 3),
+    (250000.5, 9.75, 4),
+    (1_500_000, 18.0, 36),
+    (10000, 0, 3),
+])
+def test_emi_amount_matches_legacy_formula(principal, rate, months):
+    assert abs(float(emi_amount(principal, rate, months)) - _legacy_emi_amount(principal, rate, months)) <= 0.01
+
+
+def test_reducing_balance_schedule_totals():
+    schedule = build_schedule(100000, 12.0, 12, START)
+
+    assert [i.installment_number for i in schedule] == list(range(1, 13))
+    assert all(i.amount == Decimal("8884.88") for i in schedule[:-1])
+    assert schedule[0].interest_component == Decimal("1000.00")
+    assert sum(i.principal_component for i in schedule) == Decimal("100000.00")
+    assert sum(i.interest_component for i in schedule) == Decimal("6618.53")
+    assert sum(i.amount for i in schedule) == Decimal("106618.53")
+    for i in schedule:
+        assert i.amount == i.principal_component + i.interest_component
+    assert schedule[-1].outstanding_balance == Decimal("0.00")
+
+
+def test_final_installment_absorbs_rounding():
+    schedule = build_schedule(100000, 12.0, 12, START)
+    last = schedule[-1]
+
+    assert last.principal_component == schedule[-2].outstanding_balance == Decimal("8796.88")
+    assert last.amount == Decimal("8884.85")
+    assert abs(last.amount - schedule[0].amount) <= Decimal("0.12")
+
+
+def test_zero_rate_splits_principal_evenly():
+    schedule = build_schedule(10000, 0, 3, START)
+
+    assert [i.amount for i in schedule] == [Decimal("3333.33"), Decimal("3333.33"), Decimal("3333.34")]
+    assert all(i.interest_component == 0 for i in schedule)
+
+
+@pytest.mark.parametrize("months", [0, -3])
+def test_tenure_below_one_month_is_rejected(months):
+    with pytest.raises(ValueError, match="at least one month"):
+        build_schedule(100000, 12.0, months, START)
+    with pytest.raises(ValueError, match="at least one month"):
+        LoanTerms(uuid4(), 100000.0, 12.0, months, START)
+
+
+def test_due_dates_clamp_to_month_end():
+    dates = [i.due_date for i in build_schedule(100000, 12.0, 4, START)]
+
+    assert [d.date().isoformat() for d in dates] == ["2026-02-28", "2026-03-31", "2026-04-30", "2026-05-31"]
+    assert all(d.time() == START.time() and d.tzinfo == START.tzinfo for d in dates)
+    assert add_months(datetime(2028, 1, 31), 1) == datetime(2028, 2, 29)
+    assert add_months(datetime(2026, 11, 30), 3) == datetime(2027, 2, 28)
+    assert add_months(datetime(2026, 8, 15), 12) == datetime(2027, 8, 15)
+
+
+def test_due_dates_follow_calendar_not_thirty_day_steps():
+    start = datetime(2026, 3, 1, tzinfo=timezone.utc)
+    dates = [i.due_date for i in build_schedule(50000, 10.0, 12, start)]
+
+    assert dates[-1] == datetime(2027, 3, 1, tzinfo=timezone.utc)
+    assert dates[-1] != start + timedelta(days=30 * 12)
+
+
+def test_build_schedules_matches_single_loan_schedules():
+    loans = [
+        LoanTerms(uuid4(), 96000.0, 14.5, 3, START),
+        LoanTerms(uuid4(), 120000.0, 14.5, 3, START),
+        LoanTerms(uuid4(), 75000.0, 11.0, 4, START),
+    ]
+    rows = build_schedules(loans)
+
+    assert len(rows) == 10
+    for terms in loans:
+        expected = build_schedule(terms.principal, terms.annual_rate, terms.tenure_months, terms.start)
+        got = [row for row in rows if row["loan_id"] == terms.loan_id]
+        assert [(r["installment_number"], r["due_date"], r["amount"]) for r in got] == [
+            (i.installment_number, i.due_date, i.amount) for i in expected
+        ]
+        assert sum(r["principal_component"] for r in got) == Decimal(str(terms.principal)).quantize(Decimal("0.01"))
@@ -0,0 +1,45 @@
+"""
+Delinquency snapshots: a same-day rebuild replaces the day's rows.
+"""
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import select, update
+
+from app.models.credit import EMI, EMIStatus, Loan, LoanStatus
+from app.models.delinquency import DelinquencySnapshot, DPDBucket
+from app.services.delinquency_service import build_delinquency_snapshot
+
+pytestmark = pytest.mark.anyio
+
+
+async def _snapshot(db, as_of):
+    result = await db.execute(select(DelinquencySnapshot).where(DelinquencySnapshot.snapshot_date == as_of))
+    return {row.loan_id: row for row in result.scalars().all()}
+
+
+async def test_same_day_rebuild_updates_cured_and_drops_closed_loans(db, borrower):
+    as_of = datetime.now(timezone.utc).date()
+    loan_id = borrower.loan.id
+    # First installment 45 days overdue
+    await db.execute(
+        update(EMI).where(EMI.loan_id == loan_id, EMI.installment_number == 1)
+        .values(due_date=datetime.now(timezone.utc) - timedelta(days=45))
+    )
+    await build_delinquency_snapshot(db, as_of)
+    await db.commit()
+    assert (await _snapshot(db, as_of))[loan_id].bucket == DPDBucket.DPD_31_60
+
+    # Cured: the overdue EMI is paid, so the rebuild moves the loan back to CURRENT
+    await db.execute(update(EMI).where(EMI.loan_id == loan_id, EMI.installment_number == 1).values(status=EMIStatus.PAID))
+    await build_delinquency_snapshot(db, as_of)
+    await db.commit()
+    db.expire_all()
+    row = (await _snapshot(db, as_of))[loan_id]
+    assert (row.bucket, row.dpd, row.overdue_emis) == (DPDBucket.CURRENT, 0, 0)
+
+    # Closed: the loan leaves the day's snapshot
+    await db.execute(update(Loan).where(Loan.id == loan_id).values(status=LoanStatus.CLOSED))
+    await build_delinquency_snapshot(db, as_of)
+    await db.commit()
+    assert loan_id not in await _snapshot(db, as_of)
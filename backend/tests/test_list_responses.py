@@ -0,0 +1,65 @@
+"""
+List routes returning `rows_json` bypass FastAPI's response_model validation.
+
+Each body is validated here against the route's declared response_model, and
+every item must carry exactly the schema's fields, so a SELECT that drifts from
+its schema (renamed label, missing or extra column, wrong type) fails a test.
+"""
+import pytest
+from fastapi.routing import APIRoute
+from pydantic import BaseModel, TypeAdapter
+
+from main import app
+
+pytestmark = pytest.mark.anyio
+
+
+def _response_model(path: str):
+    route = next(r for r in app.routes if isinstance(r, APIRoute) and r.path == path and "GET" in r.methods)
+    return route.response_model
+
+
+def _items(model, body) -> list[tuple[type[BaseModel], dict]]:
+    """(item schema, item) pairs for a list body or a {key: [...]} wrapper model."""
+    if isinstance(body, list):
+        (item_model,) = model.__args__
+        return [(item_model, item) for item in body]
+    pairs = []
+    for name, field in model.model_fields.items():
+        (item_model,) = field.annotation.__args__
+        pairs.extend((item_model, item) for item in body[name])
+    return pairs
+
+
+async def _assert_matches_response_model(client, path: str, url: str, headers: dict) -> list:
+    response = await client.get(url, headers=headers)
+    assert response.status_code == 200, response.text
+    model, body = _response_model(path), response.json()
+
+    TypeAdapter(model).validate_python(body)
+    items = _items(model, body)
+    assert items, f"{url} returned no rows to check"
+    for item_model, item in items:
+        assert set(item) == set(item_model.model_fields), f"{url}: fields drifted from {item_model.__name__}"
+    return items
+
+
+async def test_my_invoices_match_response_model(client, borrower):
+    items = await _assert_matches_response_model(client, "/invoices/my", "/invoices/my", borrower.headers)
+    assert {item["id"] for _, item in items} == {str(i.id) for i in borrower.invoices}
+
+
+async def test_invoice_offers_match_response_model(client, borrower):
+    invoice_id = borrower.invoices[0].id
+    items = await _assert_matches_response_model(
+        client, "/offers/invoice/{invoice_id}", f"/offers/invoice/{invoice_id}", borrower.headers,
+    )
+    assert [item["offer_id"] for _, item in items] == [str(borrower.offer.id)]
+
+
+async def test_loan_emis_match_response_model(client, borrower):
+    loan_id = borrower.loan.id
+    items = await _assert_matches_response_model(
+        client, "/repayments/loan/{loan_id}/emis", f"/repayments/loan/{loan_id}/emis", borrower.headers,
+    )
+    assert len(items) == 3
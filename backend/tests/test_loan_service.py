@@ -0,0 +1,60 @@
+"""
+Batch sanction: each chunk is its own transaction.
+"""
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import func, select
+
+from app.models.credit import EMI, Loan, LoanType, Offer, OfferStatus
+from app.models.invoice import Invoice, InvoiceStatus
+from app.services.loan_service import BatchSanctionItem, sanction_loans_batch
+
+pytestmark = pytest.mark.anyio
+
+
+async def _generated_offers(db, business_id, count: int, loan_type=LoanType.UNSECURED) -> list[Offer]:
+    now = datetime.now(timezone.utc)
+    offers = []
+    for n in range(count):
+        invoice = Invoice(
+            business_id=business_id, invoice_number=f"BATCH-{loan_type}-{n}", amount=Decimal("50000.00"),
+            due_date=now + timedelta(days=90), status=InvoiceStatus.OFFER_GENERATED,
+        )
+        db.add(invoice)
+        await db.flush()
+        offer = Offer(
+            invoice_id=invoice.id, loan_type=loan_type, percentage=80.0, interest_rate=14.5,
+            tenure_months=3, status=OfferStatus.GENERATED, expires_at=now + timedelta(days=7),
+        )
+        db.add(offer)
+        offers.append(offer)
+    await db.commit()
+    return offers
+
+
+async def test_failed_chunk_reports_failed_and_keeps_earlier_chunks(db, borrower):
+    first = await _generated_offers(db, borrower.business.id, 2)
+    second = await _generated_offers(db, borrower.business.id, 2, LoanType.SECURED)
+    first_ids, second_ids = [o.id for o in first], [o.id for o in second]
+    items = [BatchSanctionItem(offer_id) for offer_id in first_ids] + [
+        BatchSanctionItem(second_ids[0], "Warehouse stock", 900000.0),
+        # Overflows collateral.asset_value NUMERIC(15, 2): the insert fails and the chunk rolls back
+        BatchSanctionItem(second_ids[1], "Plant and machinery", 1e15),
+    ]
+
+    outcomes = await sanction_loans_batch(db, items, borrower.user, chunk_size=2)
+
+    assert [o["status"] for o in outcomes] == ["DISBURSED", "DISBURSED", "FAILED", "FAILED"]
+    assert [o["offer_id"] for o in outcomes] == [str(i) for i in first_ids + second_ids]
+
+    loans = (await db.execute(select(Loan.offer_id).where(Loan.offer_id.in_(first_ids + second_ids)))).scalars().all()
+    assert sorted(loans) == sorted(first_ids)
+    emis = await db.scalar(
+        select(func.count()).select_from(EMI).join(Loan, Loan.id == EMI.loan_id).where(Loan.offer_id.in_(first_ids))
+    )
+    assert emis == 2 * 3
+    statuses = dict((await db.execute(select(Offer.id, Offer.status).where(Offer.id.in_(first_ids + second_ids)))).all())
+    assert [statuses[i] for i in first_ids] == [OfferStatus.ACCEPTED] * 2
+    assert [statuses[i] for i in second_ids] == [OfferStatus.GENERATED] * 2
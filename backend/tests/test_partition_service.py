@@ -0,0 +1,43 @@
+"""
+Partition maintenance when rows have already landed in the DEFAULT partition.
+"""
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import insert, select, text
+
+from app.config import settings
+from app.models.audit import AuditLog
+from app.services.partition_service import _add_months, ensure_monthly_partitions, partition_name
+
+pytestmark = pytest.mark.anyio
+
+
+async def _partition_of(db, entry_id) -> str:
+    return await db.scalar(text("SELECT tableoid::regclass::text FROM audit_logs WHERE id = :id"), {"id": entry_id})
+
+
+async def test_rows_in_default_are_moved_into_the_new_partition(db):
+    this_month = datetime.now(timezone.utc).date().replace(day=1)
+    late = _add_months(this_month, settings.PARTITION_MONTHS_AHEAD + 2)
+    early = _add_months(this_month, -40)
+    ids = {}
+    for month in (late, early):
+        ids[month] = uuid.uuid4()
+        await db.execute(insert(AuditLog), [{
+            "id": ids[month], "action": "TEST", "entity_type": "Test",
+            "timestamp": datetime(month.year, month.month, 15, tzinfo=timezone.utc),
+        }])
+    await db.commit()
+    assert await _partition_of(db, ids[late]) == "audit_logs_default"
+
+    created = await ensure_monthly_partitions(db, "audit_logs", months_ahead=settings.PARTITION_MONTHS_AHEAD + 2)
+    await db.commit()
+
+    assert {partition_name("audit_logs", late), partition_name("audit_logs", early)} <= set(created)
+    for month, entry_id in ids.items():
+        assert await _partition_of(db, entry_id) == partition_name("audit_logs", month)
+    assert await db.scalar(select(AuditLog.action).where(AuditLog.id == ids[late])) == "TEST"
+    # A second run finds nothing left to do
+    assert await ensure_monthly_partitions(db, "audit_logs", months_ahead=settings.PARTITION_MONTHS_AHEAD + 2) == []
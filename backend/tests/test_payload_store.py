@@ -0,0 +1,38 @@
+"""
+Payload blob garbage collection keeps every referenced blob.
+"""
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import select, update
+
+from app.core import payload_store
+from app.models.business import BusinessProfile
+from app.models.gov_cache import GovCache
+from app.models.payload_blob import PayloadBlob
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_collect_garbage_deletes_only_unreferenced_blobs(db, borrower):
+    cached, snapshot, orphan = await payload_store.put_many(db, [
+        {"gstin": borrower.business.gst_number, "status": "Active"},
+        {"pan": borrower.business.pan_number, "status": "VALID"},
+        {"gstin": borrower.business.gst_number, "status": "Suspended"},
+    ])
+    db.add(GovCache(
+        cache_key=f"gst:{borrower.business.gst_number}", payload_hash=cached,
+        expires_at=datetime.now(timezone.utc) + timedelta(hours=1),
+    ))
+    await db.execute(
+        update(BusinessProfile).where(BusinessProfile.id == borrower.business.id)
+        .values(snapshot_manifest={"pan": snapshot})
+    )
+    await db.commit()
+
+    assert await payload_store.collect_garbage(db) == 1
+    await db.commit()
+
+    remaining = set((await db.execute(select(PayloadBlob.hash))).scalars().all())
+    assert remaining == {cached, snapshot}
+    assert orphan not in remaining
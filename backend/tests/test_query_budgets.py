@@ -0,0 +1,36 @@
+"""
+Statement budgets for the borrower's hot reads.
+
+Each budget is the statements the endpoint needs today; a new lazy load or a
+per-row query fails the test instead of showing up later in production logs.
+"""
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_my_loans_budget(client, borrower, query_budget):
+    # current user, then one joined SELECT of the loans
+    with query_budget(max_queries=2) as tracker:
+        response = await client.get("/loans/user/my", headers=borrower.headers)
+    assert response.status_code == 200
+    assert [loan["id"] for loan in response.json()["loans"]] == [str(borrower.loan.id)]
+    assert tracker.count == 2
+
+
+async def test_my_invoices_budget(client, borrower, query_budget):
+    # current user, business id, sync_invoices enqueue, invoice list
+    with query_budget(max_queries=4) as tracker:
+        response = await client.get("/invoices/my", headers=borrower.headers)
+    assert response.status_code == 200
+    assert len(response.json()) == len(borrower.invoices)
+    assert tracker.count == 4
+
+
+async def test_loan_emis_budget(client, borrower, query_budget):
+    # current user, then the EMI schedule; no per-installment queries
+    with query_budget(max_queries=2, n_plus_one=2) as tracker:
+        response = await client.get(f"/repayments/loan/{borrower.loan.id}/emis", headers=borrower.headers)
+    assert response.status_code == 200
+    assert [e["installment_number"] for e in response.json()["emis"]] == [1, 2, 3]
+    assert tracker.count == 2
@@ -0,0 +1,124 @@
+"""
+Settlement imports: fixed-width parsing, the applied happy path (PAID EMIs and
+their ledger postings) and reporting when a batch fails.
+"""
+import io
+from decimal import Decimal
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from sqlalchemy import select
+
+from app.models.credit import EMI, EMIStatus
+from app.models.ledger import AccountType, EntryType, LedgerEntry
+from app.services.file_ingest import FileFormat, RecordError, iter_records
+from app.services.settlement_service import RETURN_FIELDS, SETTLEMENT_FIELDS, import_settlement_file
+
+pytestmark = pytest.mark.anyio
+
+
+class _FailingUpdateSession:
+    """Answers the EMI lock SELECT, then fails the first write of the batch."""
+
+    def __init__(self, emis):
+        self.emis = emis
+        self.rolled_back = False
+
+    async def execute(self, statement, *args, **kwargs):
+        if statement.is_select:
+            return SimpleNamespace(all=lambda: self.emis)
+        raise RuntimeError("connection reset")
+
+    async def rollback(self):
+        self.rolled_back = True
+
+
+def _fixed(emi_id, amount: str, reference: str, value_date: str = "2026-10-19") -> str:
+    return f"{emi_id}".ljust(36) + amount.rjust(15) + reference.ljust(30) + value_date
+
+
+def _csv(lines):
+    return io.BytesIO(("emi_id,amount,reference,value_date\n" + "\n".join(lines) + "\n").encode())
+
+
+async def test_failed_batch_keeps_matching_rejections():
+    loan_id = uuid4()
+    payable, mismatched, paid, unknown = uuid4(), uuid4(), uuid4(), uuid4()
+    db = _FailingUpdateSession([
+        SimpleNamespace(id=payable, loan_id=loan_id, amount=Decimal("1000.00"), status=EMIStatus.PENDING),
+        SimpleNamespace(id=mismatched, loan_id=loan_id, amount=Decimal("1000.00"), status=EMIStatus.PENDING),
+        SimpleNamespace(id=paid, loan_id=loan_id, amount=Decimal("1000.00"), status=EMIStatus.PAID),
+    ])
+    stream = _csv([
+        f"{payable},1000.00,R1,2026-10-19",
+        f"{mismatched},999.00,R2,2026-10-19",
+        f"{paid},1000.00,R3,2026-10-19",
+        f"{unknown},1000.00,R4,2026-10-19",
+        "not-a-uuid,1000.00,R5,2026-10-19",
+    ])
+
+    report = await import_settlement_file(db, stream, FileFormat.CSV, SimpleNamespace(id=uuid4()), batch_size=10)
+
+    assert db.rolled_back
+    reasons = {entry["line"]: entry["reason"].split(":")[0] for entry in report["unmatched"]}
+    assert reasons == {
+        2: "BATCH_FAILED",
+        3: "AMOUNT_MISMATCH",
+        4: "ALREADY_PAID",
+        5: "UNKNOWN_EMI",
+        6: "PARSE_ERROR",
+    }
+    assert report["unmatched_count"] == report["total_lines"] == 5
+    assert report["matched"] == 0
+
+
+def test_fixed_width_rejects_truncated_lines():
+    emi_id = uuid4()
+    full = _fixed(emi_id, "1000.00", "UTR0001")
+    lines = [full + "\n", full[:45] + "\n", "\n", _fixed(uuid4(), "250.50", "UTR0002") + "\n"]
+
+    records = list(iter_records(lines, FileFormat.FIXED, SETTLEMENT_FIELDS))
+
+    assert [line_no for line_no, _ in records] == [1, 2, 4]
+    assert records[0][1] == {"emi_id": str(emi_id), "amount": "1000.00", "reference": "UTR0001", "value_date": "2026-10-19"}
+    assert isinstance(records[1][1], RecordError)
+    assert records[1][1].reason == "Line is 45 chars; fixed-width layout needs 91"
+    assert records[2][1]["amount"] == "250.50"
+
+
+def test_fixed_width_return_line_needs_reference_column():
+    (_, record), = iter_records([f"{uuid4()}R01 "], FileFormat.FIXED, RETURN_FIELDS)
+
+    assert isinstance(record, RecordError)
+    assert record.reason == "Line is 40 chars; fixed-width layout needs 70"
+
+
+async def test_fixed_width_import_pays_emis_and_posts_ledger(db, borrower):
+    emis = (await db.execute(
+        select(EMI.id, EMI.amount).where(EMI.loan_id == borrower.loan.id).order_by(EMI.installment_number)
+    )).all()
+    stream = io.BytesIO("\n".join([
+        _fixed(emis[0].id, str(emis[0].amount), "UTR0001"),
+        _fixed(emis[1].id, str(emis[1].amount), "UTR0002")[:45],
+    ]).encode())
+
+    report = await import_settlement_file(db, stream, FileFormat.FIXED, borrower.user)
+
+    assert (report["total_lines"], report["matched"], report["loans_closed"]) == (2, 1, 0)
+    assert report["amount_applied"] == float(emis[0].amount)
+    assert [(u["line"], u["reason"].split(":")[0]) for u in report["unmatched"]] == [(2, "PARSE_ERROR")]
+
+    statuses = dict((await db.execute(select(EMI.id, EMI.status).where(EMI.loan_id == borrower.loan.id))).all())
+    assert statuses[emis[0].id] == EMIStatus.PAID
+    assert statuses[emis[1].id] == statuses[emis[2].id] == EMIStatus.PENDING
+
+    postings = (await db.execute(
+        select(LedgerEntry.entry_type, LedgerEntry.account_type, LedgerEntry.amount)
+        .where(LedgerEntry.loan_id == borrower.loan.id)
+    )).all()
+    assert sorted(postings) == sorted([
+        (EntryType.DEBIT, AccountType.BORROWER, emis[0].amount),
+        (EntryType.CREDIT, AccountType.BANK_CAPITAL, emis[0].amount),
+    ])